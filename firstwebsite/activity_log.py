@@ -0,0 +1,233 @@
+"""
+İşlem kaydı (ActivityLog) yazıcısı
+log_activity() çağrıları istek içinde User sorgusu + commit yapmak yerine
+süreç içi bir kuyruğa eklenir; arka plandaki yazıcı thread kayıtları adet
+(ACTIVITY_LOG_BATCH_SIZE) veya süre (ACTIVITY_LOG_FLUSH_INTERVAL) dolunca tek
+transaction'da toplu olarak yazar. Böylece istekler commit beklemez ve SQLite
+üzerindeki yazma kilidi çakışmaları azalır.
+
+    - Kaydın zamanı kuyruğa eklendiği an alınır (yazılma anı değil)
+    - Kullanıcılar batch başına tek sorguyla yüklenir; kullanıcısı olmayan
+      kayıtlar eskisi gibi atlanır
+    - Toplu yazma başarısız olursa kayıtlar tek tek denenir, yalnızca hatalı
+      olan atılır
+    - Kuyruk dolarsa kayıt istek içinde senkron yazılır
+
+ACTIVITY_LOG_MODE=sync (veya app.config['TESTING']) ile eski senkron davranış
+kullanılır: kayıt isteğin kendi session'ı ile hemen commit edilir.
+"""
+
+import os
+import time
+import queue
+import atexit
+import logging
+import threading
+from datetime import datetime, timezone, timedelta
+
+from flask import current_app
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from models import db, User, ActivityLog
+
+logger = logging.getLogger(__name__)
+
+BATCH_SIZE = int(os.getenv('ACTIVITY_LOG_BATCH_SIZE', 50))
+FLUSH_INTERVAL_SECONDS = float(os.getenv('ACTIVITY_LOG_FLUSH_INTERVAL', 2))
+MAX_QUEUE_SIZE = int(os.getenv('ACTIVITY_LOG_MAX_QUEUE', 10000))
+
+_STOP = object()
+
+
+def _format_description(description, user):
+    try:
+        return description.format(user_name=user.get_full_name())  # Kullanıcı adını formatla
+    except (KeyError, IndexError, ValueError):
+        # Açıklamada süslü parantez geçiyorsa (ör. arama metni) olduğu gibi yaz
+        return description
+
+
+def _build_activity(event, user):
+    return ActivityLog(
+        activity_type=event['activity_type'],
+        description=_format_description(event['description'], user),
+        timestamp=event['timestamp'],
+        user_id=event['user_id'],
+        related_case_id=event['case_id'],
+        related_announcement_id=event['related_announcement_id'],
+        related_event_id=event['related_event_id'],
+        related_payment_id=event['related_payment_id'],
+        details=event['details']
+    )
+
+
+class ActivityLogWriter:
+    """İşlem kayıtlarını kuyruktan toplu olarak yazan arka plan yazıcısı"""
+
+    def __init__(self, app=None, batch_size=BATCH_SIZE, flush_interval=FLUSH_INTERVAL_SECONDS,
+                 max_queue=MAX_QUEUE_SIZE):
+        self.app = None
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval
+        self._queue = queue.Queue(maxsize=max_queue)
+        self._lock = threading.Lock()
+        self._worker = None
+        self._pid = None
+        self._written = 0
+        self._dropped = 0
+        self._batches = 0
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        self.app = app
+        app.config.setdefault('ACTIVITY_LOG_MODE', os.getenv('ACTIVITY_LOG_MODE', 'async').lower())
+        atexit.register(self.close)
+
+    def is_synchronous(self):
+        config = current_app.config
+        return config.get('ACTIVITY_LOG_MODE') == 'sync' or config.get('TESTING', False)
+
+    def log(self, activity_type, description, user_id, case_id=None, related_announcement_id=None,
+            related_event_id=None, related_payment_id=None, details=None):
+        event = {
+            'activity_type': activity_type,
+            'description': description,
+            'user_id': user_id,
+            'case_id': case_id,
+            'related_announcement_id': related_announcement_id,
+            'related_event_id': related_event_id,
+            'related_payment_id': related_payment_id,
+            'details': details,
+            'timestamp': datetime.now(timezone(timedelta(hours=3))),
+        }
+        if self.is_synchronous():
+            self._write_now(event)
+            return
+        self._ensure_worker()
+        try:
+            self._queue.put_nowait(event)
+        except queue.Full:
+            logger.warning("İşlem kaydı kuyruğu dolu, kayıt senkron yazılıyor")
+            self._write_now(event)
+
+    def _write_now(self, event):
+        """Eski davranış: isteğin session'ı ile hemen yaz ve commit et"""
+        user = User.query.get(event['user_id'])
+        if user:
+            db.session.add(_build_activity(event, user))
+            db.session.commit()
+
+    def _ensure_worker(self):
+        # Fork edilen worker süreçlerinde (gunicorn) thread yeniden başlatılır
+        if self._worker is not None and self._worker.is_alive() and self._pid == os.getpid():
+            return
+        with self._lock:
+            if self._worker is not None and self._worker.is_alive() and self._pid == os.getpid():
+                return
+            if self._pid != os.getpid():
+                self._queue = queue.Queue(maxsize=self._queue.maxsize)
+            self._pid = os.getpid()
+            self._worker = threading.Thread(target=self._run, name='activity-log-writer', daemon=True)
+            self._worker.start()
+
+    def _run(self):
+        while True:
+            event = self._queue.get()
+            if event is _STOP:
+                return
+            batch = [event]
+            stopping = False
+            deadline = time.monotonic() + self.flush_interval
+            while len(batch) < self.batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    event = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if event is _STOP:
+                    stopping = True
+                    break
+                batch.append(event)
+            self._write_batch(batch)
+            if stopping:
+                self._drain()
+                return
+
+    def _drain(self):
+        batch = []
+        while True:
+            try:
+                event = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if event is not _STOP:
+                batch.append(event)
+        for start in range(0, len(batch), self.batch_size):
+            self._write_batch(batch[start:start + self.batch_size])
+
+    def _write_batch(self, batch):
+        try:
+            with self.app.app_context():
+                with Session(db.engine) as session:
+                    user_ids = {event['user_id'] for event in batch}
+                    users = {user.id: user for user in session.execute(
+                        select(User).where(User.id.in_(user_ids))
+                    ).scalars()}
+                    activities = [
+                        _build_activity(event, users[event['user_id']])
+                        for event in batch if event['user_id'] in users
+                    ]
+                    self._dropped += len(batch) - len(activities)
+                    if not activities:
+                        return
+                    try:
+                        session.add_all(activities)
+                        session.commit()
+                        self._written += len(activities)
+                    except Exception as e:
+                        session.rollback()
+                        logger.warning(f"İşlem kayıtları toplu yazılamadı, tek tek deneniyor: {e}")
+                        self._write_one_by_one(session, activities)
+                    self._batches += 1
+        except Exception as e:
+            self._dropped += len(batch)
+            logger.error(f"İşlem kayıtları yazılamadı ({len(batch)} kayıt): {e}")
+
+    def _write_one_by_one(self, session, activities):
+        # rollback sonrası bekleyen nesneler session'dan çıkarılır, yeniden eklenebilir
+        for activity in activities:
+            try:
+                session.add(activity)
+                session.commit()
+                self._written += 1
+            except Exception as e:
+                session.rollback()
+                self._dropped += 1
+                logger.error(f"İşlem kaydı atlandı ({activity.activity_type}): {e}")
+
+    def close(self, timeout=10):
+        """Kuyruktaki kayıtları yazar ve thread'i durdurur (süreç kapanırken çağrılır)"""
+        worker = self._worker
+        if worker is None or not worker.is_alive() or self._pid != os.getpid():
+            return
+        try:
+            self._queue.put(_STOP, timeout=timeout)
+        except queue.Full:
+            logger.error("İşlem kaydı kuyruğu kapanışta boşaltılamadı")
+            return
+        worker.join(timeout)
+
+    def stats(self):
+        return {
+            'queued': self._queue.qsize(),
+            'written': self._written,
+            'dropped': self._dropped,
+            'batches': self._batches,
+        }
+
+
+activity_writer = ActivityLogWriter()
@@ -6,7 +6,7 @@ import sys
 import os
 sys.path.insert(0, os.path.abspath(os.path.dirname(__file__)))
 
-from flask import Flask, render_template, request, url_for, flash, redirect, jsonify, session, send_from_directory, send_file, make_response, current_app, Response, abort
+from flask import Flask, render_template, request, url_for, flash, redirect, jsonify, session, send_from_directory, send_file, make_response, current_app, Response, abort, stream_with_context
 from flask_sqlalchemy import SQLAlchemy
 from flask_migrate import Migrate
 from datetime import datetime, timedelta, date, time, timezone
@@ -38,6 +38,17 @@ import uuid
 from PIL import Image
 from functools import wraps
 from yargi_integration import yargi_integration
+from dashboard_counters import register_counter_listeners, get_counters
+from activity_log import activity_writer
+from log_config import configure_logging, debug_dump
+from reference_data import get_courthouses, tarife_file
+from user_cache import user_cache, register_user_cache_listeners
+from document_conversion import document_converter, needs_conversion, libreoffice_profile_arg
+from libreoffice_pool import libreoffice_pool
+from file_storage import path_resolver, canonical_path
+from udf_preview import udf_preview_cache
+from blob_store import blob_store, is_blob, register_blob_listeners
+from calendar_feed import register_calendar_listeners, serialize_calendar_event, parse_range, month_range, get_calendar_version, get_calendar_state, get_events_in_range, get_changes_since
 from io import BytesIO
 from reportlab.lib import colors
 from reportlab.lib.pagesizes import A4
@@ -66,68 +77,23 @@ from flask_admin.contrib.sqla import ModelView
 from flask_admin.actions import action # Import action decorator
 from markupsafe import Markup # For rendering HTML in actions
 
-# Helper function to parse adliyelist.txt
-def parse_adliye_list(filepath='../adliyelist.txt'): # Adjusted path
-    cities_courthouses = {}
-    try:
-        # Ensure the path is correct relative to app.py location
-        script_dir = os.path.dirname(__file__) #<-- absolute dir the script is in
-        abs_file_path = os.path.join(script_dir, filepath)
-
-        with open(abs_file_path, 'r', encoding='utf-8') as f:
-            lines = f.readlines()
-            # Skip header and potential separator lines
-            data_lines = [line.strip() for line in lines if line.strip() and not line.startswith('İl\t') and not line.startswith('___')]
-            current_city = None
-            for line in data_lines:
-                parts = line.split('\t', 1)
-                if len(parts) == 2:
-                    city, courthouses_str = parts
-                    current_city = city.strip()
-                    # Process courthouses string: split by comma or bullet, handle ACM markers etc.
-                    # Keep the original names including ACM details
-                    courthouses = [ch.strip() for ch in re.split(r'\s*,\s*|\s*•\s*', courthouses_str) if ch.strip()]
-                    cities_courthouses[current_city] = courthouses
-                # Removed the elif part as it's unlikely based on file structure
-    except FileNotFoundError:
-        print(f"Error: {abs_file_path} not found.")
-        return {}, []
-    except Exception as e:
-        print(f"Error parsing {abs_file_path}: {e}")
-        return {}, []
+# adliyelist.txt bir kez ayrıştırılıp dosya değişene kadar önbellekten verilir (bkz. reference_data.py)
+def parse_adliye_list():
+    """(şehir -> adliyeler, sıralı şehirler) döndürür; dönen yapılar değiştirilemez"""
+    cities_courthouses, cities, _ = get_courthouses()
+    return cities_courthouses, cities
 
-    # İstanbul'u şehir listesine manuel olarak ekle (zaten varsa sorun değil)
-    if 'İstanbul' not in cities_courthouses:
-        # İstanbul adliyeleri bu listede olmayacak, çünkü bunlar hardcoded olarak frontend'de tanımlanmış
-        cities_courthouses['İstanbul'] = []  
-        
-    # Önce standart alfabetik sıralama
-    cities = sorted(cities_courthouses.keys())
-    
-    # Özel sıralama için listeyi yeniden düzenle
-    # İstanbul'u listeden çıkar ve en başa ekle
-    if 'İstanbul' in cities:
-        cities.remove('İstanbul')
-        cities.insert(0, 'İstanbul')
-    
-    # İzmir'i Isparta'dan sonra getir
-    if 'İzmir' in cities and 'Isparta' in cities:
-        izmir_index = cities.index('İzmir')
-        isparta_index = cities.index('Isparta')
-        
-        # İzmir'i çıkar
-        cities.remove('İzmir')
-        
-        # Isparta'dan sonraya ekle
-        cities.insert(isparta_index + 1, 'İzmir')
-    
-    # İstanbul'un listede olduğundan emin olalım
-    if 'İstanbul' in cities:
-        print("İstanbul şehir listesinde mevcut.")
+def reference_json_response(data, max_age=0):
+    """Önceden hesaplanmış referans JSON'unu ETag ile döndürür (değişmediyse 304)"""
+    response = make_response(data.json)
+    response.mimetype = 'application/json'
+    response.set_etag(data.etag)
+    response.cache_control.private = True
+    if max_age:
+        response.cache_control.max_age = max_age
     else:
-        print("UYARI: İstanbul şehir listesine eklenemedi!")
-        
-    return cities_courthouses, cities
+        response.cache_control.no_cache = True
+    return response.make_conditional(request)
 
 def permission_required(permission):
     def decorator(f):
@@ -200,6 +166,10 @@ def permission_required(permission):
     return decorator
 
 app = Flask(__name__, static_url_path='/static')
+
+# Loglar kuyruk üzerinden ayrı thread'de yazılır; seviyeler LOG_LEVEL / LOG_LEVELS ile (bkz. log_config.py)
+configure_logging(app)
+
 basedir = os.path.abspath(os.path.dirname(__file__))
 
 # Load configuration from config.py if it exists, otherwise use defaults
@@ -233,6 +203,15 @@ app.config['MAIL_DEBUG'] = os.getenv('DEBUG', 'False').lower() == 'true'
 
 db.init_app(app)
 migrate = Migrate(app, db)
+
+# Panel sayaçlarını model olaylarına bağla (bkz. dashboard_counters.py)
+register_counter_listeners()
+register_calendar_listeners()
+register_user_cache_listeners()
+register_blob_listeners()
+
+# İşlem kayıtları arka planda toplu yazılır (ACTIVITY_LOG_MODE=sync ile senkron)
+activity_writer.init_app(app)
 mail = Mail(app)
 csrf = CSRFProtect(app) # CSRF korumasını başlat
 
@@ -257,7 +236,8 @@ login_manager.login_message_category = 'info'
 
 @login_manager.user_loader
 def load_user(user_id):
-    return User.query.get(int(user_id))
+    # Kısa süreli süreç içi önbellek; User değişince geçersiz olur (bkz. user_cache.py)
+    return user_cache.load(int(user_id))
 
 # CORS ayarları Chrome Extension için
 @app.after_request
@@ -288,15 +268,16 @@ class MyAdminIndexView(AdminIndexView):
     
     @expose('/')
     def index(self):
+        counters = get_counters()
         stats = {
-            'total_users': User.query.count(),
-            'pending_users': User.query.filter_by(is_approved=False).count(),
-            'total_case_files': CaseFile.query.count(),
-            'active_case_files': CaseFile.query.filter_by(status='Aktif').count(),
-            'total_hearings': CalendarEvent.query.filter(CalendarEvent.event_type.in_(['durusma', 'e-durusma'])).count(),
-            'total_payments': Payment.query.count(),
-            'total_expenses': Expense.query.count(),
-            'total_documents': Document.query.count(),
+            'total_users': counters['kullanici_sayisi'],
+            'pending_users': counters['onaysiz_kullanici_sayisi'],
+            'total_case_files': counters['dosya_sayisi'],
+            'active_case_files': counters['aktif_dosya_sayisi'],
+            'total_hearings': counters['durusma_sayisi'],
+            'total_payments': counters['odeme_kaydi_sayisi'],
+            'total_expenses': counters['masraf_sayisi'],
+            'total_documents': counters['belge_sayisi'],
         }
         self._template_args['stats'] = stats
         self._template_args['admin_view'] = self
@@ -793,20 +774,18 @@ def inject_datetime():
     return dict(current_time=current_time)
 
 def log_activity(activity_type, description, user_id, case_id=None, related_announcement_id=None, related_event_id=None, related_payment_id=None, details=None):
-    user = User.query.get(user_id)
-    if user:
-        activity = ActivityLog(
-            activity_type=activity_type,
-            description=description.format(user_name=user.get_full_name()), # Kullanıcı adını formatla
-            user_id=user_id,
-            related_case_id=case_id,
-            related_announcement_id=related_announcement_id, # Yeni eklendi
-            related_event_id=related_event_id,           # Yeni eklendi
-            related_payment_id=related_payment_id,         # Yeni eklendi
-            details=details                              # Yeni eklendi
-        )
-        db.session.add(activity)
-        db.session.commit()
+    """İşlem kaydını yazma kuyruğuna ekler; kayıtlar arka planda toplu yazılır (bkz. activity_log.py).
+    Açıklamadaki {user_name} yazılırken kullanıcının tam adıyla doldurulur."""
+    activity_writer.log(
+        activity_type=activity_type,
+        description=description,
+        user_id=user_id,
+        case_id=case_id,
+        related_announcement_id=related_announcement_id,
+        related_event_id=related_event_id,
+        related_payment_id=related_payment_id,
+        details=details
+    )
 
 @app.route('/health')
 def health_check():
@@ -826,6 +805,127 @@ def health_check():
             'timestamp': datetime.now().isoformat()
         }), 503
 
+ACTIVITY_PAGE_SIZE = 5
+TURKEY_TZ = timezone(timedelta(hours=3))
+
+def format_activity_timestamp(timestamp, empty='Tarih yok'):
+    """Aktivite zamanını 'gg.aa.yyyy ss:dd' olarak biçimlendirir.
+    Timezone bilgisi olan kayıtlar zaten Türkiye saatidir; naive kayıtlar eski UTC kayıtlardır."""
+    if not timestamp:
+        return empty
+    try:
+        if timestamp.tzinfo is not None:
+            return timestamp.replace(tzinfo=None).strftime('%d.%m.%Y %H:%M')
+        return timestamp.replace(tzinfo=timezone.utc).astimezone(TURKEY_TZ).strftime('%d.%m.%Y %H:%M')
+    except Exception as e:
+        app.logger.error(f"Timestamp formatlamada hata: {str(e)} - {timestamp}")
+        return 'Format hatası'
+
+def encode_activity_cursor(activity):
+    """Sayfanın son aktivitesinden imleç üretir: '<timestamp>|<id>'"""
+    return f"{activity.timestamp.isoformat()}|{activity.id}"
+
+def decode_activity_cursor(cursor):
+    """İmleci (timestamp, id) olarak çözer; imleç yoksa None, bozuksa ValueError"""
+    if not cursor:
+        return None
+    timestamp, _, activity_id = cursor.rpartition('|')
+    return datetime.fromisoformat(timestamp), int(activity_id)
+
+def get_activity_page(cursor=None, limit=ACTIVITY_PAGE_SIZE):
+    """En yeni aktiviteleri (timestamp, id) sırasıyla imleçten sonra getirir.
+    Kullanıcılar aynı sorguda JOIN ile yüklenir; zamanlar tek seferde biçimlendirilir.
+    (aktiviteler, sonraki_imleç) döndürür; son sayfada imleç None olur."""
+    query = ActivityLog.query.options(db.joinedload(ActivityLog.user))
+    if cursor is not None:
+        timestamp, activity_id = cursor
+        query = query.filter(db.or_(
+            ActivityLog.timestamp < timestamp,
+            db.and_(ActivityLog.timestamp == timestamp, ActivityLog.id < activity_id)
+        ))
+    # Bir fazla kayıt çekilerek sonraki sayfanın varlığı ek COUNT sorgusu olmadan anlaşılır
+    activities = query.order_by(ActivityLog.timestamp.desc(), ActivityLog.id.desc()).limit(limit + 1).all()
+    has_more = len(activities) > limit
+    activities = activities[:limit]
+    for activity in activities:
+        activity.formatted_timestamp_str = format_activity_timestamp(activity.timestamp)
+    next_cursor = encode_activity_cursor(activities[-1]) if has_more else None
+    return activities, next_cursor
+
+def serialize_activity(activity):
+    """Aktivite akışı JSON kaydı (get_activity_page ile yüklenmiş aktivite beklenir)"""
+    user = activity.user
+    return {
+        'id': activity.id,
+        'type': activity.activity_type,
+        'description': activity.description,
+        'timestamp': getattr(activity, 'formatted_timestamp_str', None) or format_activity_timestamp(activity.timestamp, 'Bilinmeyen tarih'),
+        'user': user.get_full_name() if user else 'Bilinmeyen Kullanıcı',
+        'details': activity.details,
+        'profile_image': url_for('static', filename=user.profile_image) if user and user.profile_image else url_for('static', filename='images/pp.png'),
+        'can_delete': bool(current_user.is_authenticated and current_user.is_admin),
+    }
+
+def get_case_statistics():
+    """Anasayfa istatistikleri: sayılar panel sayaçlarından tek sorguyla okunur,
+    adliye dağılımı gruplanmış SQL sorgusuyla hesaplanır."""
+    counters = get_counters()
+    stats = {
+        'total_cases': counters['dosya_sayisi'],
+        'total_active_cases': counters['aktif_dosya_sayisi'],
+        'pending_cases': counters['beklemede_dosya_sayisi'],
+        'closed_cases': counters['kapali_dosya_sayisi'],
+        'hukuk_count': counters['hukuk_dosya_sayisi'],
+        'ceza_count': counters['ceza_dosya_sayisi'],
+        'icra_count': counters['icra_dosya_sayisi'],
+        'total_activities': counters['aktivite_sayisi'],
+        'total_hearings': counters['durusma_sayisi'],
+    }
+
+    # Adliye istatistikleri (dosyaların ilk görüldüğü sırayla)
+    courthouse_rows = db.session.query(CaseFile.courthouse, func.count(CaseFile.id)) \
+        .filter(CaseFile.courthouse.isnot(None)) \
+        .group_by(CaseFile.courthouse) \
+        .order_by(func.min(CaseFile.id)).all()
+    stats['courthouse_stats'] = [
+        {'courthouse': courthouse, 'total_cases': count}
+        for courthouse, count in courthouse_rows
+        if courthouse.strip().lower() not in ['', 'uygulanmaz']
+    ]
+    return stats
+
+def get_database_statistics():
+    """Veritabanı yönetimi sayfası için tablo kayıt sayıları (panel sayaçlarından)"""
+    counters = get_counters()
+    return {
+        # Temel istatistikler
+        'kullanici_sayisi': counters['kullanici_sayisi'],
+        'onaysiz_kullanici_sayisi': counters['onaysiz_kullanici_sayisi'],
+        'dosya_sayisi': counters['dosya_sayisi'],
+        'aktif_dosya_sayisi': counters['aktif_dosya_sayisi'],
+        'etkinlik_sayisi': counters['etkinlik_sayisi'],
+        'duyuru_sayisi': counters['duyuru_sayisi'],
+        
+        # Detaylı tablo istatistikleri
+        'odeme_sayisi': counters['musteri_sayisi'],  # Müşteri ödemeler tablosu
+        'belge_sayisi': counters['belge_sayisi'],
+        'masraf_sayisi': counters['masraf_sayisi'],
+        'bildirim_sayisi': counters['bildirim_sayisi'],
+        'aktivite_sayisi': counters['aktivite_sayisi'],
+        
+        # İşçi ve işgören tabloları
+        'isci_gorusme_sayisi': counters['isci_gorusme_sayisi'],
+        'worker_interview_sayisi': counters['worker_interview_sayisi'],
+        
+        # Dilekçe ve sözleşme tabloları
+        'ornek_dilekce_sayisi': counters['ornek_dilekce_sayisi'],
+        'ornek_sozlesme_sayisi': counters['ornek_sozlesme_sayisi'],
+        'dilekce_kategori_sayisi': counters['dilekce_kategori_sayisi'],
+        
+        # Ödeme tablosu (Client tablosu müşteriler için kullanılıyor)
+        'musteri_sayisi': counters['musteri_sayisi'],
+    }
+
 @app.route('/')
 def anasayfa():
     # Kullanıcı giriş yapmamışsa login sayfasına yönlendir
@@ -835,44 +935,16 @@ def anasayfa():
 
     # Giriş yapmış kullanıcı için ana sayfa içeriği
     try:
-        activities_raw = ActivityLog.query.order_by(ActivityLog.timestamp.desc()).limit(5).all()
-        # Activities timestamp'lerini güvenli şekilde formatla
-        activities = []
-        for activity in activities_raw:
-            # Timestamp'i tamamen formatlanmış string olarak hazırla
-            try:
-                if activity.timestamp:
-                    app.logger.info(f"Processing activity {activity.id}, timestamp: {activity.timestamp}, type: {type(activity.timestamp)}")
-                    if hasattr(activity.timestamp, 'tzinfo') and activity.timestamp.tzinfo is not None:
-                        # Timezone aware datetime - timezone'u kaldır ve formatla
-                        naive_timestamp = activity.timestamp.replace(tzinfo=None)
-                        activity.formatted_timestamp_str = naive_timestamp.strftime('%d.%m.%Y %H:%M')
-                        app.logger.info(f"Formatted timezone aware: {activity.formatted_timestamp_str}")
-                    else:
-                        # Naive datetime (eski UTC kayıtlar) - Türkiye saatine çevir
-                        utc_time = activity.timestamp.replace(tzinfo=timezone.utc)
-                        turkey_tz = timezone(timedelta(hours=3))
-                        turkey_time = utc_time.astimezone(turkey_tz).replace(tzinfo=None)
-                        activity.formatted_timestamp_str = turkey_time.strftime('%d.%m.%Y %H:%M')
-                        app.logger.info(f"Formatted naive (UTC->Turkey): {activity.formatted_timestamp_str}")
-                else:
-                    app.logger.warning(f"Activity {activity.id} has no timestamp")
-                    activity.formatted_timestamp_str = 'Tarih yok'
-            except Exception as e:
-                app.logger.error(f"Activity {activity.id} timestamp formatlamada hata: {str(e)} - {activity.timestamp}")
-                activity.formatted_timestamp_str = f'Format hatası: {str(e)}'
-            activities.append(activity)
+        activities, activities_next_cursor = get_activity_page(limit=ACTIVITY_PAGE_SIZE)
     except Exception as e:
         app.logger.error(f"Activities yüklenirken hata: {str(e)}")
-        activities = []
+        activities, activities_next_cursor = [], None
     
-    total_activities = ActivityLog.query.count() # Tüm aktivitelerin sayısını al
     upcoming_hearings = CalendarEvent.query.filter(
         CalendarEvent.date >= date.today(),
         CalendarEvent.event_type.in_(['durusma', 'e-durusma']),
         CalendarEvent.is_completed == False
     ).order_by(CalendarEvent.date.asc(), CalendarEvent.time.asc()).limit(5).all()
-    total_hearings = CalendarEvent.query.filter(CalendarEvent.event_type.in_(['durusma', 'e-durusma'])).count() # Tüm duruşmaların sayısını al
     
     # Duyuruları al (yetki kontrolü ile)
     if current_user.has_permission('duyuru_goruntule'):
@@ -901,23 +973,7 @@ def anasayfa():
     else:
         announcements = []  # Yetki yoksa boş liste
 
-    user_cases = CaseFile.query.all() # Kullanıcı filtresi kaldırıldı
-    total_cases = len(user_cases)
-    total_active_cases = sum(1 for case in user_cases if case.status == 'Aktif') 
-    pending_cases = sum(1 for case in user_cases if case.status == 'Beklemede')
-    closed_cases = sum(1 for case in user_cases if case.status == 'Kapalı')
-
-    # Dosya türüne göre istatistikler
-    hukuk_count = sum(1 for case in user_cases if case.file_type and case.file_type.lower() == 'hukuk')
-    ceza_count = sum(1 for case in user_cases if case.file_type and case.file_type.lower() == 'ceza')
-    icra_count = sum(1 for case in user_cases if case.file_type and case.file_type.lower() == 'icra')
-
-    # Adliye istatistikleri
-    courthouse_stats_dict = {}
-    for case in user_cases:
-        if case.courthouse and case.courthouse.strip().lower() not in ['', 'uygulanmaz']:
-            courthouse_stats_dict[case.courthouse] = courthouse_stats_dict.get(case.courthouse, 0) + 1
-    courthouse_stats = [{'courthouse': k, 'total_cases': v} for k, v in courthouse_stats_dict.items()]
+    case_stats = get_case_statistics()
 
 
     # Ödeme istatistikleri (opsiyonel, gerekirse eklenebilir)
@@ -926,121 +982,53 @@ def anasayfa():
     return render_template('anasayfa.html', 
                            title="Anasayfa", 
                            activities=activities, # Kullanıcı filtresi kaldırıldı
-                           total_activities=total_activities, # Şablona gönder
+                           activities_next_cursor=activities_next_cursor, # Sonraki sayfa imleci
                            upcoming_hearings=upcoming_hearings, # Kullanıcı filtresi kaldırıldı
                            announcements=announcements,
-                           total_hearings=total_hearings, # Şablona gönder
-                           user_cases=user_cases, # Dosya istatistikleri için eklendi
-                           total_cases=total_cases,
-                           total_active_cases=total_active_cases, # active_cases -> total_active_cases
-                           pending_cases=pending_cases,
-                           closed_cases=closed_cases,
-                           hukuk_count=hukuk_count, # Eklendi
-                           ceza_count=ceza_count,   # Eklendi
-                           icra_count=icra_count,   # Eklendi
-                           courthouse_stats=courthouse_stats # Eklendi
+                           **case_stats # Dosya istatistikleri (SQL ile hesaplanır)
                            )
 
-# Daha fazla aktivite yüklemek için yeni endpoint
+# Aktivite akışı: (timestamp, id) imleciyle sayfalama
+@app.route('/api/activities')
+@login_required
+def api_activities():
+    try:
+        cursor = decode_activity_cursor(request.args.get('cursor'))
+    except ValueError:
+        return jsonify(activities=[], next_cursor=None, error='Geçersiz imleç'), 400
+    limit = min(max(request.args.get('limit', ACTIVITY_PAGE_SIZE, type=int), 1), 50)
+    try:
+        activities, next_cursor = get_activity_page(cursor=cursor, limit=limit)
+        return jsonify(activities=[serialize_activity(activity) for activity in activities], next_cursor=next_cursor)
+    except Exception as e:
+        app.logger.error(f"Aktivite akışı hatası: {str(e)}")
+        return jsonify(activities=[], next_cursor=None, error='Aktiviteler yüklenemedi'), 500
+
+# Eski istemciler için offset tabanlı endpoint (yeni kod /api/activities kullanır)
 @app.route('/load_more_activities/<int:offset>')
+@login_required
 def load_more_activities(offset):
     try:
-        activities = ActivityLog.query.order_by(ActivityLog.timestamp.desc()).offset(offset).limit(5).all()
-        
-        activities_data = []
-        for activity in activities:
-            try:
-                user = User.query.get(activity.user_id)
-                
-                # Timestamp formatting with error handling
-                if activity.timestamp:
-                    if hasattr(activity.timestamp, 'tzinfo') and activity.timestamp.tzinfo is not None:
-                        # Timezone aware datetime - timezone'u kaldır ve formatla
-                        timestamp_str = activity.timestamp.replace(tzinfo=None).strftime('%d.%m.%Y %H:%M')
-                    else:
-                        # Naive datetime (eski UTC kayıtlar) - Türkiye saatine çevir
-                        utc_time = activity.timestamp.replace(tzinfo=timezone.utc)
-                        turkey_tz = timezone(timedelta(hours=3))
-                        turkey_time = utc_time.astimezone(turkey_tz).replace(tzinfo=None)
-                        timestamp_str = turkey_time.strftime('%d.%m.%Y %H:%M')
-                else:
-                    timestamp_str = 'Bilinmeyen tarih'
-                
-                activity_data = {
-                    'type': activity.activity_type,
-                    'description': activity.description,
-                    'timestamp': timestamp_str,
-                    'user': user.get_full_name() if user else 'Bilinmeyen Kullanıcı',
-                    'details': activity.details,
-                    'profile_image': url_for('static', filename=user.profile_image) if user and user.profile_image else url_for('static', filename='images/pp.png')
-                }
-                activities_data.append(activity_data)
-            except Exception as e:
-                app.logger.error(f"Activity işleme hatası: {str(e)}")
-                continue
-        
-        return jsonify(activities=activities_data)
+        activities = ActivityLog.query.options(db.joinedload(ActivityLog.user)) \
+            .order_by(ActivityLog.timestamp.desc(), ActivityLog.id.desc()) \
+            .offset(offset).limit(ACTIVITY_PAGE_SIZE).all()
+        return jsonify(activities=[serialize_activity(activity) for activity in activities])
     except Exception as e:
         app.logger.error(f"Load more activities hatası: {str(e)}")
-        return jsonify(activities=[], error=str(e))
+        return jsonify(activities=[], error='Aktiviteler yüklenemedi'), 500
 
 @app.route('/takvim')
 @login_required
 @permission_required('takvim_goruntule')
 def takvim():
-    # Debug mesajları
-    print(f"Kullanıcı admin mi: {current_user.is_admin}")
-    print(f"Kullanıcı yetkileri: {current_user.permissions}")
-    print(f"Takvim görüntüleme yetkisi: {current_user.has_permission('takvim_goruntule')}")
-    
-    # Etkinlik görüntüleme yetki kontrolü
+    # Sayfaya yalnızca içinde bulunulan ayın etkinlikleri gömülür; diğer aylar
+    # /api/takvim/etkinlikler üzerinden görünür aralık olarak istenir
+    events_version = get_calendar_version()
+    events_month = month_range(date.today())
     if not current_user.has_permission('etkinlik_goruntule'):
         events_data = []  # Yetki yoksa boş liste döndür
     else:
-        # Tüm etkinlikleri getir (session refresh ile)
-        db.session.expire_all()  # Cache'i temizle
-        events = CalendarEvent.query.all()
-        events_data = []
-        
-        for event in events:
-            event_data = {
-                'id': event.id,
-                'title': event.title,
-                'date': event.date.strftime('%Y-%m-%d'),
-                'time': event.time.strftime('%H:%M') if event.time else None,
-                'event_type': event.event_type,
-                'description': event.description,
-                'assigned_to': event.assigned_to,
-                'file_type': event.file_type,
-                'courthouse': event.courthouse,
-                'department': event.department,
-                'deadline_date': event.deadline_date.strftime('%Y-%m-%d') if event.deadline_date else None,
-                'is_completed': event.is_completed,
-                'muvekkil_isim': event.muvekkil_isim,
-                'muvekkil_telefon': event.muvekkil_telefon,
-                'basvuran_isim': event.basvuran_isim,
-                'basvuran_telefon': event.basvuran_telefon,
-                'aleyhindeki_isim': event.aleyhindeki_isim,
-                'aleyhindeki_telefon': event.aleyhindeki_telefon,
-                'arabulucu_isim': event.arabulucu_isim,
-                'arabulucu_telefon': event.arabulucu_telefon,
-                'arabuluculuk_turu': event.arabuluculuk_turu,
-                'toplanti_adresi': event.toplanti_adresi
-            }
-            events_data.append(event_data)
-
-            # Debug: Arabuluculuk etkinliklerini logla
-            if event.event_type == 'arabuluculuk-toplantisi':
-                print(f"Arabuluculuk Etkinliği ID {event.id}:")
-                print(f"  Başvuran: {event.basvuran_isim} ({event.basvuran_telefon})")
-                print(f"  Aleyhindeki: {event.aleyhindeki_isim} ({event.aleyhindeki_telefon})")
-                print(f"  Arabulucu: {event.arabulucu_isim} ({event.arabulucu_telefon})")
-                print(f"  Tür: {event.arabuluculuk_turu}")
-    
-    # Debug için dosya türü, adliye ve departman verilerini kontrol et
-    for event_data in events_data:
-        if event_data['event_type'] in ['durusma', 'e-durusma']:
-            print(f"Etkinlik {event_data['id']} - Dosya Türü: {event_data['file_type']}, Adliye: {event_data['courthouse']}, Departman: {event_data['department']}")
+        events_data = [serialize_calendar_event(event) for event in get_events_in_range(*events_month)]
     
     # Adli tatil tarihlerini ekle
     current_year = datetime.now().year
@@ -1055,8 +1043,8 @@ def takvim():
         })
     
     # === YENİ: Adliye verisini hazırla ===
-    # Adliye listesini dosyadan yükle
-    cities_courthouses, cities = parse_adliye_list()
+    # Adliye listesi önbellekten, JSON'u önceden hesaplanmış olarak gelir
+    _, cities, courthouse_data = get_courthouses()
     
     # Kullanıcının yetkilerini template'e gönder
     user_permissions = {
@@ -1079,11 +1067,53 @@ def takvim():
     
     return render_template('takvim.html', 
                          events=events_data,
+                         events_version=events_version,
+                         events_month=events_month[0].strftime('%Y-%m'),
                          adli_tatil_data=adli_tatil_data,
-                         all_courthouses=cities_courthouses, # Tüm adliye verilerini gönder
+                         all_courthouses=courthouse_data.json, # Tüm adliye verilerini gönder (JSON)
                          user_permissions=user_permissions,
                          approved_users=users_data)
 
+@app.route('/api/takvim/etkinlikler')
+@login_required
+@permission_required('takvim_goruntule')
+def api_takvim_etkinlikler():
+    """Görünen aralığın (ay/hafta) etkinlikleri: ?start=YYYY-MM-DD&end=YYYY-MM-DD[&since=<sürüm>]
+    since verilirse yalnızca o sürümden sonra değişenler döner. ETag ile koşullu yanıt destekler."""
+    if not current_user.has_permission('etkinlik_goruntule'):
+        return jsonify({'error': 'Etkinlik görüntüleme yetkiniz yok'}), 403
+    try:
+        start_date, end_date = parse_range(request.args.get('start'), request.args.get('end'))
+        since = request.args.get('since', type=int)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+
+    # Sürüm veriden önce okunur: arada değişiklik olursa bir sonraki since isteği onu da getirir.
+    # Satır sayısı, sürümden küçük numarayla geç commit edilen değişikliklerde ETag'i değiştirir.
+    version, change_count = get_calendar_state()
+    etag = f"takvim-{version}.{change_count}-{start_date}-{end_date}-{since if since is not None else 'full'}"
+    if request.if_none_match.contains(etag):
+        response = make_response('', 304)
+    elif since is None:
+        events = get_events_in_range(start_date, end_date)
+        response = jsonify({
+            'version': version,
+            'events': [serialize_calendar_event(event) for event in events]
+        })
+    else:
+        changed, removed, reset = get_changes_since(since, start_date, end_date)
+        response = jsonify({
+            'version': version,
+            'since': since,
+            'reset': reset,
+            'events': [serialize_calendar_event(event) for event in changed],
+            'removed': removed
+        })
+    response.set_etag(etag)
+    response.cache_control.private = True
+    response.cache_control.no_cache = True  # Her seferinde ETag ile doğrulat
+    return response
+
 @app.route('/dosyalarim')
 def dosyalarim():
     # URL parametrelerini al
@@ -1848,13 +1878,13 @@ def dosya_sorgula():
     else:
         case_files = []
     
-    # Şehir ve adliye verilerini yükle (dosya_ekle ile aynı fonksiyonu kullanıyor)
-    cities_courthouses, cities = parse_adliye_list()
+    # Şehir ve adliye verilerini yükle (önbellekteki hazır JSON kullanılır)
+    _, cities, courthouse_data = get_courthouses()
     
     return render_template('dosya_sorgula.html', 
                          case_files=case_files,
                          cities=cities,
-                         all_courthouses=json.dumps(cities_courthouses, ensure_ascii=False))
+                         all_courthouses=courthouse_data.json)
 
 @app.route('/dosya_ekle', methods=['GET', 'POST'])
 @login_required
@@ -1967,12 +1997,12 @@ def dosya_ekle():
             return redirect(url_for('dosya_ekle'))
 
     # GET isteği için şehir ve adliye verilerini yükle
-    cities_courthouses, cities = parse_adliye_list()
+    _, cities, courthouse_data = get_courthouses()
     today_date = datetime.now().strftime('%Y-%m-%d')
     return render_template('dosya_ekle.html',
                          today_date=today_date,
                          cities=cities,
-                         all_courthouses=json.dumps(cities_courthouses, ensure_ascii=False)) # Pass all data as JSON
+                         all_courthouses=courthouse_data.json) # Önceden hesaplanmış JSON
 
 @app.route('/case_details/<int:case_id>')
 @login_required
@@ -2316,8 +2346,8 @@ def delete_case(case_id):
         failed_deletions = []
 
         for document in documents:
-            # Ana belge dosyasını bul ve sil
-            main_file_path = find_document_file(document.filepath)
+            # Ana belge dosyasını bul ve sil (depodaki paylaşılan dosyalar referans sayısıyla silinir)
+            main_file_path = None if is_blob(document.filepath) else find_document_file(document.filepath)
             if main_file_path:
                 try:
                     if os.access(main_file_path, os.W_OK):
@@ -3148,61 +3178,10 @@ def allowed_file(filename):
 
 def find_document_file(filepath):
     """
-    Bir belge dosyasını çeşitli lokasyonlarda arar ve bulursa tam yolunu döndürür
+    Kayıtlı belge yolunu diskteki dosyaya çözer, bulamazsa None döndürür.
+    Kanonik yollar tek stat ile, eski biçimler önbellekli aday taramasıyla çözülür (bkz. file_storage.py)
     """
-    if not filepath:
-        return None
-
-    # Mümkün dosya yollarını oluştur
-    possible_paths = []
-
-    # 1) Normalize: 'static/uploads/...' veya 'firstwebsite/static/uploads/...' gibi
-    try:
-        norm = filepath.replace('\\', '/')
-        # static/ ön eki varsa kırp
-        if norm.startswith('static/'):
-            norm = norm[len('static/'):]
-        if norm.startswith('firstwebsite/static/'):
-            norm = norm[len('firstwebsite/static/'):]
-        # uploads/ ile başlıyorsa doğrudan UPLOAD_FOLDER ile birleştir
-        if norm.startswith('uploads/'):
-            possible_paths.append(os.path.join(app.config['UPLOAD_FOLDER'], norm[len('uploads/'):]))
-        # uploads/documents/... tam yolu da dene
-        if 'uploads/' in norm:
-            idx = norm.find('uploads/')
-            tail = norm[idx + len('uploads/'):]
-            possible_paths.append(os.path.join(app.config['UPLOAD_FOLDER'], tail))
-    except Exception:
-        pass
-
-    # Eğer filepath zaten mutlak yolsa, direkt onu dene
-    if os.path.isabs(filepath):
-        possible_paths.append(filepath)
-    else:
-        # Göreceli yollar için çeşitli kombinasyonlar
-        base_paths = [
-            app.config['UPLOAD_FOLDER'],  # normalized uploads kökü
-            os.path.join(app.config['UPLOAD_FOLDER'], 'documents'),
-            os.getcwd(),  # proje kökü
-            os.path.join(os.getcwd(), 'firstwebsite'),  # firstwebsite/
-            os.path.join(os.getcwd(), 'firstwebsite', 'static'),  # firstwebsite/static/
-            '/'  # sistem kökü
-        ]
-
-        for base_path in base_paths:
-            possible_paths.append(os.path.join(base_path, filepath))
-
-        # Eski format uyumlu yollar
-        filename_only = os.path.basename(filepath)
-        possible_paths.append(os.path.join(app.config['UPLOAD_FOLDER'], 'documents', filename_only))
-        possible_paths.append(os.path.join(app.config['UPLOAD_FOLDER'], 'documents', filepath))
-
-    # Her yolu kontrol et
-    for path in possible_paths:
-        if os.path.exists(path) and os.path.isfile(path):
-            return path
-
-    return None
+    return path_resolver.resolve(filepath)
 
 @app.route('/upload_document/<int:case_id>', methods=['POST'])
 @csrf.exempt
@@ -3217,7 +3196,7 @@ def upload_document(case_id):
         parent_document_id = request.form.get('parent_document_id')  # Ek belge için ana belge ID
         document_date = request.form.get('document_date')  # Opsiyonel belge tarihi
 
-        logger.info(f"DEBUG: upload_document called - parent_document_id={parent_document_id}, type={type(parent_document_id)}")
+        logger.debug("upload_document called - parent_document_id=%s, type=%s", parent_document_id, type(parent_document_id))
 
         if not document_type:
             return jsonify(success=False, message="Belge türü seçilmedi")
@@ -3236,22 +3215,18 @@ def upload_document(case_id):
             upload_attempts = [
                 {
                     'path': os.path.join(app.config['UPLOAD_FOLDER'], 'documents'),
-                    'db_path': f"documents/{unique_filename}",
                     'description': 'Standart uploads/documents dizini'
                 },
                 {
                     'path': os.path.join(os.getcwd(), 'firstwebsite', 'static', 'uploads', 'documents'),
-                    'db_path': f"static/uploads/documents/{unique_filename}",
                     'description': 'Static dizini altında'
                 },
                 {
                     'path': os.path.join(os.getcwd(), 'documents'),
-                    'db_path': f"../documents/{unique_filename}",
                     'description': 'Proje kökünde documents dizini'
                 },
                 {
                     'path': os.path.join('/tmp', 'law_app_uploads'),
-                    'db_path': f"/tmp/law_app_uploads/{unique_filename}",
                     'description': 'Sistem geçici dizini'
                 }
             ]
@@ -3261,6 +3236,16 @@ def upload_document(case_id):
             successful_upload = False
             upload_errors = []
 
+            # Önce içerik adresli depo: aynı dosya daha önce yüklendiyse yeniden yazılmaz
+            try:
+                db_filepath = blob_store.save(file)
+                successful_upload = True
+                upload_attempts = []
+            except OSError as e:
+                upload_errors.append(f"Belge deposu: {str(e)}")
+                logger.warning("Belge deposuna yazılamadı, yedek dizinler denenecek: %s", e)
+                file.stream.seek(0)
+
             # Her alternatifi sırayla dene
             for attempt in upload_attempts:
                 try:
@@ -3287,52 +3272,22 @@ def upload_document(case_id):
 
                     # Başarılı!
                     file_path = target_file_path
-                    db_filepath = attempt['db_path']
+                    # Veritabanına dosyanın gerçek konumu kanonik biçimde yazılır
+                    db_filepath = canonical_path(target_file_path)
                     successful_upload = True
-                    print(f"Dosya başarıyla yüklendi: {attempt['description']} - {target_file_path}")
+                    logger.debug("Dosya başarıyla yüklendi: %s - %s", attempt['description'], target_file_path)
                     break
 
                 except Exception as e:
                     error_msg = f"{attempt['description']}: {str(e)}"
                     upload_errors.append(error_msg)
-                    print(f"Yükleme denemesi başarısız - {error_msg}")
+                    logger.warning("Yükleme denemesi başarısız - %s", error_msg)
                     continue
 
             if not successful_upload:
                 error_details = "\n".join(upload_errors)
                 return jsonify(success=False, message=f"Dosya yüklenemedi. Denenen alternatifler:\n{error_details}")
             
-            # PDF path'i başlangıçta None olarak ayarla
-            pdf_path = None
-            
-            # UDF, DOC veya DOCX dosyası ise otomatik PDF dönüşümü yap
-            if file_ext.lower() in ['udf', 'doc', 'docx']:
-                print(f"{file_ext.upper()} dosyası yüklendi, PDF'e dönüştürülüyor: {file_path}")
-                try:
-                    pdf_path = convert_udf_to_pdf(file_path)
-                    if pdf_path:
-                        print(f"Dönüştürme başarılı: {pdf_path}")
-                        
-                        # PDF dosyasını saklamak için benzersiz isim oluştur
-                        pdf_filename = f"{case_id}_{int(pytime.time())}_converted_{display_name}.pdf"
-                        permanent_pdf_path = os.path.join(app.config['UPLOAD_FOLDER'], pdf_filename)
-                        
-                        # Geçici PDF dosyasını kalıcı konuma taşı
-                        shutil.copy(pdf_path, permanent_pdf_path)
-                        
-                        # Geçici dosyayı temizle
-                        try:
-                            os.remove(pdf_path)
-                        except:
-                            pass
-                        
-                        # PDF path'i güncelle
-                        pdf_path = pdf_filename
-                    else:
-                        print(f"Dönüştürme başarısız oldu")
-                except Exception as e:
-                    print(f"PDF dönüştürme hatası: {str(e)}")
-            
             # Belge tarihini parse et
             upload_date = datetime.now()
             if document_date:
@@ -3343,7 +3298,7 @@ def upload_document(case_id):
 
             # Parent document ID'yi integer'a çevir
             parent_id = int(parent_document_id) if parent_document_id else None
-            logger.info(f"DEBUG: Creating document with parent_id={parent_id}")
+            logger.debug("Creating document with parent_id=%s", parent_id)
 
             new_document = Document(
                 case_id=case_id,
@@ -3352,14 +3307,17 @@ def upload_document(case_id):
                 filepath=db_filepath,  # Veritabanında saklanacak göreceli yol
                 upload_date=upload_date,  # Kullanıcı tarafından seçilen veya bugünün tarihi
                 user_id=current_user.id if current_user.is_authenticated else 1,
-                pdf_version=pdf_path,  # PDF versiyonu varsa kaydet
                 parent_document_id=parent_id  # Ek belge ise ana belge ID
             )
 
             db.session.add(new_document)
             db.session.commit()
 
-            logger.info(f"DEBUG: Document saved with ID={new_document.id}, parent_document_id={new_document.parent_document_id}")
+            logger.debug("Document saved with ID=%s, parent_document_id=%s", new_document.id, new_document.parent_document_id)
+
+            # UDF, DOC veya DOCX ise PDF dönüşümü arka planda yapılır (bkz. document_conversion.py)
+            if needs_conversion(new_document.filename):
+                document_converter.enqueue(new_document.id)
 
             # İşlem logu ekle
             case_file = CaseFile.query.get(case_id)
@@ -3376,7 +3334,7 @@ def upload_document(case_id):
         return jsonify(success=False, message="Geçersiz dosya türü")
     except Exception as e:
         db.session.rollback()
-        print(f"Upload error: {str(e)}")
+        logger.error("Upload error: %s", e)
         return jsonify(success=False, message=str(e))
 
 @app.route('/get_documents/<int:case_id>')
@@ -3433,8 +3391,8 @@ def delete_document(document_id):
         deleted_files = []
         failed_deletions = []
 
-        # Ana belge dosyasını bul
-        main_file_path = find_document_file(document.filepath)
+        # Ana belge dosyasını bul (depodaki paylaşılan dosyalar referans sayısıyla silinir)
+        main_file_path = None if is_blob(document.filepath) else find_document_file(document.filepath)
         if main_file_path:
             try:
                 if os.access(main_file_path, os.W_OK):
@@ -3506,8 +3464,8 @@ def convert_udf_to_pdf(input_path):
         with tempfile.NamedTemporaryFile(suffix='.pdf', delete=False) as tmp_pdf:
             output_path = tmp_pdf.name
         
-        print(f"Dönüştürme başlatılıyor: {input_path} -> {output_path}")
-        print(f"Dosya uzantısı: {ext}")
+        logger.debug("Dönüştürme başlatılıyor: %s -> %s", input_path, output_path)
+        logger.debug("Dosya uzantısı: %s", ext)
         
         # 1. ÖZEL YÖNTEM: UDF dosyaları için UYAP Editör CLI komutunu dene
         if ext == '.udf':
@@ -3526,8 +3484,8 @@ def convert_udf_to_pdf(input_path):
                         break
                 
                 if uyap_exe:
-                    print(f"UYAP Editör bulundu: {uyap_exe}")
-                    print("UYAP Editör ile dönüştürme deneniyor...")
+                    logger.debug("UYAP Editör bulundu: %s", uyap_exe)
+                    logger.debug("UYAP Editör ile dönüştürme deneniyor...")
                     
                     # Çıktı dizinini hazırla
                     output_dir = os.path.dirname(output_path)
@@ -3550,40 +3508,40 @@ def convert_udf_to_pdf(input_path):
                     
                     # Çıktı dosyasını kontrol et
                     if os.path.exists(lo_output_path) and os.path.getsize(lo_output_path) > 0:
-                        print(f"LibreOffice ile dönüştürme başarılı: {lo_output_path}")
+                        logger.debug("LibreOffice ile dönüştürme başarılı: %s", lo_output_path)
                         
                         # Çıktıyı istenen yere taşı
                         if lo_output_path != output_path:
                             shutil.move(lo_output_path, output_path)
-                            print(f"PDF dosyası taşındı: {lo_output_path} -> {output_path}")
+                            logger.debug("PDF dosyası taşındı: %s -> %s", lo_output_path, output_path)
                             
                         return output_path
                     else:
-                        print("LibreOffice çıktı dosyası oluşturulamadı veya boş")
+                        logger.warning("LibreOffice çıktı dosyası oluşturulamadı veya boş")
                         if result.stderr:
-                            print(f"LibreOffice stderr: {result.stderr}")
+                            logger.warning("LibreOffice stderr: %s", result.stderr)
                 else:
-                    print("LibreOffice bulunamadı")
+                    logger.warning("LibreOffice bulunamadı")
             except subprocess.CalledProcessError as e:
-                print(f"LibreOffice çalıştırma hatası: {str(e)}")
+                logger.warning("LibreOffice çalıştırma hatası: %s", e)
                 if hasattr(e, 'stderr') and e.stderr:
-                    print(f"LibreOffice stderr: {e.stderr}")
+                    logger.warning("LibreOffice stderr: %s", e.stderr)
             except subprocess.TimeoutExpired:
-                print("LibreOffice zaman aşımına uğradı")
+                logger.warning("LibreOffice zaman aşımına uğradı")
             except Exception as e:
-                print(f"LibreOffice beklenmeyen hata: {str(e)}")
+                logger.warning("LibreOffice beklenmeyen hata: %s", e)
         
         # Her iki yöntem de başarısız oldu
-        print("Tüm dönüştürme yöntemleri başarısız oldu")
+        logger.warning("Tüm dönüştürme yöntemleri başarısız oldu")
         return None
             
     except Exception as e:
-        print(f"Üst düzey bir hata oluştu: {str(e)}")
+        logger.error("Üst düzey bir hata oluştu: %s", e)
         # Çıktı dosyası oluşturulduysa temizle
         if 'output_path' in locals() and os.path.exists(output_path):
             try:
                 os.remove(output_path)
-                print(f"Geçici dosya temizlendi: {output_path}")
+                logger.debug("Geçici dosya temizlendi: %s", output_path)
             except:
                 pass
         return None
@@ -3620,47 +3578,20 @@ def preview_document(document_id):
         mimetype = f'image/{extension[1:]}' if extension != '.tif' else 'image/tiff'
         return send_file(filepath, mimetype=mimetype)
 
-    # DOC ve DOCX dosyaları için önizleme
+    # DOC ve DOCX dosyaları: PDF arka planda hazırlanır, hazır olunca yukarıda doğrudan gönderilir
     elif extension in ['.doc', '.docx']:
-        try:
-            print(f"{extension} dosyası için PDF dönüşümü başlatılıyor...")
-            pdf_path = convert_office_to_pdf(filepath)
-            if pdf_path:
-                # Dönüştürülmüş PDF dosyasını gönder
-                response = send_file(pdf_path, mimetype='application/pdf')
-                
-                # Dönüştürme başarılı olduysa, PDF'i sonraki kullanımlar için kaydet
-                try:
-                    # PDF dosyasını saklamak için benzersiz isim oluştur
-                    pdf_filename = f"{document.case_id}_{int(pytime.time())}_converted_{document.filename}.pdf"
-                    permanent_pdf_path = os.path.join(app.config['UPLOAD_FOLDER'], 'documents',  pdf_filename)
-                    
-                    # Geçici PDF dosyasını kalıcı konuma kopyala
-                    shutil.copy(pdf_path, permanent_pdf_path)
-                    
-                    # Veritabanında belgenin PDF sürümünü güncelle
-                    document.pdf_version = pdf_filename
-                    db.session.commit()
-                    print(f"PDF sürümü kaydedildi: {pdf_filename}")
-                except Exception as e:
-                    print(f"PDF sürümü kaydedilirken hata: {str(e)}")
-                
-                return response
-            else:
-                # Dönüştürme başarısız olursa, dosyayı uygun MIME tipi ile görüntüle
-                print(f"PDF dönüşümü başarısız oldu, {extension} dosyası görüntülenecek")
-                
-                if extension == '.doc':
-                    # .doc için uygun MIME tipi
-                    return send_file(filepath, mimetype='application/msword')
-                else:
-                    # .docx için uygun MIME tipi
-                    return send_file(filepath, 
-                                   mimetype='application/vnd.openxmlformats-officedocument.wordprocessingml.document')
-        except Exception as e:
-            print(f"{extension.upper()} önizleme hatası (docId: {document_id}): {e}")
-            # Hata durumunda dosyayı indirmeye ver
-            return send_file(filepath, as_attachment=True, download_name=document.filename)
+        if document_converter.enqueue(document.id) == 'pending':
+            return conversion_pending_response(document)
+        # Senkron modda dönüşüm bitmiş olabilir
+        db.session.refresh(document)
+        pdf_path = find_document_file(document.pdf_version) if document.pdf_version else None
+        if pdf_path:
+            return send_file(pdf_path, mimetype='application/pdf')
+        # Dönüştürme başarısız olduysa dosyayı uygun MIME tipi ile görüntüle
+        if extension == '.doc':
+            return send_file(filepath, mimetype='application/msword')
+        return send_file(filepath,
+                         mimetype='application/vnd.openxmlformats-officedocument.wordprocessingml.document')
 
     # Diğer dosya türleri için indirme işlemi
     else:
@@ -3672,6 +3603,7 @@ def convert_office_to_pdf(input_path):
     if not os.path.exists(input_path):
         return None
     
+    output_path = None
     try:
         _, extension = os.path.splitext(input_path)
         extension = extension.lower()
@@ -3681,9 +3613,9 @@ def convert_office_to_pdf(input_path):
             print("Bu uzantı desteklenmiyor.")
             return None
             
-        # Çıktı için geçici dosya oluştur
-        output_path = os.path.join(tempfile.gettempdir(), 
-                                  f"temp_converted_{int(pytime.time())}.pdf")
+        # Çıktı için geçici dosya oluştur (eşzamanlı dönüşümler çakışmasın diye benzersiz)
+        fd, output_path = tempfile.mkstemp(suffix='.pdf', prefix='temp_converted_')
+        os.close(fd)
         
         # 1. DOCX-PREVIEW modülünü kullanarak HTML'e dönüştür ve sonra PDF'e çevir
         if extension == '.docx':
@@ -3729,6 +3661,12 @@ def convert_office_to_pdf(input_path):
                 # Linux/Mac'te soffice genellikle PATH içindedir
                 soffice_path = "/usr/bin/soffice"
                 
+            if libreoffice_pool.available():
+                # Sıcak LibreOffice havuzu (bkz. libreoffice_pool.py); başarısız olursa soğuk soffice denenir
+                if libreoffice_pool.convert(input_path, output_path):
+                    logger.debug("LibreOffice havuzu ile dönüştürme başarılı: %s", output_path)
+                    return output_path
+                logger.warning("LibreOffice havuzu dönüştüremedi, soffice komutu deneniyor: %s", input_path)
             if soffice_path and os.path.exists(soffice_path):
                 # Geçici çalışma dizini oluştur
                 temp_dir = tempfile.mkdtemp()
@@ -3736,6 +3674,7 @@ def convert_office_to_pdf(input_path):
                 # LibreOffice komutu
                 cmd = [
                     soffice_path,
+                    libreoffice_profile_arg(),
                     '--headless',
                     '--convert-to', 'pdf',
                     '--outdir', temp_dir,
@@ -3772,11 +3711,36 @@ def convert_office_to_pdf(input_path):
         
         # Tüm dönüştürme yöntemleri başarısız oldu
         print("Tüm dönüştürme yöntemleri başarısız oldu")
+        os.remove(output_path)
         return None
     except Exception as e:
         print(f"Dönüştürme sırasında hata: {str(e)}")
+        if output_path and os.path.exists(output_path):
+            os.remove(output_path)
         return None
 
+def convert_document_to_pdf(input_path):
+    """Belge türüne göre dönüştürücüyü seçer; geçici PDF yolunu veya None döndürür"""
+    _, extension = os.path.splitext(input_path)
+    if extension.lower() in ['.doc', '.docx']:
+        return convert_office_to_pdf(input_path)
+    return convert_udf_to_pdf(input_path)
+
+# UDF/DOC/DOCX -> PDF dönüşümleri arka planda yapılır (DOCUMENT_CONVERSION_MODE=sync ile senkron)
+document_converter.init_app(app, convert=convert_document_to_pdf, resolve=find_document_file)
+
+def conversion_pending_response(document):
+    """PDF hazırlanırken gösterilen, kendini yenileyen kısa sayfa"""
+    response = make_response(
+        '<!DOCTYPE html><html><head><meta charset="utf-8">'
+        '<meta http-equiv="refresh" content="3"><title>Belge hazırlanıyor</title></head>'
+        f'<body style="font-family: sans-serif; padding: 2rem;"><p>{escape(document.filename)} '
+        'PDF olarak hazırlanıyor, sayfa birkaç saniye içinde yenilenecek...</p></body></html>',
+        202
+    )
+    response.headers['Retry-After'] = '3'
+    return response
+
 @app.route('/get_udf_manifest/<int:document_id>')
 def get_udf_manifest(document_id):
     document = Document.query.get_or_404(document_id)
@@ -4229,61 +4193,13 @@ def get_user_settings():
 @permission_required('veritabani_yonetimi')
 def veritabani_yonetimi():
     """Veritabanı yönetimi sayfası - Tüm sistem tablolarını yönet"""
-    # Veritabanı istatistikleri - Tüm tabloların kayıt sayıları
-    stats = {
-        # Temel istatistikler
-        'kullanici_sayisi': User.query.count(),
-        'onaysiz_kullanici_sayisi': User.query.filter_by(is_approved=False).count(),
-        'dosya_sayisi': CaseFile.query.count(),
-        'aktif_dosya_sayisi': CaseFile.query.filter_by(status='Aktif').count(),
-        'etkinlik_sayisi': CalendarEvent.query.count(),
-        'duyuru_sayisi': Announcement.query.count(),
-        
-        # Detaylı tablo istatistikleri
-        'odeme_sayisi': Client.query.count(),  # Müşteri ödemeler tablosu
-        'belge_sayisi': Document.query.count(),
-        'masraf_sayisi': Expense.query.count(),
-        'bildirim_sayisi': Notification.query.count(),
-        'aktivite_sayisi': ActivityLog.query.count(),
-        
-        # İşçi ve işgören tabloları
-        'isci_gorusme_sayisi': IsciGorusmeTutanagi.query.count(),
-        'worker_interview_sayisi': WorkerInterview.query.count(),
-        
-        # Dilekçe ve sözleşme tabloları
-        'ornek_dilekce_sayisi': OrnekDilekce.query.count(),
-        'ornek_sozlesme_sayisi': OrnekSozlesme.query.count(),
-        'dilekce_kategori_sayisi': DilekceKategori.query.count(),
-        
-        # Ödeme tablosu (Client tablosu müşteriler için kullanılıyor)
-        'musteri_sayisi': Client.query.count(),
-        'payment_sayisi': Payment.query.count() if hasattr(globals(), 'Payment') else 0,
-    }
+    # Veritabanı istatistikleri - Tüm tabloların kayıt sayıları (panel sayaçlarından tek sorguyla)
+    stats = get_database_statistics()
+    stats['payment_sayisi'] = Payment.query.count() if hasattr(globals(), 'Payment') else 0
     
     # Son aktiviteler
     try:
-        recent_activities_raw = ActivityLog.query.order_by(ActivityLog.timestamp.desc()).limit(10).all()
-        recent_activities = []
-        for activity in recent_activities_raw:
-            # Timestamp'i tamamen formatlanmış string olarak hazırla
-            if activity.timestamp:
-                try:
-                    if hasattr(activity.timestamp, 'tzinfo') and activity.timestamp.tzinfo is not None:
-                        # Timezone aware datetime - timezone'u kaldır ve formatla
-                        naive_timestamp = activity.timestamp.replace(tzinfo=None)
-                        activity.formatted_timestamp_str = naive_timestamp.strftime('%d.%m.%Y %H:%M')
-                    else:
-                        # Naive datetime (eski UTC kayıtlar) - Türkiye saatine çevir
-                        utc_time = activity.timestamp.replace(tzinfo=timezone.utc)
-                        turkey_tz = timezone(timedelta(hours=3))
-                        turkey_time = utc_time.astimezone(turkey_tz).replace(tzinfo=None)
-                        activity.formatted_timestamp_str = turkey_time.strftime('%d.%m.%Y %H:%M')
-                except Exception as e:
-                    app.logger.error(f"Timestamp formatlamada hata: {str(e)} - {activity.timestamp}")
-                    activity.formatted_timestamp_str = 'Format hatası'
-            else:
-                activity.formatted_timestamp_str = 'Tarih yok'
-            recent_activities.append(activity)
+        recent_activities, _ = get_activity_page(limit=10)
     except Exception as e:
         app.logger.error(f"Recent activities yüklenirken hata: {str(e)}")
         recent_activities = []
@@ -4555,33 +4471,8 @@ def api_veritabani_istatistikler():
     """Veritabanı istatistiklerini JSON olarak döndür"""
     try:
         # Aynı istatistikleri ana fonksiyonla senkronize et
-        stats = {
-            # Temel istatistikler
-            'kullanici_sayisi': User.query.count(),
-            'onaysiz_kullanici_sayisi': User.query.filter_by(is_approved=False).count(),
-            'dosya_sayisi': CaseFile.query.count(),
-            'aktif_dosya_sayisi': CaseFile.query.filter_by(status='Aktif').count(),
-            'etkinlik_sayisi': CalendarEvent.query.count(),
-            'duyuru_sayisi': Announcement.query.count(),
-            
-            # Detaylı tablo istatistikleri
-            'odeme_sayisi': Client.query.count(),  # Müşteri/ödeme ilişkili kayıtlar
-            'belge_sayisi': Document.query.count(),
-            'masraf_sayisi': Expense.query.count(),
-            'bildirim_sayisi': Notification.query.count(),
-            'aktivite_sayisi': ActivityLog.query.count(),
-            
-            # İşçi ve işgören tabloları
-            'isci_gorusme_sayisi': IsciGorusmeTutanagi.query.count(),
-            
-            # Dilekçe ve sözleşme tabloları
-            'ornek_dilekce_sayisi': OrnekDilekce.query.count(),
-            'ornek_sozlesme_sayisi': OrnekSozlesme.query.count(),
-            'dilekce_kategori_sayisi': DilekceKategori.query.count(),
-            
-            # Ödeme tablosu (Client tablosu müşteriler için kullanılıyor)
-            'musteri_sayisi': Client.query.count(),
-        }
+        stats = get_database_statistics()
+        stats.pop('worker_interview_sayisi', None)
         
         # Detaylı sistem bilgileri
         import os
@@ -6363,35 +6254,18 @@ def preview_udf(document_id):
             return "Bu dosya .udf uzantılı değil, önizlenemez", 400
         
         # 1. Dosyanın PDF versiyonu varsa onu göster
-        if document.pdf_version:
-            pdf_path = os.path.join(app.config['UPLOAD_FOLDER'], document.pdf_version)
-            if os.path.exists(pdf_path):
-                print(f"UDF için hazır PDF sürümü kullanılıyor: {pdf_path}")
-                return send_file(pdf_path, mimetype='application/pdf')
-        
-        # 2. PDF dönüşümü dene
-        try:
-            print(f"UDF dosyasını PDF'e dönüştürme deneniyor...")
-            pdf_path = convert_udf_to_pdf(filepath)
+        pdf_path = find_document_file(document.pdf_version) if document.pdf_version else None
+        if pdf_path:
+            return send_file(pdf_path, mimetype='application/pdf')
+
+        # 2. PDF dönüşümü arka planda yapılır; hazır olana kadar içerik görüntüleme sayfası gösterilir
+        if document_converter.enqueue(document.id) is None:
+            # Senkron modda dönüşüm bitmiş olabilir
+            db.session.refresh(document)
+            pdf_path = find_document_file(document.pdf_version) if document.pdf_version else None
             if pdf_path:
-                print(f"UDF dosyası PDF'e dönüştürüldü: {pdf_path}")
-                # Dönüştürülmüş PDF dosyasını kaydet
-                pdf_filename = f"{document.case_id}_{int(pytime.time())}_converted_{document.filename}.pdf"
-                permanent_pdf_path = os.path.join(app.config['UPLOAD_FOLDER'], pdf_filename)
-                
-                # Geçici PDF dosyasını kalıcı konuma kopyala
-                shutil.copy(pdf_path, permanent_pdf_path)
-                
-                # Veritabanında belgenin PDF sürümünü güncelle
-                document.pdf_version = pdf_filename
-                db.session.commit()
-                
-                return send_file(permanent_pdf_path, mimetype='application/pdf')
-        except Exception as e:
-            print(f"UDF dosyasını PDF'e dönüştürürken hata: {str(e)}")
-            # PDF dönüşümü başarısız olduysa bilgilendirme sayfasını göster
-            pass
-        
+                return send_file(pdf_path, mimetype='application/pdf')
+
         # İndirme bağlantısını oluştur
         download_link = url_for('download_document', document_id=document_id)
         
@@ -6405,36 +6279,29 @@ def preview_udf(document_id):
         return f"UDF dosyasını açarken bir hata oluştu: {str(e)}", 500
 
 def parse_udf_content(input_path):
-    """UDF dosyasını ayrıştırıp içeriği çıkarır - resimler ve formatlar dahil"""
+    """UDF dosyasını ayrıştırıp içeriği HTML metni olarak döndürür - resimler ve formatlar dahil.
+    Önizlemeler doğrudan çağırmak yerine udf_preview_cache.get() kullanır."""
     try:
         print(f"UDF dosyası ayrıştırılıyor: {input_path}")
 
-        # UDF dosyasını ikili modda aç
-        with open(input_path, 'rb') as f:
-            content = f.read()
-
         # UDF formatını analiz et
         # 1. Magic bytes kontrolü
-        if content.startswith(b'PK'):
+        with open(input_path, 'rb') as f:
+            magic = f.read(2)
+        if magic == b'PK':
             # ZIP formatındaysa, ZIP olarak açmayı dene
             import zipfile
-            from io import BytesIO
             import re
             import base64
 
             print("UDF ZIP formatında olabilir, ZIP olarak açılıyor...")
 
             try:
-                # Geçici dizin oluştur
-                temp_dir = tempfile.mkdtemp()
-
-                with zipfile.ZipFile(BytesIO(content)) as zip_ref:
+                # Üyeler diske çıkarılmadan doğrudan ZIP'ten okunur
+                with zipfile.ZipFile(input_path) as zip_ref:
                     file_list = zip_ref.namelist()
                     print(f"ZIP içerisindeki dosyalar: {file_list}")
 
-                    # Tüm dosyaları geçici dizine çıkar
-                    zip_ref.extractall(temp_dir)
-
                     # content.xml içeriğini oku
                     content_xml = None
                     styles_xml = None
@@ -6652,23 +6519,15 @@ def parse_udf_content(input_path):
 </body>
 </html>"""
 
-                # HTML içeriğini geçici dosyaya kaydet
-                with tempfile.NamedTemporaryFile(suffix='.html', delete=False, mode='w', encoding='utf-8') as tmp_html:
-                    tmp_html.write(html_content)
-                    html_path = tmp_html.name
-
-                # Geçici dizini temizle
-                try:
-                    shutil.rmtree(temp_dir)
-                except:
-                    pass
-
-                print(f"UDF içeriği HTML olarak kaydedildi: {html_path}")
-                return html_path
+                logger.debug("UDF içeriği HTML olarak ayrıştırıldı: %s", input_path)
+                return html_content
 
             except zipfile.BadZipFile:
                 print("UDF dosyası geçerli bir ZIP formatında değil")
-        
+
+        with open(input_path, 'rb') as f:
+            content = f.read()
+
         # 2. XML formatı kontrolü
         if b'<?xml' in content or b'<UYAP' in content:
             print("UDF XML formatında olabilir, XML olarak ayrıştırılıyor...")
@@ -6725,13 +6584,8 @@ def parse_udf_content(input_path):
             </html>
             """
             
-            # HTML içeriğini geçici dosyaya kaydet
-            with tempfile.NamedTemporaryFile(suffix='.html', delete=False) as tmp_html:
-                tmp_html.write(html_content.encode('utf-8'))
-                html_path = tmp_html.name
-            
-            print(f"UDF içeriği HTML olarak kaydedildi: {html_path}")
-            return html_path
+            logger.debug("UDF içeriği XML olarak ayrıştırıldı: %s", input_path)
+            return html_content
         
         # 3. Metin formatı kontrolü
         try:
@@ -6775,13 +6629,8 @@ def parse_udf_content(input_path):
                 </html>
                 """
                 
-                # HTML içeriğini geçici dosyaya kaydet
-                with tempfile.NamedTemporaryFile(suffix='.html', delete=False) as tmp_html:
-                    tmp_html.write(html_content.encode('utf-8'))
-                    html_path = tmp_html.name
-                
-                print(f"UDF içeriği HTML olarak kaydedildi: {html_path}")
-                return html_path
+                logger.debug("UDF içeriği metin olarak ayrıştırıldı: %s", input_path)
+                return html_content
         except:
             pass
         
@@ -6837,30 +6686,27 @@ def parse_udf_content(input_path):
         </html>
         """
         
-        # HTML içeriğini geçici dosyaya kaydet
-        with tempfile.NamedTemporaryFile(suffix='.html', delete=False) as tmp_html:
-            tmp_html.write(html_content.encode('utf-8'))
-            html_path = tmp_html.name
-        
-        print(f"UDF içeriği ikili formatta HTML olarak kaydedildi: {html_path}")
-        return html_path
+        logger.debug("UDF formatı tanınamadı, bilgilendirme sayfası döndürülüyor: %s", input_path)
+        return html_content
         
     except Exception as e:
         print(f"UDF dosyası ayrıştırma hatası: {str(e)}")
         return None
 
+udf_preview_cache.init_app(app, render=parse_udf_content)
+
 def convert_udf_to_pdf(input_path):
     """UDF dosyasını PDF'e dönüştürür"""
     try:
-        print(f"UDF dosyasını PDF'e dönüştürme başlatılıyor: {input_path}")
+        logger.debug("UDF dosyasını PDF'e dönüştürme başlatılıyor: %s", input_path)
         
-        # Çıktı için geçici dosya oluştur
-        output_path = os.path.join(tempfile.gettempdir(), 
-                                  f"temp_converted_{int(pytime.time())}.pdf")
+        # Çıktı için geçici dosya oluştur (eşzamanlı dönüşümler çakışmasın diye benzersiz)
+        fd, output_path = tempfile.mkstemp(suffix='.pdf', prefix='temp_converted_')
+        os.close(fd)
         
         # 1. YÖNTEM: UYAP Editör CLI komutunu dene
         try:
-            print("UYAP Editör CLI ile dönüştürme deneniyor...")
+            logger.debug("UYAP Editör CLI ile dönüştürme deneniyor...")
             # UYAP Editör'ün muhtemel konumları
             uyap_editor_paths = [
                 r"C:\Program Files\UYAP\UYAP Editor\UYAPEditor.exe",
@@ -6875,7 +6721,7 @@ def convert_udf_to_pdf(input_path):
                     break
             
             if uyap_exe:
-                print(f"UYAP Editör bulundu: {uyap_exe}")
+                logger.debug("UYAP Editör bulundu: %s", uyap_exe)
                 # UYAP Editör export komut satırı kullanımı (teorik)
                 # UYAP Editör gerçekte böyle bir komut satırı arayüzü sağlamıyor olabilir
                 try:
@@ -6887,17 +6733,17 @@ def convert_udf_to_pdf(input_path):
                         timeout=30
                     )
                     
-                    if result.returncode == 0 and os.path.exists(output_path):
-                        print("UYAP Editör ile dönüştürme başarılı")
+                    if result.returncode == 0 and os.path.getsize(output_path) > 0:
+                        logger.debug("UYAP Editör ile dönüştürme başarılı")
                         return output_path
                 except:
-                    print("UYAP Editör komut satırı dönüştürmesi başarısız")
+                    logger.warning("UYAP Editör komut satırı dönüştürmesi başarısız")
         except Exception as e:
-            print(f"UYAP Editör dönüştürme hatası: {str(e)}")
+            logger.warning("UYAP Editör dönüştürme hatası: %s", e)
         
         # 2. YÖNTEM: LibreOffice ile dönüştürmeyi dene
         try:
-            print("LibreOffice ile dönüştürme deneniyor...")
+            logger.debug("LibreOffice ile dönüştürme deneniyor...")
             soffice_path = None
             if os.name == 'nt':  # Windows
                 # Windows'da olası LibreOffice konumları
@@ -6917,6 +6763,12 @@ def convert_udf_to_pdf(input_path):
                 # Linux/Mac'te soffice genellikle PATH içindedir
                 soffice_path = "/usr/bin/soffice"
                 
+            if libreoffice_pool.available():
+                # Sıcak LibreOffice havuzu (bkz. libreoffice_pool.py); başarısız olursa soğuk soffice denenir
+                if libreoffice_pool.convert(input_path, output_path):
+                    logger.debug("LibreOffice havuzu ile dönüştürme başarılı: %s", output_path)
+                    return output_path
+                logger.warning("LibreOffice havuzu dönüştüremedi, soffice komutu deneniyor: %s", input_path)
             if soffice_path and os.path.exists(soffice_path):
                 # Geçici çalışma dizini oluştur
                 temp_dir = tempfile.mkdtemp()
@@ -6924,13 +6776,14 @@ def convert_udf_to_pdf(input_path):
                 # LibreOffice komutu
                 cmd = [
                     soffice_path,
+                    libreoffice_profile_arg(),
                     '--headless',
                     '--convert-to', 'pdf',
                     '--outdir', temp_dir,
                     input_path
                 ]
                 
-                print(f"LibreOffice komutu çalıştırılıyor: {' '.join(cmd)}")
+                logger.debug("LibreOffice komutu çalıştırılıyor: %s", ' '.join(cmd))
                 process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
                 stdout, stderr = process.communicate()
                 
@@ -6946,24 +6799,24 @@ def convert_udf_to_pdf(input_path):
                         # Geçici dizini temizle
                         shutil.rmtree(temp_dir, ignore_errors=True)
                         
-                        print(f"LibreOffice ile dönüştürme başarılı: {output_path}")
+                        logger.debug("LibreOffice ile dönüştürme başarılı: %s", output_path)
                         return output_path
                     else:
-                        print(f"LibreOffice çıktı dosyası bulunamadı: {converted_path}")
+                        logger.warning("LibreOffice çıktı dosyası bulunamadı: %s", converted_path)
                 else:
-                    print(f"LibreOffice hatası: {stderr.decode()}")
+                    logger.warning("LibreOffice hatası: %s", stderr.decode())
                 
                 # Geçici dizini temizle
                 shutil.rmtree(temp_dir, ignore_errors=True)
         except Exception as e:
-            print(f"LibreOffice ile dönüştürme hatası: {str(e)}")
+            logger.warning("LibreOffice ile dönüştürme hatası: %s", e)
         
         # 3. YÖNTEM: UDF içeriğini HTML olarak ayrıştırıp PDF'e dönüştür
         try:
-            print("UDF içeriğini ayrıştırıp PDF'e dönüştürme deneniyor...")
-            html_path = parse_udf_content(input_path)
+            logger.debug("UDF içeriğini ayrıştırıp PDF'e dönüştürme deneniyor...")
+            html_content = udf_preview_cache.get(input_path)
             
-            if html_path:
+            if html_content:
                 try:
                     # HTML'i PDF'e dönüştürme için wkhtmltopdf kullanan pdfkit'i dene
                     # Bu kısmın çalışması için wkhtmltopdf yüklü olmalı
@@ -6977,23 +6830,21 @@ def convert_udf_to_pdf(input_path):
                         'encoding': 'UTF-8',
                     }
                     
-                    pdfkit.from_file(html_path, output_path, options=pdfkit_options)
-                    
-                    # HTML dosyasını temizle
-                    os.remove(html_path)
+                    pdfkit.from_string(html_content, output_path, options=pdfkit_options)
                     
                     if os.path.exists(output_path) and os.path.getsize(output_path) > 0:
-                        print(f"HTML->PDF dönüşümü başarılı: {output_path}")
+                        logger.debug("HTML->PDF dönüşümü başarılı: %s", output_path)
                         return output_path
                 except Exception as e:
-                    print(f"HTML->PDF dönüşüm hatası: {str(e)}")
+                    logger.warning("HTML->PDF dönüşüm hatası: %s", e)
         except Exception as e:
-            print(f"İçerik ayrıştırma ve PDF dönüşüm hatası: {str(e)}")
+            logger.warning("İçerik ayrıştırma ve PDF dönüşüm hatası: %s", e)
         
-        print("Tüm dönüştürme yöntemleri başarısız oldu")
+        logger.warning("Tüm dönüştürme yöntemleri başarısız oldu")
+        os.remove(output_path)
         return None
     except Exception as e:
-        print(f"Dönüştürme hatası: {str(e)}")
+        logger.error("Dönüştürme hatası: %s", e)
         return None
 
 @app.route('/view_udf_content/<int:document_id>')
@@ -7010,19 +6861,9 @@ def view_udf_content(document_id):
         if extension.lower() != '.udf':
             return "Bu dosya .udf uzantılı değil, görüntülenemez", 400
             
-        # UDF içeriğini HTML olarak ayrıştır
-        html_path = parse_udf_content(filepath)
-        if html_path:
-            # HTML içeriğini doğrudan döndür
-            with open(html_path, 'r', encoding='utf-8') as f:
-                html_content = f.read()
-                
-            # HTML dosyasını temizle
-            try:
-                os.remove(html_path)
-            except:
-                pass
-                
+        # UDF içeriğini HTML olarak ayrıştır (dosya değişmedikçe önbellekten)
+        html_content = udf_preview_cache.get(filepath)
+        if html_content:
             return html_content
             
         return "UDF içeriği ayrıştırılamadı", 500
@@ -7044,19 +6885,9 @@ def direct_view_udf(document_id):
             
         # UDF dosyasını ayrıştır ve HTML olarak göster
         print(f"UDF içeriği doğrudan ayrıştırılıyor: {filepath}")
-        html_path = parse_udf_content(filepath)
+        html_content = udf_preview_cache.get(filepath)
         
-        if html_path:
-            # HTML içeriğini oku
-            with open(html_path, 'r', encoding='utf-8') as f:
-                html_content = f.read()
-                
-            # HTML dosyasını temizle
-            try:
-                os.remove(html_path)
-            except:
-                pass
-                
+        if html_content:
             # HTML içeriğini doğrudan döndür
             return Response(html_content, mimetype='text/html')
         else:
@@ -7077,19 +6908,9 @@ def direct_view_udf_dilekce(dilekce_id):
             
         # UDF dosyasını ayrıştır ve HTML olarak göster
         print(f"UDF dilekçe içeriği doğrudan ayrıştırılıyor: {filepath}")
-        html_path = parse_udf_content(filepath)
+        html_content = udf_preview_cache.get(filepath)
         
-        if html_path:
-            # HTML içeriğini oku
-            with open(html_path, 'r', encoding='utf-8') as f:
-                html_content = f.read()
-                
-            # HTML dosyasını temizle
-            try:
-                os.remove(html_path)
-            except:
-                pass
-                
+        if html_content:
             # HTML içeriğini doğrudan döndür
             return Response(html_content, mimetype='text/html')
         else:
@@ -7099,129 +6920,23 @@ def direct_view_udf_dilekce(dilekce_id):
         return f"UDF dosyası görüntülenirken hata oluştu: {str(e)}", 500
 
 def parse_tarifeler():
-    # Dosya yolunu güvenli şekilde ayarla
-    tmp_filepath = '/tmp/tarifeler.txt'
-    firstwebsite_filepath = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'tarifeler.txt')
-    parent_filepath = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'tarifeler.txt')
-
-    # Dosya öncelik sırası: /tmp > firstwebsite > parent
-    # /tmp dosyası varsa ve son 24 saat içinde değiştirilmişse, onu kullan (en güncel)
-    if os.path.exists(tmp_filepath):
-        filepath = tmp_filepath
-        logging.info(f"Tarifeler /tmp klasöründen okunuyor: {tmp_filepath}")
-    elif os.path.exists(firstwebsite_filepath):
-        filepath = firstwebsite_filepath
-    elif os.path.exists(parent_filepath):
-        filepath = parent_filepath
-    else:
-        # Hiçbir dosya yoksa varsayılan olarak parent kullan
-        filepath = parent_filepath
-    
-    # Varsayılan olarak boş ve geçerli bir yapı
-    tarifeler = {
-        "İstanbul Barosu": [],
-        "TBB": [],
-        "kaplan_danismanlik_tarifesi": {"kategoriler": []}
-    }
-    
-    grup_map = {
-        "ISTBARO_2025": "İstanbul Barosu",
-        "TBB_2025": "TBB"
-    }
-
-    try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            lines = f.readlines()
-
-        kaplan_danismanlik_json_str = ""
-        in_kaplan_danismanlik_json_block = False
-
-        for line_num, line_content_raw in enumerate(lines):
-            line_content = line_content_raw.strip()
-
-            if line_content.startswith("KAPLAN HUKUK DANIŞMANLIK ÜCRET TARİFESİ START"):
-                in_kaplan_danismanlik_json_block = True
-                kaplan_danismanlik_json_str = ""  # Bloğa girildiğinde önceki içeriği sıfırla
-                continue
-            elif line_content.startswith("KAPLAN HUKUK DANIŞMANLIK ÜCRET TARİFESİ END"):
-                in_kaplan_danismanlik_json_block = False
-                if kaplan_danismanlik_json_str:
-                    try:
-                        parsed_json = json.loads(kaplan_danismanlik_json_str)
-                        if isinstance(parsed_json, dict) and "kategoriler" in parsed_json and isinstance(parsed_json["kategoriler"], list):
-                            tarifeler["kaplan_danismanlik_tarifesi"] = parsed_json
-                        else:
-                            logging.warning(
-                                f"Kaplan Danışmanlık JSON formatı beklenmiyor (kategoriler listesi yok) tarifeler.txt okunurken. Satır: ~{line_num}. "
-                                f"İçerik başlangıcı: {kaplan_danismanlik_json_str[:200]}..."
-                            )
-                            # Varsayılan boş değer zaten atanmış durumda
-                    except json.JSONDecodeError as e:
-                        logging.error(
-                            f"Kaplan Danışmanlık JSON parse edilemedi tarifeler.txt okunurken: {e}. Satır: ~{line_num}. "
-                            f"İçerik başlangıcı: {kaplan_danismanlik_json_str[:200]}..."
-                        )
-                        # Varsayılan boş değer zaten atanmış durumda
-                kaplan_danismanlik_json_str = "" # Bloğun sonunda string'i temizle
-                continue
-
-            if in_kaplan_danismanlik_json_block:
-                kaplan_danismanlik_json_str += line_content_raw # Orijinal satırları (newline dahil) birleştir
-                continue
-
-            # START/END bloğu dışındaki satırlar (Yorumlar ve boş satırlar hariç)
-            if not line_content or line_content.startswith("#"):
-                continue
-
-            parts = [part.strip() for part in line_content.split('|')]
-            if len(parts) < 7:
-                logging.warning(f"Uyarı: Satır {line_num + 1} ({filepath}) yetersiz bölüm içeriyor ({len(parts)}), atlanıyor: {line_content}")
-                continue
-
-            tarife_grubu_txt, kategori_adi_txt, _, hizmet_adi_txt, temel_ucret_txt, _, birim_txt, *ek_not_parts = parts
-            ek_not_txt = ek_not_parts[0] if ek_not_parts and ek_not_parts[0] else None
-            
-            current_group_key = grup_map.get(tarife_grubu_txt)
-            if not current_group_key:
-                # KAPLAN_OZEL satırları artık START/END bloğunda JSON olarak yönetildiği için burada işlenmemeli.
-                if tarife_grubu_txt.upper() != 'KAPLAN_OZEL':
-                     logging.warning(f"Uyarı: Satır {line_num + 1} ({filepath})'deki tarife grubu '{tarife_grubu_txt}' tanınmıyor, atlanıyor.")
-                continue
-
-            kategori_obj = next((kat for kat in tarifeler[current_group_key] if kat["kategori"] == kategori_adi_txt), None)
-            
-            if kategori_obj is None:
-                kategori_obj = {"kategori": kategori_adi_txt, "items": []}
-                tarifeler[current_group_key].append(kategori_obj)
-
-            item = {
-                "hizmet_adi": hizmet_adi_txt,
-                "temel_ucret": temel_ucret_txt,
-                "original_ucret_str": temel_ucret_txt # JS'nin parse etmesi için orijinal string
-            }
-            if birim_txt and birim_txt.upper() not in ["TL", "TRY", ""]:
-                item["birim"] = birim_txt
-            if ek_not_txt:
-                item["ek_not"] = ek_not_txt
-            
-            kategori_obj["items"].append(item)
-
-    except FileNotFoundError:
-        logging.error(f"Hata: Tarife dosyası bulunamadı: {filepath}")
-    except Exception as e:
-        import traceback
-        logging.error(f"Hata: Tarife dosyası okunurken/işlenirken genel bir hata oluştu ({filepath}): {e}\\n{traceback.format_exc()}")
-    
-    return tarifeler
+    """Ücret tarifeleri; tarifeler.txt önbellekten okunur (bkz. reference_data.py).
+    Çağıranın değiştirebileceği bağımsız bir kopya döndürür."""
+    return json.loads(tarife_file.get().json)
 
 @app.route('/api/tarifeler')
 @login_required
 @permission_required('ucret_tarifeleri')
 def api_tarifeler():
-    data = parse_tarifeler()
-    # parse_tarifeler artık her zaman bir dict döndürdüğü için error kontrolüne gerek yok,
-    # en kötü ihtimalle boş tarifeler döner.
-    return jsonify(data)
+    # Önbellekteki hazır JSON döner; dosya yoksa en kötü ihtimalle boş tarifeler döner.
+    return reference_json_response(tarife_file.get())
+
+@app.route('/api/adliyeler')
+@login_required
+def api_adliyeler():
+    """Şehir -> adliyeler eşlemesi (adliyelist.txt değişene kadar aynı ETag)"""
+    _, _, courthouse_data = get_courthouses()
+    return reference_json_response(courthouse_data, max_age=86400)
 
 @app.route('/api/kaydet_kaplan_danismanlik_tarife', methods=['POST'])
 @login_required
@@ -7350,6 +7065,9 @@ def kaydet_kaplan_danismanlik_tarife():
         if not write_success:
             return jsonify({"success": False, "error": "Dosya yazma işlemi tamamlanamadı."}), 500
 
+        # Bu süreçteki önbelleği hemen boşalt (diğer worker'lar mtime değişiminden anlar)
+        tarife_file.invalidate()
+
         log_activity("Tarife Güncelleme", f"Kaplan Hukuk Danışmanlık Ücret Tarifesi güncellendi.", current_user.id)
         return jsonify({"success": True, "message": "Kaplan Hukuk Danışmanlık Tarifesi başarıyla güncellendi."})
 
@@ -7570,13 +7288,8 @@ def odeme_belge_yukle():
         original_filename = secure_filename(file.filename)
         unique_filename = f"{client_id}_{int(pytime.time())}_{original_filename}"
 
-        # Klasör oluştur
-        payment_documents_dir = os.path.join(app.config['UPLOAD_FOLDER'], 'payment_documents')
-        os.makedirs(payment_documents_dir, exist_ok=True)
-
-        # Dosyayı kaydet
-        filepath = os.path.join(payment_documents_dir, unique_filename)
-        file.save(filepath)
+        # Dosyayı içerik adresli depoya kaydet (aynı dekont/makbuz tek kopya saklanır)
+        filepath = blob_store.save(file)
 
         # Veritabanına kaydet
         new_document = PaymentDocument(
@@ -7584,7 +7297,7 @@ def odeme_belge_yukle():
             document_type=document_type,
             document_name=document_name,
             filename=unique_filename,
-            filepath=f"payment_documents/{unique_filename}",
+            filepath=filepath,
             user_id=current_user.id
         )
         db.session.add(new_document)
@@ -7623,10 +7336,10 @@ def odeme_belge_sil(document_id):
         if not document:
             return jsonify({'success': False, 'message': 'Belge bulunamadı'}), 404
 
-        # Dosyayı sil
+        # Dosyayı sil (depodaki paylaşılan dosyalar referans sayısıyla silinir)
         try:
             full_filepath = os.path.join(app.config['UPLOAD_FOLDER'], document.filepath)
-            if os.path.exists(full_filepath):
+            if not is_blob(document.filepath) and os.path.exists(full_filepath):
                 os.remove(full_filepath)
         except Exception as e:
             print(f"Dosya silinirken hata: {e}")
@@ -8223,21 +7936,13 @@ def api_ornek_dilekce_ekle():
         if not file_ext and '.' in file.filename:
             original_filename += '.' + file.filename.rsplit('.', 1)[1].lower()
         
-        # Benzersiz dosya adı oluştur (kategori adı ve zaman damgası ile)
-        # Örn: ihtarnameler_1700000000_ornek_ihtar.docx
-        benzersiz_dosya_adi_on_eki = secure_filename(kategori.ad.replace(' ', '_').lower())
-        benzersiz_dosya_adi = f"{benzersiz_dosya_adi_on_eki}_{int(pytime.time())}_{original_filename}"
-        
-        # Yükleme klasörünü oluştur (eğer yoksa)
+        # Dosyayı örnek dilekçe klasöründeki içerik adresli depoya kaydet
         upload_klasoru = app.config['ORNEK_DILEKCE_UPLOAD_FOLDER']
-        os.makedirs(upload_klasoru, exist_ok=True)
-        
-        file_path = os.path.join(upload_klasoru, benzersiz_dosya_adi)
-        file.save(file_path)
+        dosya_yolu = blob_store.save(file, upload_klasoru)
 
         yeni_dilekce = OrnekDilekce(
             ad=original_filename, # Kullanıcının verdiği veya orijinal dosya adı
-            dosya_yolu=benzersiz_dosya_adi, # Kaydedilen benzersiz ad
+            dosya_yolu=dosya_yolu, # Klasöre göreli blob yolu
             kategori_id=kategori_id,
             user_id=current_user.id
         )
@@ -8261,12 +7966,7 @@ def api_ornek_dilekce_ekle():
         }), 201
     except Exception as e:
         db.session.rollback()
-        # Hata durumunda yüklenen dosyayı silmeyi deneyebiliriz
-        if 'file_path' in locals() and os.path.exists(file_path):
-            try:
-                os.remove(file_path)
-            except:
-                pass # Silme hatasını yoksay
+        # Depodaki dosya başka kayıtlarla paylaşılıyor olabilir; sahipsiz kalırsa uzlaştırma işi siler
         return jsonify({'success': False, 'message': str(e)}), 500
 
 @app.route('/api/ornek_dilekceler', methods=['GET'])
@@ -8705,8 +8405,8 @@ def api_ornek_dilekce_sil(dilekce_id):
         kategori_adi = dilekce.kategori.ad
 
         db.session.delete(dilekce)
-        # Veritabanından silme başarılı olursa dosyayı da sil
-        if os.path.exists(dosya_yolu):
+        # Veritabanından silme başarılı olursa dosyayı da sil (depodaki dosyalar referans sayısıyla silinir)
+        if not is_blob(dilekce.dosya_yolu) and os.path.exists(dosya_yolu):
             try:
                 os.remove(dosya_yolu)
             except OSError as e:
@@ -8852,9 +8552,9 @@ def yargi_kararlari_arama():
 def api_yargi_arama():
     """Yargı kararları arama API endpoint'i"""
     try:
-        print(f"API çağrısı alındı: {request.method}")  # Debug
+        logger.debug("API çağrısı alındı: %s", request.method)
         data = request.get_json()
-        print(f"Alınan veri: {data}")  # Debug
+        logger.debug("Alınan veri: %s", data)
         
         if not data:
             return jsonify({
@@ -8870,11 +8570,26 @@ def api_yargi_arama():
         end_date = data.get('end_date', '')
         page_number = int(data.get('page_number', 1))
         page_size = int(data.get('page_size', 10))
+        no_cache = bool(data.get('no_cache', False))
         
-        print(f"Arama parametreleri: keyword={keyword}, court_type={court_type}")  # Debug
+        logger.debug("Arama parametreleri: keyword=%s, court_type=%s", keyword, court_type)
         
         # Arama servisini kullan
-        from yargi_integration import search_yargi_kararlari
+        from yargi_integration import search_yargi_kararlari, search_yargi_kararlari_offline
+        
+        if data.get('mode') == 'offline':
+            # Daha önce açılmış kararlar üzerinde yerel tam metin araması
+            search_results = search_yargi_kararlari_offline(
+                keyword=keyword,
+                court_type=court_type,
+                page_number=page_number,
+                page_size=page_size
+            )
+            return jsonify({
+                'success': True,
+                'data': search_results,
+                'pagination': search_results.get('pagination', {})
+            })
         
         search_results = search_yargi_kararlari(
             keyword=keyword,
@@ -8885,7 +8600,8 @@ def api_yargi_arama():
             start_date=start_date,
             end_date=end_date,
             page_number=page_number,
-            page_size=page_size
+            page_size=page_size,
+            no_cache=no_cache
         )
         
         # Sonuçları JSON formatına çevir - doğrudan döndür
@@ -8907,6 +8623,71 @@ def api_yargi_arama():
             'error': 'Arama işlemi sırasında bir hata oluştu.'
         }), 500
 
+@app.route('/api/yargi_arama_stream', methods=['POST'])
+@login_required
+@csrf.exempt
+def api_yargi_arama_stream():
+    """Yargı kararları arama - her mahkemenin sonucunu hazır olur olmaz NDJSON satırı olarak gönderir"""
+    data = request.get_json()
+    # Anahtar kelime boş olabilir: /api/yargi_arama gibi yalnızca filtrelerle de aranır
+    if not data:
+        return jsonify({
+            'success': False,
+            'error': 'Veri alınamadı.'
+        }), 400
+    
+    from yargi_integration import stream_yargi_kararlari
+    from yargi_cache import to_plain
+    
+    keyword = data.get('keyword', '')
+    events = stream_yargi_kararlari(
+        keyword=keyword,
+        court_type=data.get('court_type', 'all'),
+        court_unit=data.get('court_unit', ''),
+        case_year=data.get('case_year', ''),
+        decision_year=data.get('decision_year', ''),
+        start_date=data.get('start_date', ''),
+        end_date=data.get('end_date', ''),
+        page_number=int(data.get('page_number', 1)),
+        page_size=int(data.get('page_size', 10)),
+        no_cache=bool(data.get('no_cache', False))
+    )
+    
+    # Aktivite logla (akış başlamadan, istek bağlamı içinde)
+    log_activity('yargi_arama', f'Yargı kararları arandı: {keyword}', current_user.id)
+    
+    def generate():
+        try:
+            for event in events:
+                yield json.dumps(to_plain(event), ensure_ascii=False) + '\n'
+        except Exception as e:
+            logger.error(f"Yargı akış arama hatası: {e}")
+            yield json.dumps({'type': 'error', 'error': 'Arama işlemi sırasında bir hata oluştu.'}) + '\n'
+    
+    response = Response(stream_with_context(generate()), mimetype='application/x-ndjson')
+    # Nginx'in yanıtı tamponlamasını engelle, satırlar anında istemciye ulaşsın
+    response.headers['X-Accel-Buffering'] = 'no'
+    response.headers['Cache-Control'] = 'no-cache'
+    return response
+
+@app.route('/api/yargi_onbellek_istatistikleri')
+@login_required
+@admin_required
+def api_yargi_onbellek_istatistikleri():
+    """Yargı arama önbelleğinin hit/miss istatistiklerini döndürür"""
+    from yargi_integration import get_search_cache_stats
+    return jsonify({'success': True, 'stats': get_search_cache_stats()})
+
+@app.route('/api/belge_donusum_istatistikleri')
+@login_required
+@admin_required
+def api_belge_donusum_istatistikleri():
+    """Belge dönüşüm kuyruğu ve LibreOffice havuzunun iş/gecikme istatistiklerini döndürür"""
+    return jsonify({
+        'success': True,
+        'stats': {'queue': document_converter.stats(), 'libreoffice': libreoffice_pool.stats()}
+    })
+
 @app.route('/api/yargi_mahkeme_secenekleri')
 @login_required
 @csrf.exempt
@@ -10373,12 +10154,9 @@ def update_case_basic_info():
 
 @app.route('/login', methods=['GET', 'POST'])
 def login():
-    print("=" * 50)
-    print("LOGIN FUNCTION CALLED!!!")
-    print("=" * 50)
-    print(f"DEBUG LOGIN FUNCTION CALLED - Method: {request.method}")
+    logger.debug("Login isteği - Method: %s", request.method)
     if current_user.is_authenticated:
-        print("DEBUG - User already authenticated, redirecting")
+        logger.debug("User already authenticated, redirecting")
         return redirect(url_for('anasayfa'))
     
     # GET request'te session'ı temizleme - kapatıldı
@@ -10388,39 +10166,34 @@ def login():
     #     session.pop('next_page', None)
         
     if request.method == 'POST':
-        print("DEBUG - POST request received")
+        logger.debug("POST request received")
         email = request.form.get('email')
         password = request.form.get('password')
         totp_code = request.form.get('totp_code')
         csrf_token = request.form.get('csrf_token')
         
-        print(f"DEBUG LOGIN - Email: {email}")
-        print(f"DEBUG LOGIN - Password provided: {password is not None}")
-        print(f"DEBUG LOGIN - TOTP code: {totp_code}")
-        print(f"DEBUG LOGIN - CSRF token: {csrf_token}")
-        print(f"DEBUG LOGIN - Session before: {dict(session)}")
-        print(f"DEBUG LOGIN - Form data: {dict(request.form)}")
+        logger.debug("Email: %s", email)
+        logger.debug("Password provided: %s", password is not None)
         
         # 2FA doğrulama aşaması
         if 'temp_user_id' in session and totp_code:
-            print("DEBUG - 2FA doğrulama aşaması")
+            logger.debug("2FA doğrulama aşaması")
             try:
                 import pyotp
                 user = User.query.get(session['temp_user_id'])
-                print(f"DEBUG - User found: {user is not None}")
+                logger.debug("User found: %s", user is not None)
                 
                 if user and user.permissions and user.permissions.get('two_factor_secret'):
                     secret = user.permissions['two_factor_secret']
                     totp = pyotp.TOTP(secret)
                     
-                    print(f"DEBUG - Secret exists, verifying code {totp_code}")
-                    print(f"DEBUG - Current time: {totp.now()}")
+                    logger.debug("Secret exists, verifying code")
                     verification_result = totp.verify(totp_code, valid_window=1)
-                    print(f"DEBUG - Verification result: {verification_result}")
+                    logger.debug("Verification result: %s", verification_result)
                     
                     if verification_result:
                         # 2FA doğru, giriş yap
-                        print("DEBUG - 2FA verification successful, logging in user")
+                        logger.debug("2FA verification successful, logging in user")
                         login_user(user)
                         next_page = session.pop('next_page', url_for('anasayfa'))
                         session.pop('temp_user_id', None)
@@ -10432,22 +10205,20 @@ def login():
                             user_id=user.id
                         )
                         
-                        print(f"DEBUG - Redirecting to: {next_page}")
+                        logger.debug("Redirecting to: %s", next_page)
                         return redirect(next_page)
                     else:
-                        print("DEBUG - 2FA verification failed")
-                        print(f"DEBUG - Expected code: {totp.now()}")
-                        print(f"DEBUG - Received code: {totp_code}")
+                        logger.warning("2FA verification failed")
                         flash('Geçersiz doğrulama kodu.', 'error')
                         return render_template('auth.html', require_2fa=True, user_email=user.email)
                 else:
-                    print("DEBUG - 2FA secret not found")
+                    logger.warning("2FA secret not found")
                     flash('2FA yapılandırma hatası.', 'error')
                     session.pop('temp_user_id', None)
                     session.pop('next_page', None)
                     return render_template('auth.html')
             except Exception as e:
-                print(f"DEBUG - 2FA exception: {str(e)}")
+                logger.warning("2FA exception: %s", e)
                 flash('2FA doğrulama sırasında hata oluştu.', 'error')
                 session.pop('temp_user_id', None)
                 session.pop('next_page', None)
@@ -10455,24 +10226,23 @@ def login():
         
         # Normal email/password doğrulama
         if email and password:
-            print("DEBUG - Normal email/password doğrulama")
+            logger.debug("Normal email/password doğrulama")
             user = User.query.filter_by(email=email).first()
             if user and user.check_password(password):
-                print(f"DEBUG - Password check passed for user: {user.email}")
+                logger.debug("Password check passed for user: %s", user.email)
                 if not user.is_approved and not user.is_admin:
                     flash('Hesabınız henüz onaylanmamış. Lütfen yönetici onayını bekleyin.', 'warning')
                     return render_template('auth.html')
                 
                 # 2FA kontrolü
                 if user.permissions and hasattr(user.permissions, 'get') and user.permissions.get('two_factor_auth', False):
-                    print("DEBUG - 2FA required, setting session")
+                    logger.debug("2FA required, setting session")
                     # 2FA etkinse, kullanıcıyı session'da sakla ve 2FA sayfasına yönlendir
                     session['temp_user_id'] = user.id
                     session['next_page'] = request.args.get('next') or url_for('anasayfa')
-                    print(f"DEBUG - Session after 2FA setup: {dict(session)}")
                     return render_template('auth.html', require_2fa=True, user_email=user.email)
                 else:
-                    print("DEBUG - No 2FA required, direct login")
+                    logger.debug("No 2FA required, direct login")
                     # 2FA yoksa direkt giriş yap
                     login_user(user)
                     next_page = request.args.get('next')
@@ -10486,14 +10256,14 @@ def login():
                     
                     return redirect(next_page or url_for('anasayfa'))
             else:
-                print("DEBUG - Password check failed")
+                logger.warning("Password check failed")
                 # Kullanıcı var mı kontrol et
                 if user and not user.is_approved and not user.is_admin:
                     flash('Hesabınız henüz onaylanmamış. Lütfen yönetici onayını bekleyin.', 'warning')
                 else:
                     flash('Geçersiz e-posta veya şifre.', 'error')
     
-    print("DEBUG - Rendering auth.html")
+    logger.debug("Rendering auth.html")
     return render_template('auth.html')
 
 @app.route('/vekaletname')
@@ -10752,14 +10522,9 @@ def import_from_uyap():
         if not data:
             return jsonify({'success': False, 'message': 'Veri gönderilmedi'}), 400
 
-        # Debug log (emoji hatalarını önlemek için ensure_ascii=True)
-        try:
-            print("\n" + "="*80)
-            print("UYAP'TAN GELEN HAM VERİ:")
-            print(json.dumps(data, indent=2, ensure_ascii=True))
-            print("="*80 + "\n")
-        except Exception as e:
-            print(f"Debug log error: {e}")
+        # Ham veri dökümü yalnızca DEBUG açıkken ve LOG_DEBUG_SAMPLE_RATE oranında yazılır
+        # (emoji hatalarını önlemek için ensure_ascii=True)
+        debug_dump(logger, "UYAP'TAN GELEN HAM VERİ", lambda: json.dumps(data, indent=2, ensure_ascii=True))
 
         # Zorunlu alanları kontrol et
         required_fields = ['file-type', 'year', 'case-number']
@@ -10884,7 +10649,7 @@ def import_from_uyap():
                     )
                     db.session.add(party_assoc)
                 except Exception as e:
-                    print(f"Vekil eklenirken hata: {str(e)}")
+                    logger.warning("Vekil eklenirken hata: %s", e)
                     continue
 
         db.session.commit()
@@ -10938,7 +10703,7 @@ def import_from_uyap():
                         related_event_id=calendar_event.id
                     )
                 except Exception as e:
-                    print(f"Duruşma takvime eklenirken hata: {str(e)}")
+                    logger.warning("Duruşma takvime eklenirken hata: %s", e)
                     pass
 
         return jsonify({
@@ -10949,7 +10714,7 @@ def import_from_uyap():
 
     except Exception as e:
         db.session.rollback()
-        print(f"UYAP import error: {str(e)}")
+        logger.error("UYAP import error: %s", e)
         import traceback
         traceback.print_exc()
         return jsonify({
@@ -11004,9 +10769,9 @@ def upload_uyap_document(case_id):
 
         # Upload dizinleri (öncelik sırasıyla dene)
         upload_attempts = [
-            {'path': 'uploads/documents/', 'db_path': 'documents/{filename}'},
-            {'path': 'firstwebsite/static/uploads/documents/', 'db_path': 'static/uploads/documents/{filename}'},
-            {'path': 'firstwebsite/uploads/documents/', 'db_path': 'uploads/documents/{filename}'}
+            {'path': os.path.join(app.config['UPLOAD_FOLDER'], 'documents')},
+            {'path': 'firstwebsite/static/uploads/documents/'},
+            {'path': 'firstwebsite/uploads/documents/'}
         ]
 
         file_saved = False
@@ -11020,7 +10785,7 @@ def upload_uyap_document(case_id):
                 file_path = os.path.join(upload_dir, unique_filename)
                 file.save(file_path)
 
-                db_filepath = attempt['db_path'].format(filename=unique_filename)
+                db_filepath = canonical_path(file_path)
                 file_saved = True
                 print(f"Belge kaydedildi: {file_path}")
                 break
@@ -0,0 +1,274 @@
+"""
+Karar metni temizleyici karşılaştırması
+yargi_text içindeki derlenmiş temizleyiciyi eski (yargi_integration içindeki)
+uygulamanın birebir kopyasıyla kaydedilmiş karar HTML örnekleri üzerinde
+karşılaştırır: çıktıların aynı olduğunu doğrular ve süreleri raporlar.
+
+    python benchmarks/bench_text_cleaner.py
+    python benchmarks/bench_text_cleaner.py --scale 200 --repeat 5
+    python benchmarks/bench_text_cleaner.py --fixtures /yol/kararlar --store
+
+--scale her örneği N kez art arda ekleyerek büyük (yüzlerce KB) kararları taklit
+eder; --store yerel karar deposundaki (YARGI_DECISION_STORE_PATH) metinleri de
+örneklere katar.
+"""
+
+import os
+import re
+import sys
+import html
+import time
+import argparse
+
+BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, BASE_DIR)
+
+from yargi_text import clean_decision_text, clean_decision_text_light  # noqa: E402
+
+DEFAULT_FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures', 'decisions')
+
+
+# ---------------------------------------------------------------------------
+# Eski uygulama (karşılaştırma referansı, değiştirmeyin)
+# ---------------------------------------------------------------------------
+
+def legacy_clean_decision_text(text: str) -> str:
+    """Karar metnini temizle ve düzenle - geliştirilmiş versiyon"""
+    if not text:
+        return ""
+
+    import re
+
+    # HTML entity'leri decode et
+    text = html.unescape(text)
+
+    # Gereksiz HTML taglerini temizle (eğer varsa)
+    text = re.sub(r'<[^>]+>', '', text)
+
+    # Fazla boşlukları temizle
+    text = re.sub(r'\s+', ' ', text)
+
+    # Çoklu satır sonlarını normalize et
+    text = re.sub(r'\n\s*\n\s*\n+', '\n\n', text)
+
+    # Satırları işle
+    lines = text.split('\n')
+    cleaned_lines = []
+
+    # Gereksiz satırları filtrele
+    skip_patterns = [
+        r'^(ana sayfa|menü|giriş|çıkış|login|logout).*$',
+        r'^(copyright|©|tüm hakları).*$',
+        r'^(javascript|cookie|çerez).*$',
+        r'^(sayfa|page)\s*\d+.*$',
+        r'^(http|www\.|ftp).*$',
+        r'^\s*[\d\.\-\s]+$',  # Sadece sayı ve nokta içeren satırlar
+        r'^.{1,10}$',  # Çok kısa satırlar (10 karakter altı)
+        r'^(.*menü.*|.*navigation.*|.*footer.*|.*header.*)$',
+        r'^(.*bilgi bankası.*|.*uyap.*|.*yargıtay.*|.*danıştay.*)(?!.*karar).*$'  # Site adları ama karar içermeyen
+    ]
+
+    for line in lines:
+        line = line.strip()
+
+        # Boş satırları atla
+        if not line:
+            continue
+
+        # Skip pattern'leri kontrol et
+        should_skip = False
+        for pattern in skip_patterns:
+            if re.match(pattern, line, re.IGNORECASE):
+                should_skip = True
+                break
+
+        if not should_skip:
+            # Karar metni için pozitif göstergeler
+            positive_indicators = [
+                'karar', 'hüküm', 'gerekçe', 'mahkeme', 'dava', 'esas', 'sonuç', 
+                'davacı', 'davalı', 'başvuran', 'müdahil', 'temyiz', 'istinaf',
+                'dosya', 'duruşma', 'delil', 'tanık', 'bilirkişi', 'keşif',
+                'hukuki', 'kanun', 'madde', 'fıkra', 'bent', 'yönetmelik',
+                'tebliğ', 'icra', 'infaz', 'takip', 'haciz', 'satış'
+            ]
+
+            # Eğer satır yeterince uzunsa veya pozitif gösterge içeriyorsa ekle
+            if len(line) > 15 or any(indicator in line.lower() for indicator in positive_indicators):
+                cleaned_lines.append(line)
+
+    # Temizlenmiş satırları birleştir
+    text = '\n'.join(cleaned_lines)
+
+    # Tekrarlayan cümleleri temizle
+    sentences = text.split('.')
+    unique_sentences = []
+    seen_sentences = set()
+
+    for sentence in sentences:
+        sentence = sentence.strip()
+        if len(sentence) > 20:  # Çok kısa cümleleri atla
+            sentence_normalized = re.sub(r'\s+', ' ', sentence.lower())
+            if sentence_normalized not in seen_sentences:
+                seen_sentences.add(sentence_normalized)
+                unique_sentences.append(sentence)
+
+    text = '. '.join(unique_sentences)
+
+    # Özel karakterleri normalize et
+    text = re.sub(r'[""''‚„]', '"', text)  # Tırnak işaretlerini normalize et
+    text = re.sub(r'[–—]', '-', text)  # Tire işaretlerini normalize et
+
+    # Son temizlik
+    text = re.sub(r'\s+', ' ', text).strip()
+
+    # Eğer metin çok kısaysa ve sadece navigasyon içeriyorsa boş döndür
+    if len(text) < 100:
+        navigation_words = ['menü', 'sayfa', 'giriş', 'çıkış', 'ana sayfa', 'javascript', 'cookie']
+        if any(word in text.lower() for word in navigation_words):
+            return ""
+
+    return text
+
+
+def legacy_clean_decision_text_light(text: str) -> str:
+    """Karar metnini hafif temizle - daha az agresif filtreleme"""
+    if not text:
+        return ""
+
+    import re
+
+    # Orijinal metin uzunluğunu kaydet
+    original_length = len(text)
+
+    # HTML entity'leri decode et
+    text = html.unescape(text)
+
+    # Gereksiz HTML taglerini temizle (eğer varsa)
+    text = re.sub(r'<[^>]+>', '', text)
+
+    # Fazla boşlukları temizle
+    text = re.sub(r'\s+', ' ', text)
+
+    # Çoklu satır sonlarını normalize et
+    text = re.sub(r'\n\s*\n\s*\n+', '\n\n', text)
+
+    # Eğer metin çok uzun ise (5000+ karakter) filtreleme yap, yoksa minimal işlem
+    if original_length > 5000:
+        # Satırları işle - sadece çok kısa satırları filtrele
+        lines = text.split('\n')
+        cleaned_lines = []
+
+        # Sadece çok gereksiz satırları filtrele
+        skip_patterns = [
+            r'^(javascript|cookie|çerez).*$',
+            r'^(http|www\.|ftp).*$',
+            r'^\s*[\d\.\-\s]{1,5}$',  # Sadece çok kısa sayı dizileri
+            r'^.{1,3}$'  # Çok kısa satırlar (3 karakter altı)
+        ]
+
+        for line in lines:
+            line = line.strip()
+
+            # Boş satırları atla
+            if not line:
+                continue
+
+            # Sadece gerçekten gereksiz olan satırları skip et
+            should_skip = False
+            for pattern in skip_patterns:
+                if re.match(pattern, line, re.IGNORECASE):
+                    should_skip = True
+                    break
+
+            if not should_skip:
+                cleaned_lines.append(line)
+
+        # Temizlenmiş satırları birleştir
+        text = '\n'.join(cleaned_lines)
+
+    # Özel karakterleri normalize et
+    text = re.sub(r'[""''‚„]', '"', text)  # Tırnak işaretlerini normalize et
+    text = re.sub(r'[–—]', '-', text)  # Tire işaretlerini normalize et
+
+    # Son temizlik
+    text = re.sub(r'\s+', ' ', text).strip()
+
+    # Eğer temizleme sonucu metin çok kısaldıysa ve orijinal uzunsa, daha az agresif temizle
+    if len(text) < 100 and original_length > 1000:
+        # Minimal temizlik yap
+        text = html.unescape(text) if text else ""
+        text = re.sub(r'<[^>]+>', '', text)
+        text = re.sub(r'\s+', ' ', text).strip()
+
+    return text
+
+
+# ---------------------------------------------------------------------------
+# Karşılaştırma
+# ---------------------------------------------------------------------------
+
+def load_corpus(fixtures_dir, scale, include_store):
+    corpus = []
+    if os.path.isdir(fixtures_dir):
+        for name in sorted(os.listdir(fixtures_dir)):
+            path = os.path.join(fixtures_dir, name)
+            if os.path.isfile(path):
+                with open(path, 'r', encoding='utf-8') as f:
+                    corpus.append((name, f.read()))
+    if include_store:
+        from yargi_cache import create_decision_store_from_env
+        store = create_decision_store_from_env()
+        if store is not None:
+            for record in store.iter_records():
+                corpus.append((f"store:{record['court_type']}/{record['document_id']}", record['content']))
+    if scale > 1:
+        corpus += [(f"{name} x{scale}", "\n".join([text] * scale)) for name, text in list(corpus)]
+    return corpus
+
+
+def timed(func, corpus, repeat):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _, text in corpus:
+            func(text)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Karar metni temizleyici karşılaştırması")
+    parser.add_argument('--fixtures', default=DEFAULT_FIXTURES, help="Karar HTML örneklerinin bulunduğu klasör")
+    parser.add_argument('--scale', type=int, default=100, help="Büyük karar taklidi için tekrar sayısı")
+    parser.add_argument('--repeat', type=int, default=3, help="Ölçüm tekrarı (en iyi süre raporlanır)")
+    parser.add_argument('--store', action='store_true', help="Yerel karar deposundaki metinleri de kullan")
+    args = parser.parse_args()
+
+    corpus = load_corpus(args.fixtures, args.scale, args.store)
+    if not corpus:
+        print("Örnek bulunamadı.")
+        return 1
+    total_kb = sum(len(text) for _, text in corpus) / 1024
+    print(f"{len(corpus)} örnek, toplam {total_kb:.0f} KB")
+
+    pairs = [
+        ('clean_decision_text', legacy_clean_decision_text, clean_decision_text),
+        ('clean_decision_text_light', legacy_clean_decision_text_light, clean_decision_text_light),
+    ]
+    failed = False
+    for label, legacy, current in pairs:
+        mismatches = [name for name, text in corpus if legacy(text) != current(text)]
+        legacy_time = timed(legacy, corpus, args.repeat)
+        current_time = timed(current, corpus, args.repeat)
+        speedup = legacy_time / current_time if current_time else float('inf')
+        print(f"{label:28} eski: {legacy_time * 1000:9.1f} ms  yeni: {current_time * 1000:9.1f} ms  "
+              f"hızlanma: {speedup:5.1f}x  farklı çıktı: {len(mismatches)}")
+        for name in mismatches:
+            print(f"    ! {name}")
+        failed = failed or bool(mismatches)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,198 @@
+"""
+Yargı arama yolu için ağsız performans ölçümü
+Tüm mahkeme client'larının HTTP istekleri yerel replay sunucusuna yönlendirilir
+(bkz. yargi_replay.py); böylece search_all_courts ve get_document_content canlı
+sitelere gitmeden, kayıtlı yanıtlar üzerinde ölçülür.
+
+Raporlanan değerler:
+    - Mahkeme başına arama ve karar metni süresi (toplam / HTTP / ayrıştırma)
+    - Mahkeme başına en yüksek bellek kullanımı (tracemalloc, ayrı bir geçişte)
+    - search_all_courts sıralı (concurrent=False) ve paralel mod karşılaştırması
+
+Depoda yedi mahkemenin tamamı için sentetik örnekler bulunur
+(benchmarks/fixtures/http/<host>/, make_replay_fixtures.py ile üretilir); ölçüm
+bunlarla ağsız çalışır ve kaydı olmayan istek kalırsa 1 ile çıkar. Canlı site
+yanıtlarıyla ölçmek için örnekler ağ erişimi olan bir makinede --record ile
+yenilenir:
+
+    python benchmarks/bench_yargi_search.py --keyword "kıdem tazminatı"
+    python benchmarks/bench_yargi_search.py --record --keyword "kıdem tazminatı"
+    python benchmarks/bench_yargi_search.py --latency-scale 0 --json sonuc.json
+
+--latency-scale 0 kayıtlı ağ gecikmesini kapatır (yalnızca ayrıştırma/temizleme
+maliyeti kalır); 1 kayıt sırasındaki gecikmeyi aynen uygular. Önbellek, karar
+deposu, indeks ve ön getirme ölçüm boyunca kapalıdır.
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import statistics
+import tracemalloc
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.abspath(os.path.join(BENCH_DIR, '..')))
+sys.path.insert(0, BENCH_DIR)
+
+from yargi_replay import DEFAULT_FIXTURES, FixtureStore, HttpTimer, ReplayServer, install_transport_patches  # noqa: E402
+
+# yargi_integration import edilmeden önce: ölçümü etkileyecek katmanları kapat
+os.environ['YARGI_CACHE_BACKEND'] = 'none'
+os.environ['YARGI_DECISION_STORE'] = '0'
+os.environ['YARGI_INDEX'] = '0'
+os.environ['YARGI_PREFETCH_TOP_N'] = '0'
+
+
+def fresh_breakers(integration, module):
+    # Kayıt eksikliğinden açılan devre kesiciler sonraki ölçümleri bozmasın
+    integration.circuit_breakers = {
+        court: module.CourtCircuitBreaker(label, max_timeout=module.COURT_MAX_TIMEOUT_SECONDS)
+        for court, label in module.COURT_LABELS.items()
+    }
+
+
+def decision_ref(decision):
+    if isinstance(decision, dict):
+        return decision.get('id'), decision.get('document_url')
+    return getattr(decision, 'id', None), getattr(decision, 'document_url', None)
+
+
+def measure(func, timer, repeat):
+    """func'ı repeat kez çalıştırır; (son sonuç, toplam süreler, http süreleri, istek sayısı, hata)"""
+    totals, http_times, result, error, requests = [], [], None, None, 0
+    for _ in range(repeat):
+        timer.reset()
+        started = time.perf_counter()
+        try:
+            result = func()
+            if isinstance(result, dict) and result.get('success') is False:
+                error = result.get('error') or 'başarısız'
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+        totals.append(time.perf_counter() - started)
+        http_seconds, requests = timer.reset()
+        http_times.append(http_seconds)
+    return result, totals, http_times, requests, error
+
+
+def peak_memory(func) -> int:
+    tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        baseline = tracemalloc.get_traced_memory()[0]
+        try:
+            func()
+        except Exception:
+            pass
+        return tracemalloc.get_traced_memory()[1] - baseline
+    finally:
+        tracemalloc.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Yargı arama yolu replay ölçümü")
+    parser.add_argument('--fixtures', default=DEFAULT_FIXTURES, help="Kayıtlı HTTP örnekleri klasörü")
+    parser.add_argument('--record', action='store_true', help="Gerçek sitelere gidip örnekleri kaydet")
+    parser.add_argument('--keyword', default='kıdem tazminatı')
+    parser.add_argument('--courts', default='all', help="Virgülle ayrılmış mahkemeler (varsayılan: all)")
+    parser.add_argument('--page-size', type=int, default=10)
+    parser.add_argument('--documents', type=int, default=2, help="Mahkeme başına açılacak karar sayısı")
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--latency-scale', type=float, default=1.0)
+    parser.add_argument('--no-memory', action='store_true', help="Bellek geçişini atla")
+    parser.add_argument('--json', dest='json_path', help="Sonuçları JSON olarak da yaz")
+    args = parser.parse_args()
+
+    store = FixtureStore(args.fixtures)
+    if not args.record and not len(store):
+        print(f"{args.fixtures} içinde kayıt yok. Sentetik örnekleri üretin veya ağ erişimi olan bir makinede kaydedin:\n"
+              f"    python benchmarks/make_replay_fixtures.py\n"
+              f"    python benchmarks/bench_yargi_search.py --record --keyword \"{args.keyword}\"")
+        return 1
+
+    server = ReplayServer(store, record=args.record, latency_scale=args.latency_scale).start()
+    timer = HttpTimer()
+    install_transport_patches(server, timer)
+
+    import yargi_integration as module
+    integration = module.yargi_integration
+    courts = list(module.COURT_LABELS) if args.courts == 'all' else [c.strip() for c in args.courts.split(',')]
+    repeat = 1 if args.record else args.repeat
+    report = {'keyword': args.keyword, 'latency_scale': args.latency_scale, 'courts': {}, 'orchestration': {}}
+
+    print(f"{len(store)} kayıtlı yanıt, mahkemeler: {', '.join(courts)}")
+    print(f"{'işlem':34} {'toplam ms':>10} {'http ms':>9} {'ayrıştırma ms':>14} {'istek':>6} {'bellek KB':>10}")
+
+    for court in courts:
+        court_report = report['courts'][court] = {}
+        searches = integration._build_court_searches(keyword=args.keyword, court_type=court, page_size=args.page_size)
+        operations = [('arama', lambda: integration.run_async(searches[court]()))]
+
+        fresh_breakers(integration, module)
+        result, totals, http_times, requests, error = measure(operations[0][1], timer, repeat)
+        decisions = (result or {}).get('decisions', [])[:args.documents]
+        for decision in decisions:
+            document_id, url = decision_ref(decision)
+            if document_id:
+                operations.append((f"karar {document_id}", lambda d=document_id, u=url: module._fetch_document_content(court, d, u)))
+
+        for index, (label, func) in enumerate(operations):
+            if index > 0:
+                _, totals, http_times, requests, error = measure(func, timer, repeat)
+            memory = None if args.no_memory or args.record else peak_memory(func)
+            total_ms = statistics.median(totals) * 1000
+            http_ms = statistics.median(http_times) * 1000
+            court_report[label] = {
+                'total_ms': round(total_ms, 2),
+                'http_ms': round(http_ms, 2),
+                'parse_ms': round(max(0.0, total_ms - http_ms), 2),
+                'requests': requests,
+                'peak_memory_kb': round(memory / 1024, 1) if memory is not None else None,
+                'error': error,
+            }
+            memory_text = f"{memory / 1024:10.0f}" if memory is not None else f"{'-':>10}"
+            print(f"{(court + ' ' + label)[:34]:34} {total_ms:10.1f} {http_ms:9.1f} "
+                  f"{max(0.0, total_ms - http_ms):14.1f} {requests:6d} {memory_text}"
+                  + (f"  ! {error}" if error else ''))
+
+    if not args.record:
+        court_type = courts[0] if len(courts) == 1 else 'all'
+        for label, concurrent in (('sıralı', False), ('paralel', True)):
+            fresh_breakers(integration, module)
+            _, totals, http_times, requests, error = measure(
+                lambda: integration.search_all_courts(args.keyword, court_type=court_type, page_size=args.page_size,
+                                                      concurrent=concurrent, no_cache=True, prefetch=False),
+                timer, repeat
+            )
+            report['orchestration'][label] = {
+                'total_ms': round(statistics.median(totals) * 1000, 2),
+                'min_ms': round(min(totals) * 1000, 2),
+                'requests': requests,
+                'error': error,
+            }
+        sequential = report['orchestration']['sıralı']['total_ms']
+        parallel = report['orchestration']['paralel']['total_ms']
+        print(f"\nsearch_all_courts sıralı: {sequential:.1f} ms  paralel: {parallel:.1f} ms  "
+              f"hızlanma: {sequential / parallel if parallel else 0:.1f}x")
+
+    report['misses'] = sorted(set(server.misses))
+    if report['misses']:
+        print(f"\nKaydı olmayan {len(report['misses'])} istek (client istek biçimi değişmiş olabilir):")
+        for miss in report['misses'][:20]:
+            print(f"    {miss}")
+    if args.record:
+        print(f"\n{len(store)} yanıt kaydedildi: {args.fixtures}")
+
+    if args.json_path:
+        with open(args.json_path, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+
+    module.cleanup_resources()
+    server.stop()
+    return 1 if report['misses'] and not args.record else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
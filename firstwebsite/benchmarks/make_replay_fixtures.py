@@ -0,0 +1,352 @@
+"""
+Replay ölçümü için sentetik HTTP örnekleri
+bench_yargi_search.py'nin ağsız çalışabilmesi için yedi mahkeme client'ının
+ilk tercih ettiği uç noktalara (arama + ilk iki karar metni) verilecek yanıtları
+üretir ve fixtures/http/<host>/ altına yazar. Yanıtların biçimi client
+ayrıştırıcılarının beklediği yapıdır (JSON alanları, tablo/sınıf adları,
+ViewState alanları); içerik örnektir, gecikmeler ölçüm değil tahmindir.
+
+Client'ların istek biçimi veya ayrıştırıcıları değişirse bu dosya güncellenip
+yeniden çalıştırılır; gerçek sitelerden alınan örnekler için --record
+kullanılır (bkz. bench_yargi_search.py):
+
+    python benchmarks/make_replay_fixtures.py
+"""
+
+import os
+import sys
+import json
+import hashlib
+from urllib.parse import quote
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, BENCH_DIR)
+
+from yargi_replay import DEFAULT_FIXTURES  # noqa: E402
+
+KEYWORD = 'kıdem tazminatı'
+DECISIONS_DIR = os.path.join(BENCH_DIR, 'fixtures', 'decisions')
+JSON_TYPE = 'application/json; charset=utf-8'
+HTML_TYPE = 'text/html; charset=utf-8'
+
+
+def fixture(name, method, url, body, content_type=HTML_TYPE, elapsed=0.2, status=200):
+    """(dosya adı, FixtureStore biçiminde kayıt)"""
+    if not isinstance(body, str):
+        body = json.dumps(body, ensure_ascii=False)
+    return name, {
+        'method': method,
+        'url': url,
+        'body_sha1': hashlib.sha1(b'').hexdigest(),
+        'status': status,
+        'headers': {'Content-Type': content_type},
+        'body': body,
+        'elapsed': elapsed,
+    }
+
+
+def decision_html(filename):
+    with open(os.path.join(DECISIONS_DIR, filename), 'r', encoding='utf-8') as f:
+        return f.read()
+
+
+def page(title, body):
+    return (f'<!DOCTYPE html><html lang="tr"><head><meta charset="utf-8"><title>{title}</title></head>'
+            f'<body>{body}</body></html>')
+
+
+# ---------------------------------------------------------------------------
+# Yargıtay / Danıştay / Emsal: JSON arama + getDokuman
+# ---------------------------------------------------------------------------
+
+def search_payload(entries, total):
+    return {'data': {'data': entries, 'recordsTotal': total, 'recordsFiltered': total, 'draw': 1}}
+
+
+def yargitay():
+    base = 'https://karararama.yargitay.gov.tr'
+    entries = [
+        {'id': '1034567001', 'daire': '9. Hukuk Dairesi', 'esasNo': '2023/10452', 'kararNo': '2024/1187',
+         'kararTarihi': '12.02.2024', 'arananKelime': KEYWORD},
+        {'id': '1034567002', 'daire': '22. Hukuk Dairesi', 'esasNo': '2021/8821', 'kararNo': '2022/4410',
+         'kararTarihi': '08.03.2022', 'arananKelime': KEYWORD},
+        {'id': '1034567003', 'daire': 'Hukuk Genel Kurulu', 'esasNo': '2019/9-512', 'kararNo': '2021/1203',
+         'kararTarihi': '30.09.2021', 'arananKelime': KEYWORD},
+        {'id': '1034567004', 'daire': '7. Hukuk Dairesi', 'esasNo': '2015/33871', 'kararNo': '2016/1450',
+         'kararTarihi': '25.01.2016', 'arananKelime': KEYWORD},
+        {'id': '1034567005', 'daire': '9. Hukuk Dairesi', 'esasNo': '2022/15530', 'kararNo': '2023/2212',
+         'kararTarihi': '14.02.2023', 'arananKelime': KEYWORD},
+    ]
+    content = decision_html('yargitay_karar.html')
+    fixtures = [fixture('aramadetaylist', 'POST', f'{base}/aramadetaylist', search_payload(entries, 1243),
+                        JSON_TYPE, elapsed=0.62)]
+    for entry in entries[:2]:
+        fixtures.append(fixture(f"getDokuman_{entry['id']}", 'GET', f"{base}/getDokuman?id={entry['id']}",
+                                {'data': content, 'metadata': {'FMTY': 'SUCCESS'}}, JSON_TYPE, elapsed=0.21))
+    return fixtures
+
+
+def danistay():
+    base = 'https://karararama.danistay.gov.tr'
+    entries = [
+        {'id': '2087760011', 'daire': '12. Daire', 'esasNo': '2019/1234', 'kararNo': '2022/5678',
+         'kararTarihi': '17.05.2022', 'arananKelime': KEYWORD},
+        {'id': '2087760012', 'daireKurul': 'İdari Dava Daireleri Kurulu', 'esasNo': '2020/877',
+         'kararNo': '2021/1540', 'kararTarihi': '02.11.2021', 'arananKelime': KEYWORD},
+        {'id': '2087760013', 'daire': '5. Daire', 'esasNo': '2018/6120', 'kararNo': '2020/2291',
+         'kararTarihi': '23.06.2020', 'arananKelime': KEYWORD},
+    ]
+    content = decision_html('danistay_karar.html')
+    fixtures = [fixture('aramalist', 'POST', f'{base}/aramalist', search_payload(entries, 87),
+                        JSON_TYPE, elapsed=0.48)]
+    for entry in entries[:2]:
+        url = f"{base}/getDokuman?id={entry['id']}&arananKelime={quote(KEYWORD)}"
+        fixtures.append(fixture(f"getDokuman_{entry['id']}", 'GET', url,
+                                {'data': content, 'metadata': {'FMTY': 'SUCCESS'}}, JSON_TYPE, elapsed=0.19))
+    return fixtures
+
+
+def emsal():
+    base = 'https://emsal.uyap.gov.tr'
+    entries = [
+        {'id': '886512301', 'daire': 'İstanbul BAM 28. Hukuk Dairesi', 'esasNo': '2022/1875',
+         'kararNo': '2023/940', 'kararTarihi': '06.04.2023', 'durum': 'KESİNLEŞTİ'},
+        {'id': '886512302', 'daire': 'Ankara 12. İş Mahkemesi', 'esasNo': '2021/402', 'kararNo': '2022/311',
+         'kararTarihi': '19.10.2022', 'durum': 'KESİNLEŞMEDİ'},
+        {'id': '886512303', 'daire': 'İzmir BAM 9. Hukuk Dairesi', 'esasNo': '2020/3317',
+         'kararNo': '2021/1102', 'kararTarihi': '11.05.2021', 'durum': 'KESİNLEŞTİ'},
+        {'id': '886512304', 'daire': 'Bursa 3. İş Mahkemesi', 'esasNo': '2019/725', 'kararNo': '2020/588',
+         'kararTarihi': '27.02.2020', 'durum': 'KESİNLEŞTİ'},
+    ]
+    content = decision_html('emsal_karar.html')
+    fixtures = [fixture('aramadetaylist', 'POST', f'{base}/aramadetaylist', search_payload(entries, 2310),
+                        JSON_TYPE, elapsed=0.71)]
+    for entry in entries[:2]:
+        fixtures.append(fixture(f"getDokuman_{entry['id']}", 'GET', f"{base}/getDokuman?id={entry['id']}",
+                                {'data': content, 'metadata': {'FMTY': 'SUCCESS'}}, JSON_TYPE, elapsed=0.24))
+    return fixtures
+
+
+# ---------------------------------------------------------------------------
+# Anayasa Mahkemesi: norm denetimi arama sayfası + karar sayfaları
+# ---------------------------------------------------------------------------
+
+ANAYASA_DECISIONS = [
+    ('/ND/2023/45', 'E.2022/118, K.2023/45', 'İptal Davası', 'Ankara 5. İş Mahkemesi',
+     'Esasa İlişkin Karar: Ret', '08.03.2023'),
+    ('/ND/2021/12', 'E.2020/64, K.2021/12', 'İtiraz Yoluyla Norm Denetimi', 'İstanbul 21. İş Mahkemesi',
+     'Esasa İlişkin Karar: İptal', '25.02.2021'),
+    ('/ND/2019/88', 'E.2019/31, K.2019/88', 'İtiraz Yoluyla Norm Denetimi', 'Bakırköy 3. İş Mahkemesi',
+     'Esasa İlişkin Karar: Ret', '14.11.2019'),
+]
+
+
+def anayasa_listing():
+    items = []
+    for href, ek_no, app_type, applicant, outcome, date in ANAYASA_DECISIONS:
+        items.append(
+            f'<div class="birkarar"><a href="{href}">'
+            f'<div class="bkararbaslik">{ek_no} Sayılı Karar'
+            f'<div class="BulunanKelimeSayisi">Bulunan Kelime Sayısı 4</div></div>'
+            f'<div class="kararbilgileri">{app_type} | {applicant} | {outcome} | Karar Tarihi: {date}</div>'
+            f'</a></div>'
+            f'<div class="col-sm-12"><table class="table"><thead><tr><th>Norm</th><th>Madde</th>'
+            f'<th>İnceleme Türü ve Sonuç</th><th>Gerekçe</th><th>Dayanak</th><th>Erteleme</th></tr></thead>'
+            f'<tbody><tr><td>1475 sayılı İş Kanunu</td><td>14</td><td>Esas - {outcome.split(": ")[-1]}</td>'
+            f'<td>-</td><td>2, 13, 49</td><td></td></tr></tbody></table></div>'
+        )
+    return page('Norm Denetimi Kararları Bilgi Bankası',
+                f'<div class="bulunankararsayisi">{len(items)} Karar Bulundu</div>' + ''.join(items))
+
+
+def anayasa_decision(ek_no, date):
+    paragraphs = ''.join(f'<p>{text}</p>' for text in (
+        'ANAYASA MAHKEMESİ KARARI',
+        f'Esas ve Karar Sayısı: {ek_no}',
+        f'Karar Tarihi: {date}',
+        'İTİRAZ YOLUNA BAŞVURAN: İş Mahkemesi',
+        'İTİRAZIN KONUSU: 1475 sayılı İş Kanunu\'nun 14. maddesinin birinci fıkrasında yer alan kıdem '
+        'tazminatına esas sürenin hesaplanmasına ilişkin kuralın Anayasa\'nın 2., 13. ve 49. maddelerine '
+        'aykırılığı ileri sürülerek iptaline karar verilmesi talebidir.',
+        'OLAY: Kıdem tazminatı alacağının tahsili istemiyle açılan davada itiraz konusu kuralın Anayasa\'ya '
+        'aykırı olduğu kanısına varan Mahkeme iptali için başvurmuştur.',
+        'İNCELEME: Anayasa Mahkemesi İçtüzüğü hükümleri uyarınca yapılan ilk inceleme toplantısında dosyada '
+        'eksiklik bulunmadığından işin esasının incelenmesine oybirliğiyle karar verilmiştir.',
+        'ESASIN İNCELENMESİ: Kural, çalışma hayatında işçi ile işveren arasındaki dengeyi gözeten ve kıdem '
+        'tazminatının kapsamını belirleyen bir düzenlemedir. Kanun koyucunun bu alandaki takdir yetkisi '
+        'ölçülülük ilkesi çerçevesinde değerlendirilmiş ve kuralın Anayasa\'ya aykırı olmadığı sonucuna '
+        'ulaşılmıştır.',
+        'HÜKÜM: Açıklanan nedenlerle itirazın REDDİNE OYBİRLİĞİYLE karar verildi.',
+    ))
+    return page(f'Anayasa Mahkemesi {ek_no}',
+                f'<div id="Karar"><div class="KararMetni"><div class="WordSection1">{paragraphs}</div></div></div>')
+
+
+def anayasa():
+    base = 'https://normkararlarbilgibankasi.anayasa.gov.tr'
+    listing = anayasa_listing()
+    fixtures = [
+        fixture('ara', 'GET', f"{base}/Ara?KelimeAra%5B%5D={quote(KEYWORD).replace('%20', '+')}", listing,
+                elapsed=0.83),
+        # Entegrasyon katmanı liste ayrıştırılamazsa ana sayfadaki son kararlara düşer
+        fixture('anasayfa', 'GET', f'{base}/', listing, elapsed=0.55),
+    ]
+    # Ana sayfadan çıkarılan sonuçlar anayasa_<sıra>_<sayfa> kimliğiyle açılır
+    for index, (_, ek_no, _, _, _, date) in enumerate(ANAYASA_DECISIONS[:2], start=1):
+        document_id = f'anayasa_{index}_1'
+        fixtures.append(fixture(f'karar_{document_id}', 'GET', f'{base}/Karar/Goster/{document_id}',
+                                anayasa_decision(ek_no, date), elapsed=0.37))
+    return fixtures
+
+
+# ---------------------------------------------------------------------------
+# Uyuşmazlık Mahkemesi: form POST ile HTML tablo + karar sayfaları
+# ---------------------------------------------------------------------------
+
+UYUSMAZLIK_DECISIONS = [
+    ('2023/512', '2023/448', 'Hukuk Bölümü', 'Görev Uyuşmazlığı', 'Adli Yargı Yerinin Görevli Olduğuna'),
+    ('2022/371', '2022/296', 'Hukuk Bölümü', 'Görev Uyuşmazlığı', 'İdari Yargı Yerinin Görevli Olduğuna'),
+    ('2021/85', '2021/61', 'Genel Kurul', 'Hüküm Uyuşmazlığı', 'Hüküm Uyuşmazlığı Olduğuna'),
+]
+
+
+def uyusmazlik_decision(karar_no, esas_no, bolum, sonuc):
+    paragraphs = ''.join(f'<p>{text}</p>' for text in (
+        'T.C. UYUŞMAZLIK MAHKEMESİ',
+        bolum.upper(),
+        f'Esas No: {esas_no}',
+        f'Karar No: {karar_no}',
+        'KARAR',
+        'Davacı, belediyede sözleşmeli olarak çalıştığı dönem için kıdem tazminatı ve yıllık izin ücreti '
+        'alacaklarının ödenmesi istemiyle dava açmış; adli yargı yerince görevsizlik kararı verilmesi üzerine '
+        'idari yargı yerinde açılan davada da görevsizlik kararı verilmiştir.',
+        'Olumsuz görev uyuşmazlığı bulunduğundan dosya Mahkememize gönderilmiştir. Dosyadaki belgelerin '
+        'incelenmesinden davacının hizmet akdine dayalı olarak çalıştığı ve uyuşmazlığın iş ilişkisinden '
+        'kaynaklandığı anlaşılmaktadır.',
+        'Hizmet akdiyle çalışan işçinin kıdem tazminatı alacağına ilişkin uyuşmazlıkların çözümü iş '
+        'mahkemelerinin görev alanındadır; bu nedenle davanın çözümünde adli yargı yeri görevlidir.',
+        f'SONUÇ: {sonuc} ve bu yargı yerince verilen görevsizlik kararının kaldırılmasına OYBİRLİĞİ ile '
+        'karar verildi.',
+    ))
+    return page(f'Uyuşmazlık Mahkemesi Kararı {karar_no}', f'<div class="karar-metni">{paragraphs}</div>')
+
+
+def uyusmazlik():
+    base = 'https://kararlar.uyusmazlik.gov.tr'
+    rows = ''.join(
+        f'<tr><td><div data-rel="popover" data-content="{konu} - {sonuc}">'
+        f'<a href="/Karar/Detay/{karar_no}">{karar_no}</a></div></td>'
+        f'<td>{esas_no}</td><td>{bolum}</td><td>{konu}</td><td>{sonuc}</td>'
+        f'<td><a href="/Dosyalar/{karar_no.replace("/", "-")}.pdf">PDF</a></td></tr>'
+        for karar_no, esas_no, bolum, konu, sonuc in UYUSMAZLIK_DECISIONS
+    )
+    listing = (
+        f'<div class="pull-right label label-important">{len(UYUSMAZLIK_DECISIONS)} adet kayıt bulundu</div>'
+        '<table class="table table-striped table-hover"><tr><th>Karar Sayısı</th><th>Esas Sayısı</th>'
+        f'<th>Bölüm</th><th>Uyuşmazlık</th><th>Karar Sonucu</th><th></th></tr>{rows}</table>'
+    )
+    fixtures = [fixture('arama_search', 'POST', f'{base}/Arama/Search', listing, elapsed=0.58)]
+    for karar_no, esas_no, bolum, _, sonuc in UYUSMAZLIK_DECISIONS[:2]:
+        fixtures.append(fixture(f"karar_{karar_no.replace('/', '_')}", 'GET', f'{base}/Karar/Detay/{karar_no}',
+                                uyusmazlik_decision(karar_no, esas_no, bolum, sonuc), elapsed=0.33))
+    return fixtures
+
+
+# ---------------------------------------------------------------------------
+# Kamu İhale Kurumu: ASP.NET formu (ViewState) + sonuç tablosu
+# ---------------------------------------------------------------------------
+
+def kik():
+    url = 'https://ekap.kik.gov.tr/EKAP/Vatandas/kurulkararsorgu.aspx'
+    hidden = (
+        '<input type="hidden" name="__VIEWSTATE" id="__VIEWSTATE" value="/wEPDwULLTE2MTY2ODcyMjlkZA==" />'
+        '<input type="hidden" name="__EVENTVALIDATION" id="__EVENTVALIDATION" value="/wEdAAOt2w9JEvTZ" />'
+    )
+    form = (
+        f'<form method="post" action="./kurulkararsorgu.aspx" id="aspnetForm">{hidden}'
+        '<input name="ctl00$ContentPlaceHolder1$txtKararMetni" type="text" />'
+        '<input type="submit" name="ctl00$ContentPlaceHolder1$btnAra" value="Ara" /></form>'
+    )
+    rows = ''.join(
+        f'<tr><td>{karar_no}</td><td>{tarih}</td><td>{idare}</td><td>{konu}</td></tr>'
+        for karar_no, tarih, idare, konu in (
+            ('2024/UH.II-1205', '12.03.2024', 'Ankara Büyükşehir Belediyesi', 'Personel çalıştırılmasına dayalı '
+             'hizmet alımında kıdem tazminatı maliyetinin teklife dahil edilmesi'),
+            ('2024/UH.I-987', '08.02.2024', 'Sağlık Bakanlığı', 'Temizlik hizmeti alımı - işçilik maliyeti'),
+            ('2023/UH.III-2210', '27.12.2023', 'Karayolları Genel Müdürlüğü', 'Bakım onarım hizmet alımı'),
+        )
+    )
+    results = page('Kurul Kararları', form + (
+        '<table class="gridView" id="ctl00_ContentPlaceHolder1_gvKararlar"><tr><th>Karar No</th>'
+        f'<th>Karar Tarihi</th><th>İdare</th><th>İhale Konusu</th></tr>{rows}</table>'
+    ))
+    return [
+        fixture('kurulkararsorgu_get', 'GET', url, page('Kurul Kararları', form), elapsed=0.44),
+        fixture('kurulkararsorgu_post', 'POST', url, results, elapsed=0.91),
+    ]
+
+
+# ---------------------------------------------------------------------------
+# Rekabet Kurumu: karar listesi sayfası + karar sayfaları
+# ---------------------------------------------------------------------------
+
+REKABET_DECISIONS = [
+    ('5d0f3e8a-1c2b-4a7e-9f31-2b6c8d4e0a11', 'Sağlık sektöründe işçi ücretleri ve kıdem tazminatı koşullarında '
+     'centilmenlik anlaşması yoluyla rekabetin sınırlandırılması hakkında karar'),
+    ('7a91c4d2-5e6f-4b80-a1d3-9c2e7f6b5a22', 'Perakende zincirlerinin personel transferini engelleyen ve kıdem '
+     'tazminatı haklarını birlikte belirleyen uygulamaları hakkında karar'),
+    ('b3e2a1f0-9d8c-4e7b-8a6f-5c4d3e2f1a33', 'Özel okulların öğretmen ücretlerini ve kıdem tazminatı '
+     'ödemelerini ortak belirlemesi hakkında soruşturma kararı'),
+]
+
+
+def rekabet_decision(title):
+    paragraphs = ''.join(f'<p>{text}</p>' for text in (
+        'REKABET KURUMU BAŞKANLIĞI',
+        title,
+        'Dosya kapsamında teşebbüslerin işgücü piyasasında ücret ve yan haklara ilişkin rekabete hassas '
+        'bilgileri paylaşıp paylaşmadığı ve bu yolla 4054 sayılı Kanun\'un 4. maddesini ihlal edip etmediği '
+        'incelenmiştir.',
+        'Yerinde incelemelerde elde edilen belgeler, teşebbüslerin birbirlerinin çalışanlarını istihdam '
+        'etmeme ve kıdem tazminatı dahil yan hakları birlikte belirleme yönünde irade uyuşmasına vardığını '
+        'göstermektedir.',
+        'Bu çerçevede ilgili teşebbüslere 4054 sayılı Kanun\'un 16. maddesi uyarınca idari para cezası '
+        'verilmesine OYBİRLİĞİ ile karar verilmiştir.',
+    ))
+    return page('Rekabet Kurumu Kararı', f'<div class="karar-icerik">{paragraphs}</div>'
+                                         '<a href="/Dosyalar/kararlar/karar.pdf">Karar PDF</a>')
+
+
+def rekabet():
+    base = 'https://www.rekabet.gov.tr'
+    items = ''.join(
+        f'<div class="karar-item"><a href="/Karar?kararId={karar_id}">{title}</a>'
+        f'<span class="tarih">2024</span></div>'
+        for karar_id, title in REKABET_DECISIONS
+    )
+    fixtures = [fixture('kararlar', 'GET', f'{base}/tr/Kararlar', page('Kararlar', items), elapsed=0.67)]
+    for karar_id, title in REKABET_DECISIONS[:2]:
+        fixtures.append(fixture(f'karar_{karar_id[:8]}', 'GET', f'{base}/Karar?kararId={karar_id}',
+                                rekabet_decision(title), elapsed=0.29))
+    return fixtures
+
+
+COURTS = (yargitay, danistay, emsal, anayasa, uyusmazlik, kik, rekabet)
+
+
+def main(root=DEFAULT_FIXTURES):
+    written = 0
+    for court in COURTS:
+        for name, data in court():
+            host_dir = os.path.join(root, data['url'].split('/')[2])
+            os.makedirs(host_dir, exist_ok=True)
+            with open(os.path.join(host_dir, f'{name}.json'), 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False, indent=1)
+                f.write('\n')
+            written += 1
+    print(f"{written} örnek yazıldı: {root}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
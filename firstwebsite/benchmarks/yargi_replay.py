@@ -0,0 +1,307 @@
+"""
+Yargı client'ları için kayıtlı HTTP yanıtlarını yeniden oynatan yerel sunucu
+unified_mcp_modules içindeki tüm client'ların (httpx, aiohttp, requests) dış
+istekleri bu sunucuya yönlendirilir; sunucu istekleri kayıtlı örneklerden
+(fixtures/http) yanıtlar ve kayıt sırasındaki gecikmeyi (isteğe bağlı ölçekle)
+taklit eder. Kayıt modunda aynı sunucu gerçek mahkeme sitelerine vekil (proxy)
+olarak çalışır ve her yanıtı örnek dosyası olarak kaydeder.
+
+Yönlendirme kütüphane taşıma katmanında yapılır:
+    httpx    -> AsyncHTTPTransport.handle_async_request
+    requests -> HTTPAdapter.send (requests.get, Session ve http_manager dahil)
+    aiohttp  -> ClientSession._request
+Özgün URL, https://host/yol?sorgu -> http://127.0.0.1:PORT/__replay__/https/host/yol?sorgu
+biçiminde yola gömülür.
+
+Örnek dosyası biçimi (fixtures/http/<host>/<anahtar>.json):
+    {"method", "url", "body_sha1", "status", "headers", "body" | "body_b64", "elapsed"}
+"""
+
+import os
+import ssl
+import json
+import time
+import base64
+import hashlib
+import logging
+import threading
+import urllib.error
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import urljoin, urlsplit
+
+logger = logging.getLogger(__name__)
+
+REPLAY_PREFIX = '/__replay__/'
+DEFAULT_FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures', 'http')
+
+# Yanıtla birlikte saklanan/oynatılan başlıklar
+KEPT_RESPONSE_HEADERS = ('content-type', 'location', 'set-cookie')
+# Kayıt sırasında upstream'e iletilmeyen istek başlıkları
+DROPPED_REQUEST_HEADERS = ('host', 'connection', 'content-length', 'accept-encoding', 'keep-alive')
+
+
+class FixtureStore:
+    """Kayıtlı HTTP alışverişleri; önce gövde dahil tam eşleşme, sonra URL, sonra yol ile aranır"""
+
+    def __init__(self, root: str = DEFAULT_FIXTURES):
+        self.root = root
+        self._lock = threading.Lock()
+        self._by_body: Dict[str, Dict[str, Any]] = {}
+        self._by_url: Dict[str, Dict[str, Any]] = {}
+        self._by_path: Dict[str, Dict[str, Any]] = {}
+        self._load()
+
+    @staticmethod
+    def _keys(method: str, url: str, body: bytes) -> Tuple[str, str, str]:
+        parts = urlsplit(url)
+        body_sha1 = hashlib.sha1(body or b'').hexdigest()
+        url_key = f"{method.upper()} {parts.scheme}://{parts.netloc}{parts.path}?{parts.query}"
+        path_key = f"{method.upper()} {parts.netloc}{parts.path}"
+        return f"{url_key} {body_sha1}", url_key, path_key
+
+    def _add(self, fixture: Dict[str, Any]):
+        _, url_key, path_key = self._keys(fixture['method'], fixture['url'], b'')
+        self._by_body[f"{url_key} {fixture.get('body_sha1', '')}"] = fixture
+        self._by_url.setdefault(url_key, fixture)
+        self._by_path.setdefault(path_key, fixture)
+
+    def _load(self):
+        if not os.path.isdir(self.root):
+            return
+        for dirpath, _, filenames in os.walk(self.root):
+            for filename in filenames:
+                if not filename.endswith('.json'):
+                    continue
+                try:
+                    with open(os.path.join(dirpath, filename), 'r', encoding='utf-8') as f:
+                        self._add(json.load(f))
+                except Exception as e:
+                    logger.warning(f"Örnek dosyası okunamadı ({filename}): {e}")
+
+    def __len__(self) -> int:
+        return len(self._by_body)
+
+    def lookup(self, method: str, url: str, body: bytes) -> Optional[Dict[str, Any]]:
+        body_key, url_key, path_key = self._keys(method, url, body)
+        with self._lock:
+            return self._by_body.get(body_key) or self._by_url.get(url_key) or self._by_path.get(path_key)
+
+    def save(self, method: str, url: str, body: bytes, status: int,
+             headers: Dict[str, str], content: bytes, elapsed: float) -> Dict[str, Any]:
+        fixture = {
+            'method': method.upper(),
+            'url': url,
+            'body_sha1': hashlib.sha1(body or b'').hexdigest(),
+            'status': status,
+            'headers': headers,
+            'elapsed': round(elapsed, 4),
+        }
+        try:
+            fixture['body'] = content.decode('utf-8')
+        except UnicodeDecodeError:
+            fixture['body_b64'] = base64.b64encode(content).decode('ascii')
+
+        body_key = self._keys(method, url, body)[0]
+        host_dir = os.path.join(self.root, urlsplit(url).netloc or 'diger')
+        os.makedirs(host_dir, exist_ok=True)
+        path = os.path.join(host_dir, f"{hashlib.sha1(body_key.encode('utf-8')).hexdigest()}.json")
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(fixture, f, ensure_ascii=False, indent=1)
+        with self._lock:
+            self._add(fixture)
+        return fixture
+
+    @staticmethod
+    def content_of(fixture: Dict[str, Any]) -> bytes:
+        if 'body_b64' in fixture:
+            return base64.b64decode(fixture['body_b64'])
+        return (fixture.get('body') or '').encode('utf-8')
+
+
+class _NoRedirect(urllib.request.HTTPRedirectHandler):
+    # Yönlendirmeleri client'ın kendisi takip etsin (kayıt da ayrı ayrı yapılsın)
+    def redirect_request(self, *args, **kwargs):
+        return None
+
+
+class ReplayServer:
+    """Kayıtlı örnekleri sunan (veya kayıt modunda upstream'e vekillik eden) yerel HTTP sunucusu"""
+
+    def __init__(self, store: FixtureStore, record: bool = False, latency_scale: float = 1.0):
+        self.store = store
+        self.record = record
+        self.latency_scale = latency_scale
+        self.requests = 0
+        self.misses = []
+        self._lock = threading.Lock()
+        self._httpd = None
+        self._thread = None
+        ssl_context = ssl.create_default_context()
+        # Mahkeme sitelerinin bir kısmı geçersiz sertifika kullanıyor (client'lar da verify=False)
+        ssl_context.check_hostname = False
+        ssl_context.verify_mode = ssl.CERT_NONE
+        self._opener = urllib.request.build_opener(urllib.request.HTTPSHandler(context=ssl_context), _NoRedirect)
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> 'ReplayServer':
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def _handle(self):
+                length = int(self.headers.get('Content-Length') or 0)
+                body = self.rfile.read(length) if length else b''
+                server._serve(self, body)
+
+            do_GET = do_POST = do_PUT = do_DELETE = do_HEAD = do_OPTIONS = _handle
+
+            def log_message(self, format, *args):
+                pass
+
+        self._httpd = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self._httpd.daemon_threads = True
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name='yargi-replay', daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        if self._httpd is not None:
+            self._httpd.shutdown()
+            self._httpd.server_close()
+            self._httpd = None
+
+    def wrap(self, url: str) -> str:
+        """Özgün URL'yi yerel sunucu adresine çevirir"""
+        if url.startswith(self.base_url):
+            return url
+        parts = urlsplit(url)
+        query = f"?{parts.query}" if parts.query else ''
+        return f"{self.base_url}{REPLAY_PREFIX}{parts.scheme}/{parts.netloc}{parts.path or '/'}{query}"
+
+    @staticmethod
+    def unwrap(path: str) -> str:
+        scheme, _, rest = path[len(REPLAY_PREFIX):].partition('/')
+        return f"{scheme}://{rest}"
+
+    def _serve(self, handler: BaseHTTPRequestHandler, body: bytes):
+        with self._lock:
+            self.requests += 1
+        if not handler.path.startswith(REPLAY_PREFIX):
+            self._respond(handler, 400, {}, b'replay: beklenmeyen yol')
+            return
+
+        method = handler.command
+        url = self.unwrap(handler.path)
+        fixture = None if self.record else self.store.lookup(method, url, body)
+        if fixture is None and self.record:
+            fixture = self._record(handler, method, url, body)
+        if fixture is None:
+            with self._lock:
+                self.misses.append(f"{method} {url}")
+            self._respond(handler, 404, {'X-Replay-Miss': '1'}, b'replay: kayit bulunamadi')
+            return
+
+        if self.latency_scale > 0 and not self.record:
+            time.sleep(fixture.get('elapsed', 0) * self.latency_scale)
+        headers = dict(fixture.get('headers', {}))
+        for name in list(headers):
+            if name.lower() == 'location':
+                # Yönlendirmeyi client kütüphanesi kendi takip edebilir, yerel sunucuda kalsın
+                headers[name] = self.wrap(urljoin(url, headers[name]))
+        self._respond(handler, fixture['status'], headers, self.store.content_of(fixture))
+
+    def _record(self, handler: BaseHTTPRequestHandler, method: str, url: str,
+                body: bytes) -> Optional[Dict[str, Any]]:
+        headers = {name: value for name, value in handler.headers.items()
+                   if name.lower() not in DROPPED_REQUEST_HEADERS}
+        headers['Accept-Encoding'] = 'identity'
+        request = urllib.request.Request(url, data=body or None, headers=headers, method=method)
+        started = time.monotonic()
+        try:
+            with self._opener.open(request, timeout=60) as response:
+                status, response_headers, content = response.status, response.headers, response.read()
+        except urllib.error.HTTPError as e:
+            status, response_headers, content = e.code, e.headers, e.read()
+        except Exception as e:
+            logger.warning(f"Kayıt sırasında upstream hatası ({method} {url}): {e}")
+            return None
+        elapsed = time.monotonic() - started
+        kept = {name: value for name, value in response_headers.items() if name.lower() in KEPT_RESPONSE_HEADERS}
+        return self.store.save(method, url, body, status, kept, content, elapsed)
+
+    @staticmethod
+    def _respond(handler: BaseHTTPRequestHandler, status: int, headers: Dict[str, str], content: bytes):
+        handler.send_response(status)
+        for name, value in headers.items():
+            handler.send_header(name, value)
+        handler.send_header('Content-Length', str(len(content)))
+        handler.end_headers()
+        if handler.command != 'HEAD':
+            handler.wfile.write(content)
+
+
+class HttpTimer:
+    """Yönlendirilen isteklerde geçen toplam süre (ayrıştırma süresini ayırmak için)"""
+
+    def __init__(self):
+        self.seconds = 0.0
+        self.count = 0
+        self._lock = threading.Lock()
+
+    def add(self, elapsed: float):
+        with self._lock:
+            self.seconds += elapsed
+            self.count += 1
+
+    def reset(self) -> Tuple[float, int]:
+        with self._lock:
+            snapshot = (self.seconds, self.count)
+            self.seconds, self.count = 0.0, 0
+        return snapshot
+
+
+def install_transport_patches(server: ReplayServer, timer: HttpTimer):
+    """httpx, requests ve aiohttp isteklerini yerel sunucuya yönlendirir"""
+    import httpx
+    import aiohttp
+    from requests.adapters import HTTPAdapter
+
+    original_httpx = httpx.AsyncHTTPTransport.handle_async_request
+
+    async def handle_async_request(self, request):
+        request.url = httpx.URL(server.wrap(str(request.url)))
+        started = time.perf_counter()
+        try:
+            return await original_httpx(self, request)
+        finally:
+            timer.add(time.perf_counter() - started)
+
+    original_send = HTTPAdapter.send
+
+    def send(self, request, *args, **kwargs):
+        request.url = server.wrap(request.url)
+        started = time.perf_counter()
+        try:
+            return original_send(self, request, *args, **kwargs)
+        finally:
+            timer.add(time.perf_counter() - started)
+
+    original_request = aiohttp.ClientSession._request
+
+    async def _request(self, method, str_or_url, *args, **kwargs):
+        started = time.perf_counter()
+        try:
+            return await original_request(self, method, server.wrap(str(str_or_url)), *args, **kwargs)
+        finally:
+            timer.add(time.perf_counter() - started)
+
+    httpx.AsyncHTTPTransport.handle_async_request = handle_async_request
+    HTTPAdapter.send = send
+    aiohttp.ClientSession._request = _request
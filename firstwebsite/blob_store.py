@@ -0,0 +1,291 @@
+#!/usr/bin/env python3
+"""
+İçerik adresli dosya deposu (blob store)
+Aynı PDF (vekaletname, kimlik vb.) çok sayıda dosyaya tekrar tekrar yüklenir.
+Yüklemeler parça parça okunurken SHA-256 özeti hesaplanır ve dosya
+'<kök>/blobs/<ilk 2 karakter>/<sha256>.<uzantı>' konumuna bir kez yazılır;
+aynı içerik yeniden yüklendiğinde yalnızca geçici kopya silinir. Belge
+kayıtlarının dosya yolu doğrudan bu konumu gösterir, okuyan kod değişmez.
+
+Kök klasör: Document ve PaymentDocument için UPLOAD_FOLDER, OrnekDilekce
+için ORNEK_DILEKCE_UPLOAD_FOLDER. Her blob için file_blob tablosunda bir satır
+ve referans sayısı tutulur; sayılar SQLAlchemy olaylarıyla aynı transaction
+içinde güncellenir:
+    - after_insert / after_update / before_delete: flush boyunca değişimler
+      toplanır, after_flush'ta blob başına tek UPDATE ile yazılır
+    - Sayısı sıfıra inen blobun satırı silinir; dosyası hemen değil, uzlaştırma
+      işinde ORPHAN_GRACE_SECONDS boyunca dokunulmamışsa kaldırılır. Aynı içerik
+      yeniden yüklendiğinde dosyanın mtime'ı yenilenir, böylece yeni kaydın
+      commit'i beklenirken dosya silinmez
+    - Blob dosyaları hiçbir zaman yerinde değiştirilmez; paylaşılan dosyayı
+      silme işini uç noktalar değil referans sayısı yapar
+
+Sahipsiz dosyaları silen ve olayları atlayan değişikliklere (Query.delete(),
+ham SQL) karşı sayıları düzelten uzlaştırma işi düzenli çalıştırılmalıdır.
+Cron job olarak:
+
+    0 3 * * * cd /var/www/lawautomation/firstwebsite && python blob_store.py
+"""
+
+import os
+import time
+import hashlib
+import logging
+import tempfile
+from collections import Counter
+from datetime import datetime, timezone, timedelta
+
+from flask import current_app
+from sqlalchemy import delete, event, insert, inspect, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, object_session
+
+from models import db, FileBlob, Document, PaymentDocument, OrnekDilekce
+from file_storage import canonical_path, direct_path, storage_root
+
+logger = logging.getLogger(__name__)
+
+BLOB_DIR = 'blobs'
+CHUNK_SIZE = int(os.getenv('BLOB_CHUNK_SIZE', 1024 * 1024))
+# Bu süreden eski, hiçbir kaydın göstermediği blob/geçici dosyalar uzlaştırmada silinir
+ORPHAN_GRACE_SECONDS = int(os.getenv('BLOB_ORPHAN_GRACE', 3600))
+
+# Model -> (dosya yolu kolonu, kök klasörün config anahtarı; None ise UPLOAD_FOLDER)
+BLOB_COLUMNS = {
+    Document: ('filepath', None),
+    PaymentDocument: ('filepath', None),
+    OrnekDilekce: ('dosya_yolu', 'ORNEK_DILEKCE_UPLOAD_FOLDER'),
+}
+
+_PENDING_KEY = 'blob_ref_deltas'
+
+
+def _now():
+    return datetime.now(timezone(timedelta(hours=3)))
+
+
+def _base(config_key):
+    return current_app.config[config_key] if config_key else None
+
+
+def is_blob(stored):
+    """Kayıtlı yol depodaki paylaşılan bir dosyayı mı gösteriyor"""
+    return bool(stored) and stored.replace('\\', '/').startswith(BLOB_DIR + '/')
+
+
+def blob_key(stored, base=None):
+    """file_blob.path değeri: blob yolunun UPLOAD_FOLDER'a göre kanonik biçimi"""
+    if not is_blob(stored):
+        return None
+    return canonical_path(direct_path(stored, base))
+
+
+class BlobStore:
+    """Yüklenen dosyaları içerik özetine göre tek kopya olarak saklar"""
+
+    def __init__(self, chunk_size=CHUNK_SIZE):
+        self.chunk_size = chunk_size
+        self._writes = 0
+        self._duplicates = 0
+        self._bytes_saved = 0
+
+    def save(self, file, base=None):
+        """FileStorage'ı depoya yazar; kök klasöre göreli blob yolunu döndürür"""
+        root = os.path.join(base or storage_root(), BLOB_DIR)
+        temp_dir = os.path.join(root, 'tmp')
+        os.makedirs(temp_dir, exist_ok=True)
+        extension = os.path.splitext(file.filename or '')[1].lower()
+        if not extension[1:].isalnum():
+            extension = ''
+
+        digest = hashlib.sha256()
+        size = 0
+        fd, temp_path = tempfile.mkstemp(dir=temp_dir, suffix=extension)
+        try:
+            with os.fdopen(fd, 'wb') as output:
+                while True:
+                    chunk = file.stream.read(self.chunk_size)
+                    if not chunk:
+                        break
+                    digest.update(chunk)
+                    output.write(chunk)
+                    size += len(chunk)
+
+            sha256 = digest.hexdigest()
+            relative = f"{BLOB_DIR}/{sha256[:2]}/{sha256}{extension}"
+            target = direct_path(relative, base)
+            if os.path.isfile(target) and os.path.getsize(target) == size:
+                os.remove(temp_path)
+                # Referansı yeni bitmiş bir blob uzlaştırmada silinmesin: bekleme süresi yeniden başlar
+                os.utime(target)
+                self._duplicates += 1
+                self._bytes_saved += size
+                logger.debug("Aynı içerik zaten depoda: %s (%d bayt)", relative, size)
+            else:
+                os.makedirs(os.path.dirname(target), exist_ok=True)
+                try:
+                    os.chmod(temp_path, 0o644)
+                except OSError:
+                    pass
+                os.replace(temp_path, target)
+                self._writes += 1
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+        return relative
+
+    def stats(self):
+        return {'writes': self._writes, 'duplicates': self._duplicates, 'bytes_saved': self._bytes_saved}
+
+
+blob_store = BlobStore()
+
+
+def _target_key(target, value):
+    _, config_key = BLOB_COLUMNS[type(target)]
+    return blob_key(value, _base(config_key))
+
+
+def _add_delta(target, key, delta):
+    if key is None:
+        return
+    session = object_session(target)
+    if session is None:
+        return
+    pending = session.info.setdefault(_PENDING_KEY, {})
+    pending[key] = pending.get(key, 0) + delta
+
+
+def _after_insert(mapper, connection, target):
+    column, _ = BLOB_COLUMNS[type(target)]
+    _add_delta(target, _target_key(target, getattr(target, column)), 1)
+
+
+def _after_update(mapper, connection, target):
+    column, _ = BLOB_COLUMNS[type(target)]
+    history = inspect(target).attrs[column].history
+    if not history.has_changes():
+        return
+    for value in history.deleted:
+        _add_delta(target, _target_key(target, value), -1)
+    for value in history.added:
+        _add_delta(target, _target_key(target, value), 1)
+
+
+def _before_delete(mapper, connection, target):
+    column, _ = BLOB_COLUMNS[type(target)]
+    _add_delta(target, _target_key(target, getattr(target, column)), -1)
+
+
+def _increment(connection, key, delta):
+    table = FileBlob.__table__
+    updated = connection.execute(
+        update(table).where(table.c.path == key).values(ref_count=table.c.ref_count + delta)
+    )
+    if updated.rowcount:
+        return
+    path = direct_path(key)
+    try:
+        # Aynı blobu eş zamanlı ekleyen başka bir istek varsa yalnızca bu adım geri alınır
+        with connection.begin_nested():
+            connection.execute(insert(table).values(
+                path=key, sha256=os.path.splitext(os.path.basename(key))[0],
+                size=os.path.getsize(path) if os.path.exists(path) else 0,
+                ref_count=delta, created_at=_now()
+            ))
+    except IntegrityError:
+        connection.execute(
+            update(table).where(table.c.path == key).values(ref_count=table.c.ref_count + delta)
+        )
+
+
+def _after_flush(session, flush_context):
+    pending = session.info.pop(_PENDING_KEY, None)
+    if not pending:
+        return
+    table = FileBlob.__table__
+    connection = session.connection()
+    for key, delta in pending.items():
+        if delta > 0:
+            _increment(connection, key, delta)
+        elif delta < 0:
+            connection.execute(
+                update(table).where(table.c.path == key).values(ref_count=table.c.ref_count + delta)
+            )
+            # Dosya burada silinmez: aynı içeriği o anda yükleyen bir istek dosyayı kullanıyor olabilir
+            connection.execute(delete(table).where(table.c.path == key, table.c.ref_count <= 0))
+
+
+def _after_rollback(session):
+    session.info.pop(_PENDING_KEY, None)
+
+
+def reconcile_blobs(grace=ORPHAN_GRACE_SECONDS):
+    """Referans sayılarını kayıtlardan yeniden hesaplar, sahipsiz dosyaları siler"""
+    refs = Counter()
+    for model, (column, config_key) in BLOB_COLUMNS.items():
+        base = _base(config_key)
+        attribute = getattr(model, column)
+        for stored in db.session.execute(select(attribute).where(attribute.like(BLOB_DIR + '/%'))).scalars():
+            refs[blob_key(stored, base)] += 1
+
+    table = FileBlob.__table__
+    summary = {'updated': 0, 'added': 0, 'removed_rows': 0, 'removed_files': 0}
+    with db.engine.begin() as connection:
+        existing = dict(connection.execute(select(table.c.path, table.c.ref_count)).all())
+        for key, ref_count in existing.items():
+            if key not in refs:
+                connection.execute(delete(table).where(table.c.path == key))
+                summary['removed_rows'] += 1
+            elif refs[key] != ref_count:
+                connection.execute(update(table).where(table.c.path == key).values(ref_count=refs[key]))
+                summary['updated'] += 1
+        for key, ref_count in refs.items():
+            if key not in existing:
+                _increment(connection, key, ref_count)
+                summary['added'] += 1
+
+    cutoff = time.time() - grace
+    roots = {os.path.abspath(storage_root())}
+    roots.update(os.path.abspath(_base(config_key)) for _, config_key in BLOB_COLUMNS.values() if config_key)
+    for root in roots:
+        for directory, _, filenames in os.walk(os.path.join(root, BLOB_DIR)):
+            for filename in filenames:
+                path = os.path.join(directory, filename)
+                if canonical_path(path) in refs:
+                    continue
+                try:
+                    if os.path.getmtime(path) < cutoff:
+                        os.remove(path)
+                        summary['removed_files'] += 1
+                except OSError as e:
+                    logger.warning("Sahipsiz blob silinemedi (%s): %s", path, e)
+    return summary
+
+
+def register_blob_listeners():
+    """Model ve session olaylarını bağlar (uygulama başlarken bir kez çağrılır)"""
+    if event.contains(Session, 'after_flush', _after_flush):
+        return
+    for model in BLOB_COLUMNS:
+        event.listen(model, 'after_insert', _after_insert)
+        event.listen(model, 'after_update', _after_update)
+        event.listen(model, 'before_delete', _before_delete)
+    event.listen(Session, 'after_flush', _after_flush)
+    event.listen(Session, 'after_rollback', _after_rollback)
+
+
+if __name__ == "__main__":
+    import sys
+    sys.path.insert(0, os.path.abspath(os.path.dirname(__file__)))
+
+    from dotenv import load_dotenv
+    load_dotenv()
+
+    from app import app
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    with app.app_context():
+        db.create_all()
+        logger.info("Blob uzlaştırma: %s", reconcile_blobs())
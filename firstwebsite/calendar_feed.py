@@ -0,0 +1,199 @@
+"""
+Takvim etkinlik akışı
+Takvim sayfası tüm etkinlikleri sayfaya gömmek yerine görünen aralığı (ay/hafta)
+/api/takvim/etkinlikler üzerinden ister.
+
+Her CalendarEvent ekleme/güncelleme/silme işlemi calendar_event_change
+tablosuna bir satır yazar; en büyük satır numarası takvimin "sürümü"dür:
+    - ETag sürüm + aralıktan üretilir, değişiklik yoksa 304 döner
+    - ?since=<sürüm> ile yalnızca o sürümden sonra değişen etkinlikler ve
+      silinen/aralık dışına taşınan etkinliklerin id'leri döner
+    - Query.update()/delete() gibi toplu işlemler tek tek izlenemediği için
+      event_id'si boş bir satır yazılır; istemci bunu görünce tam yenileme yapar
+
+Satır numaraları commit sırasında değil ekleme anında verilir: uzun süren bir
+işlem, kendisinden sonra başlayıp önce commit edilen işlemden küçük numarayla
+görünür hale gelebilir. Bu yüzden since sorgusu son CALENDAR_CHANGE_OVERLAP
+satırı yeniden tarar (id > since - N) ve ETag günlükteki satır sayısını da
+içerir; istemci etkinlikleri id ile günceller, aynı değişikliği iki kez almak
+sonucu değiştirmez.
+
+Günlük sınırsız büyümesin diye CALENDAR_CHANGE_RETENTION_DAYS günden eski
+satırlar temizleme işiyle silinir (sürüm geri gitmesin diye en son satır
+korunur). Silinmiş aralığa düşen bir since sürümüyle gelen istemci tam
+yenileme yapar. Cron job olarak:
+
+    30 3 * * * cd /var/www/lawautomation/firstwebsite && python calendar_feed.py
+
+Mevcut veritabanlarında tablo ve tarih indeksi migration ile eklenir (flask db
+upgrade, bkz. migrations/versions/3f9c2a7d1b04_add_hot_path_indexes.py ve
+migrations/versions/e7b3d1a5c942_add_calendar_event_change.py).
+"""
+
+import os
+import logging
+from datetime import datetime, timezone, timedelta
+
+from sqlalchemy import delete, event, func, insert, select
+from sqlalchemy.orm import Session
+
+from models import db, CalendarEvent, CalendarEventChange
+
+logger = logging.getLogger(__name__)
+
+MAX_RANGE_DAYS = 366
+RETENTION_DAYS = int(os.getenv('CALENDAR_CHANGE_RETENTION_DAYS', 30))
+CHANGE_OVERLAP = int(os.getenv('CALENDAR_CHANGE_OVERLAP', 200))
+
+
+def serialize_calendar_event(event):
+    return {
+        'id': event.id,
+        'title': event.title,
+        'date': event.date.strftime('%Y-%m-%d'),
+        'time': event.time.strftime('%H:%M') if event.time else None,
+        'event_type': event.event_type,
+        'description': event.description,
+        'assigned_to': event.assigned_to,
+        'file_type': event.file_type,
+        'courthouse': event.courthouse,
+        'department': event.department,
+        'deadline_date': event.deadline_date.strftime('%Y-%m-%d') if event.deadline_date else None,
+        'is_completed': event.is_completed,
+        'muvekkil_isim': event.muvekkil_isim,
+        'muvekkil_telefon': event.muvekkil_telefon,
+        'basvuran_isim': event.basvuran_isim,
+        'basvuran_telefon': event.basvuran_telefon,
+        'aleyhindeki_isim': event.aleyhindeki_isim,
+        'aleyhindeki_telefon': event.aleyhindeki_telefon,
+        'arabulucu_isim': event.arabulucu_isim,
+        'arabulucu_telefon': event.arabulucu_telefon,
+        'arabuluculuk_turu': event.arabuluculuk_turu,
+        'toplanti_adresi': event.toplanti_adresi
+    }
+
+
+def parse_range(start, end):
+    """'YYYY-MM-DD' aralığını doğrular; hatalıysa ValueError"""
+    start_date = datetime.strptime(start or '', '%Y-%m-%d').date()
+    end_date = datetime.strptime(end or '', '%Y-%m-%d').date()
+    if end_date < start_date:
+        raise ValueError("Bitiş tarihi başlangıçtan önce olamaz")
+    if (end_date - start_date).days > MAX_RANGE_DAYS:
+        raise ValueError(f"Tarih aralığı en fazla {MAX_RANGE_DAYS} gün olabilir")
+    return start_date, end_date
+
+
+def month_range(day):
+    """Verilen günün ayının ilk ve son günü"""
+    start = day.replace(day=1)
+    next_month = (start + timedelta(days=32)).replace(day=1)
+    return start, next_month - timedelta(days=1)
+
+
+def get_calendar_version():
+    return db.session.query(func.max(CalendarEventChange.id)).scalar() or 0
+
+
+def get_calendar_state():
+    """(sürüm, günlük satır sayısı); sayı, sürümden küçük numarayla geç commit
+    edilen değişikliklerde de ETag'in değişmesi için kullanılır"""
+    version, count = db.session.query(func.max(CalendarEventChange.id), func.count(CalendarEventChange.id)).one()
+    return version or 0, count
+
+
+def get_events_in_range(start_date, end_date):
+    return CalendarEvent.query.filter(
+        CalendarEvent.date >= start_date,
+        CalendarEvent.date <= end_date
+    ).order_by(CalendarEvent.date.asc(), CalendarEvent.time.asc()).all()
+
+
+def get_changes_since(version, start_date, end_date):
+    """(değişen etkinlikler, kaldırılacak id'ler, tam_yenileme_gerekli) döndürür"""
+    oldest = db.session.query(func.min(CalendarEventChange.id)).scalar()
+    if oldest is not None and version < oldest - 1:
+        # Sürümden sonraki değişikliklerin bir kısmı temizlenmiş olabilir
+        return [], [], True
+    event_ids = set()
+    # Geç commit edilen işlemler için son CHANGE_OVERLAP satır yeniden taranır
+    window_start = version - CHANGE_OVERLAP
+    for (event_id,) in db.session.query(CalendarEventChange.event_id).filter(CalendarEventChange.id > window_start):
+        if event_id is None:
+            return [], [], True
+        event_ids.add(event_id)
+    if not event_ids:
+        return [], [], False
+    events = CalendarEvent.query.filter(CalendarEvent.id.in_(event_ids)).all()
+    changed = [e for e in events if start_date <= e.date <= end_date]
+    # Silinen veya aralık dışına taşınan etkinlikler istemciden kaldırılır
+    removed = sorted(event_ids - {e.id for e in changed})
+    return changed, removed, False
+
+
+def prune_changes(days=RETENTION_DAYS):
+    """days günden eski günlük satırlarını siler (en son satır hariç); silinen satır sayısını döndürür"""
+    table = CalendarEventChange.__table__
+    cutoff = datetime.now(timezone(timedelta(hours=3))) - timedelta(days=days)
+    with db.engine.begin() as connection:
+        latest = connection.execute(select(func.max(table.c.id))).scalar()
+        if latest is None:
+            return 0
+        result = connection.execute(delete(table).where(table.c.changed_at < cutoff, table.c.id < latest))
+    return result.rowcount
+
+
+def _record_change(connection, event_id, deleted=False):
+    connection.execute(insert(CalendarEventChange.__table__).values(
+        event_id=event_id,
+        deleted=deleted,
+        changed_at=datetime.now(timezone(timedelta(hours=3)))
+    ))
+
+
+def _after_insert(mapper, connection, target):
+    _record_change(connection, target.id)
+
+
+def _after_update(mapper, connection, target):
+    _record_change(connection, target.id)
+
+
+def _after_delete(mapper, connection, target):
+    _record_change(connection, target.id, deleted=True)
+
+
+def _do_orm_execute(orm_execute_state):
+    # Toplu güncelleme/silmede hangi satırların değiştiği bilinmez: tam yenileme işareti bırak
+    if not (orm_execute_state.is_update or orm_execute_state.is_delete):
+        return None
+    mapper = orm_execute_state.bind_mapper
+    if mapper is None or mapper.class_ is not CalendarEvent:
+        return None
+    result = orm_execute_state.invoke_statement()
+    _record_change(orm_execute_state.session.connection(), None, deleted=orm_execute_state.is_delete)
+    return result
+
+
+def register_calendar_listeners():
+    """CalendarEvent değişikliklerini günlüğe yazan olayları bağlar (bir kez çağrılır)"""
+    if event.contains(CalendarEvent, 'after_insert', _after_insert):
+        return
+    event.listen(CalendarEvent, 'after_insert', _after_insert)
+    event.listen(CalendarEvent, 'after_update', _after_update)
+    event.listen(CalendarEvent, 'after_delete', _after_delete)
+    event.listen(Session, 'do_orm_execute', _do_orm_execute)
+
+
+if __name__ == "__main__":
+    import sys
+    sys.path.insert(0, os.path.abspath(os.path.dirname(__file__)))
+
+    from dotenv import load_dotenv
+    load_dotenv()
+
+    from app import app
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    with app.app_context():
+        logger.info("Takvim değişiklik günlüğünden %d eski satır silindi", prune_changes())
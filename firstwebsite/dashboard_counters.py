@@ -0,0 +1,279 @@
+#!/usr/bin/env python3
+"""
+Panel sayaçları (materialized counters)
+Anasayfa ve veritabanı yönetimi sayfalarındaki kayıt sayıları her istekte ayrı
+COUNT(*) sorgularıyla hesaplanmak yerine dashboard_counter tablosundan tek
+sorguyla okunur.
+
+Sayaçlar SQLAlchemy olaylarıyla aynı transaction içinde güncellenir:
+    - after_insert / after_update / before_delete: flush boyunca değişimler
+      toplanır, after_flush'ta sayaç başına tek UPDATE ile yazılır
+    - Query.update() / Query.delete() gibi toplu işlemler: ilgili modelin
+      sayaçları aynı transaction içinde yeniden sayılır
+
+Mevcut veritabanlarında tablo migration ile eklenir (flask db upgrade,
+bkz. migrations/versions/c2f6a9e4b815_add_dashboard_counter.py).
+
+Olayları atlayan değişikliklere (ham SQL, dış araçlar) karşı uzlaştırma işi
+düzenli çalıştırılmalıdır. Cron job olarak:
+
+    */15 * * * * cd /var/www/lawautomation/firstwebsite && python dashboard_counters.py
+"""
+
+import logging
+from datetime import datetime, timezone, timedelta
+
+from sqlalchemy import event, func, insert, inspect, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, object_session
+
+from models import (
+    db, DashboardCounter, User, CaseFile, CalendarEvent, Announcement, Client, Payment, Document,
+    Expense, Notification, ActivityLog, IsciGorusmeTutanagi, WorkerInterview,
+    OrnekDilekce, OrnekSozlesme, DilekceKategori
+)
+
+logger = logging.getLogger(__name__)
+
+_PENDING_KEY = 'dashboard_counter_deltas'
+_RECOUNT_KEY = 'dashboard_counter_recount'
+_UNKNOWN = object()
+_HEARING_TYPES = ('durusma', 'e-durusma')
+
+
+class CounterSpec:
+    """Bir sayacın tanımı: model, (opsiyonel) koşul ve koşulun bağlı olduğu kolonlar"""
+
+    def __init__(self, model, columns=(), matches=None, condition=None):
+        self.model = model
+        self.columns = columns
+        self.matches = matches      # Python tarafı: kolon değerleri -> bool
+        self.condition = condition  # SQL tarafı: uzlaştırma için WHERE ifadesi
+
+    def count_query(self):
+        query = select(func.count()).select_from(self.model.__table__)
+        if self.condition is not None:
+            query = query.where(self.condition())
+        return query
+
+
+COUNTERS = {
+    'kullanici_sayisi': CounterSpec(User),
+    'onaysiz_kullanici_sayisi': CounterSpec(
+        User, ('is_approved',),
+        lambda v: v['is_approved'] == False,
+        lambda: User.is_approved == False
+    ),
+    'dosya_sayisi': CounterSpec(CaseFile),
+    'aktif_dosya_sayisi': CounterSpec(
+        CaseFile, ('status',), lambda v: v['status'] == 'Aktif', lambda: CaseFile.status == 'Aktif'
+    ),
+    'beklemede_dosya_sayisi': CounterSpec(
+        CaseFile, ('status',), lambda v: v['status'] == 'Beklemede', lambda: CaseFile.status == 'Beklemede'
+    ),
+    'kapali_dosya_sayisi': CounterSpec(
+        CaseFile, ('status',), lambda v: v['status'] == 'Kapalı', lambda: CaseFile.status == 'Kapalı'
+    ),
+    'hukuk_dosya_sayisi': CounterSpec(
+        CaseFile, ('file_type',),
+        lambda v: (v['file_type'] or '').lower() == 'hukuk',
+        lambda: func.lower(CaseFile.file_type) == 'hukuk'
+    ),
+    'ceza_dosya_sayisi': CounterSpec(
+        CaseFile, ('file_type',),
+        lambda v: (v['file_type'] or '').lower() == 'ceza',
+        lambda: func.lower(CaseFile.file_type) == 'ceza'
+    ),
+    'icra_dosya_sayisi': CounterSpec(
+        CaseFile, ('file_type',),
+        lambda v: (v['file_type'] or '').lower() == 'icra',
+        lambda: func.lower(CaseFile.file_type) == 'icra'
+    ),
+    'etkinlik_sayisi': CounterSpec(CalendarEvent),
+    'durusma_sayisi': CounterSpec(
+        CalendarEvent, ('event_type',),
+        lambda v: v['event_type'] in _HEARING_TYPES,
+        lambda: CalendarEvent.event_type.in_(_HEARING_TYPES)
+    ),
+    'duyuru_sayisi': CounterSpec(Announcement),
+    'musteri_sayisi': CounterSpec(Client),
+    'odeme_kaydi_sayisi': CounterSpec(Payment),
+    'belge_sayisi': CounterSpec(Document),
+    'masraf_sayisi': CounterSpec(Expense),
+    'bildirim_sayisi': CounterSpec(Notification),
+    'aktivite_sayisi': CounterSpec(ActivityLog),
+    'isci_gorusme_sayisi': CounterSpec(IsciGorusmeTutanagi),
+    'worker_interview_sayisi': CounterSpec(WorkerInterview),
+    'ornek_dilekce_sayisi': CounterSpec(OrnekDilekce),
+    'ornek_sozlesme_sayisi': CounterSpec(OrnekSozlesme),
+    'dilekce_kategori_sayisi': CounterSpec(DilekceKategori),
+}
+
+_SPECS_BY_MODEL = {}
+for _name, _spec in COUNTERS.items():
+    _SPECS_BY_MODEL.setdefault(_spec.model, []).append((_name, _spec))
+
+
+def _now():
+    return datetime.now(timezone(timedelta(hours=3)))
+
+
+def _add_delta(target, name, delta):
+    if not delta:
+        return
+    session = object_session(target)
+    if session is None:
+        return
+    pending = session.info.setdefault(_PENDING_KEY, {})
+    pending[name] = pending.get(name, 0) + delta
+
+
+def _current_values(target, columns):
+    return {column: getattr(target, column) for column in columns}
+
+
+def _previous_values(target, columns):
+    """Flush öncesi kolon değerleri; eski değer hiç yüklenmemişse _UNKNOWN"""
+    state = inspect(target)
+    values = {}
+    for column in columns:
+        history = state.attrs[column].history
+        if not history.has_changes():
+            values[column] = getattr(target, column)
+        elif history.deleted:
+            values[column] = history.deleted[0]
+        else:
+            return _UNKNOWN
+    return values
+
+
+def _after_insert(mapper, connection, target):
+    for name, spec in _SPECS_BY_MODEL.get(mapper.class_, []):
+        if spec.matches is None or spec.matches(_current_values(target, spec.columns)):
+            _add_delta(target, name, 1)
+
+
+def _after_update(mapper, connection, target):
+    for name, spec in _SPECS_BY_MODEL.get(mapper.class_, []):
+        if spec.matches is None:
+            continue
+        previous = _previous_values(target, spec.columns)
+        if previous is _UNKNOWN:
+            # Eski değer bilinmiyor, bu sayaç flush sonunda yeniden sayılır
+            session = object_session(target)
+            if session is not None:
+                session.info.setdefault(_RECOUNT_KEY, set()).add(name)
+            continue
+        before = spec.matches(previous)
+        after = spec.matches(_current_values(target, spec.columns))
+        _add_delta(target, name, int(after) - int(before))
+
+
+def _before_delete(mapper, connection, target):
+    # Satır henüz silinmediği için süresi dolmuş kolonlar güvenle yüklenebilir
+    for name, spec in _SPECS_BY_MODEL.get(mapper.class_, []):
+        if spec.matches is None or spec.matches(_current_values(target, spec.columns)):
+            _add_delta(target, name, -1)
+
+
+def _after_flush(session, flush_context):
+    pending = session.info.pop(_PENDING_KEY, None)
+    recount = session.info.pop(_RECOUNT_KEY, None)
+    if not pending and not recount:
+        return
+    table = DashboardCounter.__table__
+    connection = session.connection()
+    for name, delta in (pending or {}).items():
+        if delta and name not in (recount or ()):
+            connection.execute(
+                update(table).where(table.c.name == name)
+                .values(value=table.c.value + delta, updated_at=_now())
+            )
+    if recount:
+        _recount(connection, sorted(recount))
+
+
+def _after_rollback(session):
+    session.info.pop(_PENDING_KEY, None)
+    session.info.pop(_RECOUNT_KEY, None)
+
+
+def _do_orm_execute(orm_execute_state):
+    # Query.update()/delete() mapper olaylarını tetiklemez; etkilenen sayaçları yeniden say
+    if not (orm_execute_state.is_update or orm_execute_state.is_delete):
+        return None
+    mapper = orm_execute_state.bind_mapper
+    if mapper is None or mapper.class_ not in _SPECS_BY_MODEL:
+        return None
+    result = orm_execute_state.invoke_statement()
+    names = [name for name, _ in _SPECS_BY_MODEL[mapper.class_]]
+    _recount(orm_execute_state.session.connection(), names)
+    return result
+
+
+def _recount(connection, names):
+    """Verilen sayaçları gerçek COUNT(*) değerleriyle günceller; eksik satırları ekler"""
+    table = DashboardCounter.__table__
+    values = {}
+    for name in names:
+        value = connection.execute(COUNTERS[name].count_query()).scalar() or 0
+        updated = connection.execute(
+            update(table).where(table.c.name == name).values(value=value, updated_at=_now())
+        )
+        if updated.rowcount == 0:
+            connection.execute(insert(table).values(name=name, value=value, updated_at=_now()))
+        values[name] = value
+    return values
+
+
+def reconcile_counters(names=None):
+    """Sayaçları tablolarla uzlaştırır (kayma düzeltme); {ad: değer} döndürür"""
+    names = list(names or COUNTERS)
+    try:
+        with db.engine.begin() as connection:
+            return _recount(connection, names)
+    except IntegrityError:
+        # Başka bir worker aynı anda eksik satırları eklediyse yeniden dene (artık UPDATE yeterli)
+        with db.engine.begin() as connection:
+            return _recount(connection, names)
+
+
+def get_counters():
+    """Tüm sayaçları tek sorguyla okur; hiç uzlaştırılmamış sayaçlar varsa önce hesaplar"""
+    table = DashboardCounter.__table__
+    rows = db.session.execute(select(table.c.name, table.c.value)).all()
+    counters = {name: value for name, value in rows}
+    missing = [name for name in COUNTERS if name not in counters]
+    if missing:
+        counters.update(reconcile_counters(missing))
+    return counters
+
+
+def register_counter_listeners():
+    """Model ve session olaylarını bağlar (uygulama başlarken bir kez çağrılır)"""
+    if event.contains(Session, 'after_flush', _after_flush):
+        return
+    for model in _SPECS_BY_MODEL:
+        event.listen(model, 'after_insert', _after_insert)
+        event.listen(model, 'after_update', _after_update)
+        event.listen(model, 'before_delete', _before_delete)
+    event.listen(Session, 'after_flush', _after_flush)
+    event.listen(Session, 'after_rollback', _after_rollback)
+    event.listen(Session, 'do_orm_execute', _do_orm_execute)
+
+
+if __name__ == "__main__":
+    import sys
+    import os
+    sys.path.insert(0, os.path.abspath(os.path.dirname(__file__)))
+
+    from dotenv import load_dotenv
+    load_dotenv()
+
+    from app import app
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    with app.app_context():
+        db.create_all()
+        for name, value in reconcile_counters().items():
+            logger.info(f"{name} = {value}")
@@ -0,0 +1,239 @@
+"""
+Arka plan belge dönüştürme kuyruğu
+UDF/DOC/DOCX belgelerinin PDF'e dönüştürülmesi (LibreOffice, mammoth+pdfkit)
+istek içinde saniyeler sürebilir. Yükleme ve önizleme istekleri dönüştürmeyi
+beklemek yerine belge id'sini sınırlı bir kuyruğa ekler; sabit sayıda
+(DOCUMENT_CONVERSION_WORKERS) arka plan thread'i dönüştürür, PDF'i yükleme
+klasörüne kaydeder ve Document.pdf_version'a yazar. Sonraki önizlemeler
+doğrudan send_file ile döner.
+
+    - Aynı belge kuyrukta/dönüşümdeyken tekrar eklenmez
+    - pdf_version yalnızca boşsa yazılır (başka worker önce bitirdiyse
+      üretilen kopya silinir)
+    - Başarısız dönüşümler DOCUMENT_CONVERSION_RETRY_AFTER saniye boyunca
+      yeniden denenmez; önizleme orijinal dosyayı gösterir
+    - Kuyruk doluysa iş atlanır, bir sonraki önizlemede yeniden eklenir
+
+DOCUMENT_CONVERSION_MODE=sync (veya app.config['TESTING']) ile dönüşüm eski
+davranıştaki gibi istek içinde yapılır.
+"""
+
+import os
+import time
+import queue
+import atexit
+import shutil
+import logging
+import tempfile
+import threading
+from pathlib import Path
+
+from flask import current_app
+from sqlalchemy import select, update
+from sqlalchemy.orm import Session
+from werkzeug.utils import secure_filename
+
+from models import db, Document
+
+logger = logging.getLogger(__name__)
+
+CONVERTIBLE_EXTENSIONS = ('.udf', '.doc', '.docx')
+
+WORKERS = int(os.getenv('DOCUMENT_CONVERSION_WORKERS', 2))
+MAX_QUEUE_SIZE = int(os.getenv('DOCUMENT_CONVERSION_MAX_QUEUE', 100))
+RETRY_AFTER_SECONDS = float(os.getenv('DOCUMENT_CONVERSION_RETRY_AFTER', 600))
+
+_STOP = object()
+
+
+def needs_conversion(filename):
+    return os.path.splitext(filename or '')[1].lower() in CONVERTIBLE_EXTENSIONS
+
+
+def libreoffice_profile_arg():
+    """Thread başına ayrı LibreOffice profili: aynı profili kullanan eşzamanlı
+    soffice süreçleri birbirini kilitler"""
+    profile_dir = os.path.join(tempfile.gettempdir(), f"lo_profile_{threading.current_thread().name}")
+    return f"-env:UserInstallation={Path(profile_dir).as_uri()}"
+
+
+def pdf_filename_for(document):
+    base_name = secure_filename(os.path.splitext(document.filename or '')[0]) or 'belge'
+    return f"{document.case_id}_{int(time.time())}_{document.id}_converted_{base_name}.pdf"
+
+
+class DocumentConverter:
+    """Belge id'lerini kuyruktan alıp PDF'e dönüştüren sınırlı arka plan havuzu"""
+
+    def __init__(self, app=None, convert=None, resolve=None, workers=WORKERS, max_queue=MAX_QUEUE_SIZE,
+                 retry_after=RETRY_AFTER_SECONDS):
+        self.app = None
+        self.convert = convert    # kaynak dosya yolu -> geçici PDF yolu veya None
+        self.resolve = resolve    # veritabanındaki yol -> diskteki yol veya None
+        self.workers = max(1, workers)
+        self.retry_after = retry_after
+        self._queue = queue.Queue(maxsize=max_queue)
+        self._lock = threading.Lock()
+        self._threads = []
+        self._pid = None
+        self._pending = set()
+        self._failed = {}
+        self._converted = 0
+        if app is not None:
+            self.init_app(app, convert, resolve)
+
+    def init_app(self, app, convert, resolve):
+        self.app = app
+        self.convert = convert
+        self.resolve = resolve
+        app.config.setdefault('DOCUMENT_CONVERSION_MODE', os.getenv('DOCUMENT_CONVERSION_MODE', 'async').lower())
+        atexit.register(self.close)
+
+    def is_synchronous(self):
+        config = current_app.config
+        return config.get('DOCUMENT_CONVERSION_MODE') == 'sync' or config.get('TESTING', False)
+
+    def status(self, document_id):
+        """'pending' (kuyrukta/dönüşümde), 'failed' (yakın zamanda başarısız) veya None"""
+        if document_id in self._pending:
+            return 'pending'
+        failed_at = self._failed.get(document_id)
+        if failed_at is not None and time.monotonic() - failed_at < self.retry_after:
+            return 'failed'
+        return None
+
+    def _mark_failed(self, document_id):
+        now = time.monotonic()
+        with self._lock:
+            # Süresi dolan kayıtlar da atılır; sözlük yalnızca son retry_after içindeki hataları tutar
+            for expired in [key for key, failed_at in self._failed.items() if now - failed_at >= self.retry_after]:
+                del self._failed[expired]
+            self._failed[document_id] = now
+
+    def enqueue(self, document_id):
+        """Belgeyi dönüşüm kuyruğuna ekler; belgenin güncel durumunu döndürür"""
+        state = self.status(document_id)
+        if state is not None:
+            return state
+        if self.is_synchronous():
+            self._convert(document_id)
+            return self.status(document_id)
+        self._ensure_workers()
+        with self._lock:
+            if document_id in self._pending:
+                return 'pending'
+            self._pending.add(document_id)
+        try:
+            self._queue.put_nowait(document_id)
+        except queue.Full:
+            self._pending.discard(document_id)
+            logger.warning("Belge dönüşüm kuyruğu dolu, belge %s sonraki önizlemede denenecek", document_id)
+            return None
+        return 'pending'
+
+    def _ensure_workers(self):
+        # Fork edilen worker süreçlerinde (gunicorn) thread'ler yeniden başlatılır
+        if self._pid == os.getpid() and all(thread.is_alive() for thread in self._threads):
+            return
+        with self._lock:
+            if self._pid != os.getpid():
+                self._queue = queue.Queue(maxsize=self._queue.maxsize)
+                self._pending = set()
+                self._threads = []
+                self._pid = os.getpid()
+            self._threads = [thread for thread in self._threads if thread.is_alive()]
+            while len(self._threads) < self.workers:
+                thread = threading.Thread(target=self._run, name=f"document-converter-{len(self._threads) + 1}",
+                                          daemon=True)
+                thread.start()
+                self._threads.append(thread)
+
+    def _run(self):
+        while True:
+            document_id = self._queue.get()
+            if document_id is _STOP:
+                return
+            try:
+                self._convert(document_id)
+            finally:
+                self._pending.discard(document_id)
+
+    def _convert(self, document_id):
+        started = time.monotonic()
+        try:
+            with self.app.app_context():
+                with Session(db.engine) as session:
+                    document = session.get(Document, document_id)
+                    if document is None:
+                        return
+                    if document.pdf_version and self.resolve(document.pdf_version):
+                        return
+                    source_path = self.resolve(document.filepath)
+                    if not source_path:
+                        logger.warning("Dönüştürülecek belge dosyası bulunamadı: %s", document.filepath)
+                        self._mark_failed(document_id)
+                        return
+
+                    temp_pdf = self.convert(source_path)
+                    if not temp_pdf or not os.path.exists(temp_pdf):
+                        logger.warning("Belge %s PDF'e dönüştürülemedi", document_id)
+                        self._mark_failed(document_id)
+                        return
+
+                    pdf_filename = pdf_filename_for(document)
+                    target_path = os.path.join(self.app.config['UPLOAD_FOLDER'], pdf_filename)
+                    os.makedirs(os.path.dirname(target_path) or '.', exist_ok=True)
+                    shutil.move(temp_pdf, target_path)
+
+                    # Başka bir süreç aynı belgeyi önce bitirdiyse onunkini koru
+                    table = Document.__table__
+                    connection = session.connection()
+                    result = connection.execute(
+                        update(table).where(table.c.id == document_id, table.c.pdf_version.is_(None))
+                        .values(pdf_version=pdf_filename)
+                    )
+                    if result.rowcount == 0:
+                        current = connection.execute(
+                            select(table.c.pdf_version).where(table.c.id == document_id)
+                        ).scalar()
+                        if current and self.resolve(current):
+                            session.rollback()
+                            os.remove(target_path)
+                            return
+                        # Kayıtlı PDF diskte yok: yenisiyle değiştir
+                        connection.execute(
+                            update(table).where(table.c.id == document_id).values(pdf_version=pdf_filename)
+                        )
+                    session.commit()
+                    self._failed.pop(document_id, None)
+                    self._converted += 1
+                    logger.info("Belge %s PDF'e dönüştürüldü (%.1f sn): %s",
+                                document_id, time.monotonic() - started, pdf_filename)
+        except Exception as e:
+            self._mark_failed(document_id)
+            logger.error("Belge %s dönüştürülürken hata: %s", document_id, e)
+
+    def close(self, timeout=30):
+        """Bekleyen dönüşümleri bitirir ve thread'leri durdurur (süreç kapanırken çağrılır)"""
+        if self._pid != os.getpid():
+            return
+        threads = [thread for thread in self._threads if thread.is_alive()]
+        for _ in threads:
+            try:
+                self._queue.put(_STOP, timeout=timeout)
+            except queue.Full:
+                logger.error("Belge dönüşüm kuyruğu kapanışta boşaltılamadı")
+                return
+        for thread in threads:
+            thread.join(timeout)
+
+    def stats(self):
+        return {
+            'queued': self._queue.qsize(),
+            'pending': len(self._pending),
+            'failed': len(self._failed),
+            'converted': self._converted,
+        }
+
+
+document_converter = DocumentConverter()
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Belge dosya yollarını kanonik biçime çeviren tek seferlik migration (bkz. file_storage.py)
+Document.filepath / pdf_version, PaymentDocument.filepath ve OrnekDilekce.dosya_yolu
+kayıtları için dosya diskte aranır, bulunan konum kanonik yol olarak yazılır.
+
+    - Kayıtlı yol doğrudan çözülüyorsa yalnızca biçimi düzeltilir ('\\' ayraçlar,
+      kök altındaki mutlak yollar)
+    - Çözülmüyorsa önce eski aday listesi, sonra bilinen yükleme klasörlerinin
+      dosya adına göre taranmış indeksi kullanılır (tek eşleşme şartıyla)
+    - Bulunamayan dosyalar raporlanır, kayıtlara dokunulmaz
+
+Kullanım:
+    cd /var/www/lawautomation/firstwebsite
+    python document_path_migration.py --dry-run
+    python document_path_migration.py
+"""
+
+import os
+import sys
+import argparse
+import logging
+
+sys.path.insert(0, os.path.abspath(os.path.dirname(__file__)))
+
+logger = logging.getLogger(__name__)
+
+BATCH_SIZE = 200
+
+
+def build_disk_index(roots):
+    """Dosya adı -> bulunduğu yollar (eski kayıtlar için son çare)"""
+    index = {}
+    for root in roots:
+        if not os.path.isdir(root):
+            continue
+        for directory, _, filenames in os.walk(root):
+            for filename in filenames:
+                index.setdefault(filename, set()).add(os.path.abspath(os.path.join(directory, filename)))
+    return index
+
+
+def locate(stored, base, disk_index):
+    from file_storage import direct_path, path_resolver
+
+    path = direct_path(stored, base)
+    if os.path.isfile(path):
+        return path
+    path = path_resolver.resolve(stored, base)
+    if path:
+        return path
+    matches = disk_index.get(os.path.basename(stored.replace('\\', '/')), ())
+    if len(matches) == 1:
+        return next(iter(matches))
+    return None
+
+
+def migrate(dry_run=False):
+    from models import db, Document, PaymentDocument, OrnekDilekce
+    from file_storage import canonical_path
+    from flask import current_app
+
+    upload_folder = current_app.config['UPLOAD_FOLDER']
+    dilekce_folder = current_app.config['ORNEK_DILEKCE_UPLOAD_FOLDER']
+    disk_index = build_disk_index([
+        upload_folder,
+        os.path.join(os.getcwd(), 'firstwebsite', 'static', 'uploads'),
+        os.path.join(os.getcwd(), 'firstwebsite', 'uploads'),
+        os.path.join(os.getcwd(), 'documents'),
+        os.path.join('/tmp', 'law_app_uploads'),
+    ])
+
+    targets = [
+        (Document, 'filepath', None),
+        (Document, 'pdf_version', None),
+        (PaymentDocument, 'filepath', None),
+        (OrnekDilekce, 'dosya_yolu', dilekce_folder),
+    ]
+    summary = {'ok': 0, 'updated': 0, 'missing': 0}
+    for model, column, base in targets:
+        pending = 0
+        for record in model.query.filter(getattr(model, column).isnot(None)).yield_per(BATCH_SIZE):
+            stored = getattr(record, column)
+            if not stored:
+                continue
+            path = locate(stored, base, disk_index)
+            if path is None:
+                summary['missing'] += 1
+                logger.warning("%s #%s %s: dosya bulunamadı (%s)", model.__name__, record.id, column, stored)
+                continue
+            canonical = canonical_path(path, base)
+            if canonical == stored:
+                summary['ok'] += 1
+                continue
+            summary['updated'] += 1
+            logger.info("%s #%s %s: %s -> %s", model.__name__, record.id, column, stored, canonical)
+            if not dry_run:
+                setattr(record, column, canonical)
+                pending += 1
+                if pending >= BATCH_SIZE:
+                    db.session.commit()
+                    pending = 0
+        if not dry_run:
+            db.session.commit()
+    return summary
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Belge dosya yollarını kanonik biçime çevirir")
+    parser.add_argument('--dry-run', action='store_true', help="Değişiklikleri yalnızca listele")
+    args = parser.parse_args()
+
+    from dotenv import load_dotenv
+    load_dotenv()
+
+    from app import app
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s', force=True)
+    with app.app_context():
+        result = migrate(dry_run=args.dry_run)
+        logger.info("Doğru: %(ok)s, güncellenen: %(updated)s, bulunamayan: %(missing)s", result)
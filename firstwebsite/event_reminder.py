@@ -18,14 +18,15 @@ from email_utils import send_calendar_event_reminder_email
 from app import app
 import logging
 
-# Logger ayarla
+# Logger ayarla (app import edilirken kurulan kuyruk handler'ının yerine dosyaya da yaz)
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
     handlers=[
         logging.FileHandler('reminder_log.txt'),
         logging.StreamHandler()
-    ]
+    ],
+    force=True
 )
 logger = logging.getLogger(__name__)
 
@@ -0,0 +1,147 @@
+"""
+Belge dosya konumları
+Veritabanındaki dosya yolları (Document.filepath / pdf_version,
+PaymentDocument.filepath, OrnekDilekce.dosya_yolu) tek bir kanonik biçimde
+saklanır: dosya kök klasörün (UPLOAD_FOLDER, örnek dilekçeler için
+ORNEK_DILEKCE_UPLOAD_FOLDER) altındaysa '/' ayraçlı göreceli yol, değilse
+mutlak yol. Kanonik bir yolu çözmek tek bir stat çağrısıdır.
+
+Eski kayıtlarda 'static/uploads/...', '../documents/...', yalnızca dosya adı
+gibi biçimler bulunabilir. Bunlar için eski aday listesi bir kez taranır ve
+bulunan konum süreç içinde önbelleğe alınır (FILE_PATH_CACHE_SIZE); sonraki
+çözümlemeler yine tek stat'tır. Eski kayıtları kalıcı olarak düzeltmek için:
+
+    python document_path_migration.py --dry-run
+    python document_path_migration.py
+"""
+
+import os
+import threading
+from collections import OrderedDict
+
+from flask import current_app
+
+CACHE_SIZE = int(os.getenv('FILE_PATH_CACHE_SIZE', 4096))
+
+
+def storage_root():
+    return current_app.config['UPLOAD_FOLDER']
+
+
+def canonical_path(path, base=None):
+    """Diskteki yolu veritabanına yazılacak kanonik biçime çevirir"""
+    base = os.path.abspath(base or storage_root())
+    path = os.path.abspath(path)
+    try:
+        relative = os.path.relpath(path, base)
+    except ValueError:  # Windows: farklı sürücü
+        return path
+    if relative == os.pardir or relative.startswith(os.pardir + os.sep):
+        return path
+    return relative.replace(os.sep, '/')
+
+
+def direct_path(stored, base=None):
+    """Kanonik yolun diskteki karşılığı (varlığı kontrol edilmez)"""
+    if os.path.isabs(stored):
+        return stored
+    return os.path.join(base or storage_root(), *stored.replace('\\', '/').split('/'))
+
+
+def legacy_candidates(stored):
+    """Eski kayıt biçimleri için denenecek yollar (önceki find_document_file sırasıyla)"""
+    upload_folder = current_app.config['UPLOAD_FOLDER']
+    candidates = []
+
+    # 'static/uploads/...' veya 'firstwebsite/static/uploads/...' gibi
+    norm = stored.replace('\\', '/')
+    if norm.startswith('static/'):
+        norm = norm[len('static/'):]
+    if norm.startswith('firstwebsite/static/'):
+        norm = norm[len('firstwebsite/static/'):]
+    if norm.startswith('uploads/'):
+        candidates.append(os.path.join(upload_folder, norm[len('uploads/'):]))
+    if 'uploads/' in norm:
+        candidates.append(os.path.join(upload_folder, norm[norm.find('uploads/') + len('uploads/'):]))
+
+    if os.path.isabs(stored):
+        candidates.append(stored)
+    else:
+        base_paths = [
+            upload_folder,
+            os.path.join(upload_folder, 'documents'),
+            os.getcwd(),
+            os.path.join(os.getcwd(), 'firstwebsite'),
+            os.path.join(os.getcwd(), 'firstwebsite', 'static'),
+            '/'
+        ]
+        candidates.extend(os.path.join(base_path, stored) for base_path in base_paths)
+        # Eski format uyumlu yollar
+        candidates.append(os.path.join(upload_folder, 'documents', os.path.basename(stored)))
+        candidates.append(os.path.join(upload_folder, 'documents', stored))
+    return candidates
+
+
+class PathResolver:
+    """Kayıtlı yolu diskteki dosyaya çözer; eski biçimlerin sonucu önbelleğe alınır"""
+
+    def __init__(self, size=CACHE_SIZE):
+        self.size = max(1, size)
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+        self._direct = 0
+        self._cached = 0
+        self._probed = 0
+        self._missing = 0
+
+    def resolve(self, stored, base=None):
+        if not stored:
+            return None
+        key = (base, stored)
+        cached = self._cache.get(key)
+        if cached is not None:
+            if os.path.isfile(cached):
+                self._cached += 1
+                return cached
+            self._forget(key)
+
+        path = direct_path(stored, base)
+        if os.path.isfile(path):
+            self._direct += 1
+            return path
+
+        if base is None:
+            for candidate in legacy_candidates(stored):
+                if os.path.isfile(candidate):
+                    self._probed += 1
+                    self._remember(key, candidate)
+                    return candidate
+        self._missing += 1
+        return None
+
+    def _remember(self, key, path):
+        with self._lock:
+            self._cache[key] = path
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.size:
+                self._cache.popitem(last=False)
+
+    def _forget(self, key):
+        with self._lock:
+            self._cache.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._cache.clear()
+
+    def stats(self):
+        return {
+            'cached_paths': len(self._cache),
+            'direct': self._direct,
+            'cached': self._cached,
+            'probed': self._probed,
+            'missing': self._missing,
+        }
+
+
+path_resolver = PathResolver()
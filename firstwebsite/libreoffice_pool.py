@@ -0,0 +1,330 @@
+"""
+Sıcak LibreOffice dönüştürme havuzu
+Her belge için `soffice --headless --convert-to pdf` çalıştırmak LibreOffice'in
+birkaç saniyelik soğuk açılışını ve profil oluşturmayı her seferinde öder. Bu
+modül süreç başına LIBREOFFICE_POOL_SIZE adet soffice'i dinleme (UNO) modunda
+açık tutar; belgeler bu örneklere UNO köprüsü üzerinden açtırılıp PDF olarak
+kaydedilir.
+
+    - Eşzamanlılık sınırı: aynı anda en fazla havuz boyutu kadar dönüşüm;
+      fazlası boş örnek bekler (LIBREOFFICE_ACQUIRE_TIMEOUT)
+    - İş başına zaman aşımı (LIBREOFFICE_JOB_TIMEOUT): süre dolarsa örnek
+      öldürülür ve bir sonraki işte yeniden başlatılır
+    - Çökme kurtarma: ölü veya bağlantısı kopan örnekler yeniden açılır;
+      bellek sızıntılarına karşı örnekler LIBREOFFICE_MAX_JOBS iş sonra yenilenir
+    - stats(): iş sayısı, hata/zaman aşımı, örnek başlatma sayısı, gecikme
+      (ortalama/p50/p95), bekleme süresi ve dakikadaki iş sayısı
+
+Havuz süreç başınadır: gunicorn_config.py cpu_count()*2+1 worker açtığından
+toplam soffice sayısı worker sayısı x LIBREOFFICE_POOL_SIZE olur (8 çekirdekte
+boyut 1 ile 17 süreç, her biri ayrı /tmp profili). Bu yüzden havuz varsayılan
+olarak kapalıdır (0); açarken worker sayısını da düşünün, ör. az sayıda worker
+veya dönüşümlerin yoğun olduğu tek bir sunucu için LIBREOFFICE_POOL_SIZE=1.
+Süreç kapanırken örnekler durdurulur ve profil dizinleri silinir.
+
+UNO için LibreOffice'in Python köprüsü (`import uno`, Debian/Ubuntu'da
+python3-uno paketi) gerekir; virtualenv --system-site-packages ile
+oluşturulmalıdır. uno yoksa, soffice bulunamazsa veya LIBREOFFICE_POOL_SIZE=0
+ise available() False döner ve çağıran eski soğuk soffice yoluna düşer.
+"""
+
+import os
+import time
+import glob
+import queue
+import atexit
+import shutil
+import logging
+import tempfile
+import threading
+import subprocess
+from pathlib import Path
+from collections import deque
+
+logger = logging.getLogger(__name__)
+
+POOL_SIZE = int(os.getenv('LIBREOFFICE_POOL_SIZE', 0))
+JOB_TIMEOUT_SECONDS = float(os.getenv('LIBREOFFICE_JOB_TIMEOUT', 60))
+ACQUIRE_TIMEOUT_SECONDS = float(os.getenv('LIBREOFFICE_ACQUIRE_TIMEOUT', 120))
+START_TIMEOUT_SECONDS = float(os.getenv('LIBREOFFICE_START_TIMEOUT', 30))
+MAX_JOBS_PER_INSTANCE = int(os.getenv('LIBREOFFICE_MAX_JOBS', 200))
+# Örnekler art arda açılamazsa havuz bu süre boyunca devre dışı kalır
+START_FAILURE_COOLDOWN_SECONDS = 300
+
+try:
+    import uno
+    from com.sun.star.beans import PropertyValue
+except ImportError:
+    uno = None
+
+
+def find_soffice():
+    """LibreOffice çalıştırılabilir dosyasının yolu; bulunamazsa None"""
+    configured = os.getenv('LIBREOFFICE_PATH')
+    if configured:
+        return configured if os.path.exists(configured) else None
+    if os.name == 'nt':
+        candidates = [
+            "C:\\Program Files\\LibreOffice\\program\\soffice.exe",
+            "C:\\Program Files (x86)\\LibreOffice\\program\\soffice.exe",
+            *glob.glob("C:\\Program Files\\*\\program\\soffice.exe"),
+            *glob.glob("C:\\Program Files (x86)\\*\\program\\soffice.exe"),
+        ]
+    else:
+        candidates = [shutil.which('soffice'), "/usr/bin/soffice", "/usr/lib/libreoffice/program/soffice"]
+    for path in candidates:
+        if path and os.path.exists(path):
+            return path
+    return None
+
+
+def _properties(**values):
+    properties = []
+    for name, value in values.items():
+        prop = PropertyValue()
+        prop.Name = name
+        prop.Value = value
+        properties.append(prop)
+    return tuple(properties)
+
+
+class SofficeInstance:
+    """Dinleme modunda çalışan tek bir soffice süreci ve ona bağlı UNO masaüstü"""
+
+    def __init__(self, soffice_path, name):
+        self.soffice_path = soffice_path
+        self.name = name
+        self.profile_dir = os.path.join(tempfile.gettempdir(), f"lo_pool_{name}")
+        self.process = None
+        self.desktop = None
+        self.jobs = 0
+        self.killed = False
+
+    def is_alive(self):
+        return self.process is not None and self.process.poll() is None and self.desktop is not None
+
+    def start(self, timeout):
+        self.stop()
+        self.killed = False
+        self.jobs = 0
+        connection = f"pipe,name={self.name}"
+        self.process = subprocess.Popen([
+            self.soffice_path,
+            f"-env:UserInstallation={Path(self.profile_dir).as_uri()}",
+            '--headless', '--invisible', '--nologo', '--nodefault', '--norestore', '--nolockcheck',
+            f"--accept={connection};urp;StarOffice.ComponentContext",
+        ], stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+        local_context = uno.getComponentContext()
+        resolver = local_context.ServiceManager.createInstanceWithContext(
+            "com.sun.star.bridge.UnoUrlResolver", local_context
+        )
+        deadline = time.monotonic() + timeout
+        while True:
+            if self.process.poll() is not None:
+                raise RuntimeError(f"soffice başlatılamadı (çıkış kodu {self.process.returncode})")
+            try:
+                context = resolver.resolve(f"uno:{connection};urp;StarOffice.ComponentContext")
+                self.desktop = context.ServiceManager.createInstanceWithContext("com.sun.star.frame.Desktop", context)
+                return
+            except Exception:
+                if time.monotonic() >= deadline:
+                    self.stop()
+                    raise TimeoutError(f"soffice {timeout:.0f} sn içinde bağlantı kabul etmedi")
+                time.sleep(0.25)
+
+    def convert(self, input_path, output_path):
+        document = self.desktop.loadComponentFromURL(
+            uno.systemPathToFileUrl(os.path.abspath(input_path)), "_blank", 0, _properties(Hidden=True)
+        )
+        if document is None:
+            raise RuntimeError("Belge LibreOffice tarafından açılamadı")
+        try:
+            document.storeToURL(uno.systemPathToFileUrl(os.path.abspath(output_path)),
+                                _properties(FilterName='writer_pdf_Export'))
+        finally:
+            document.close(True)
+        self.jobs += 1
+
+    def kill(self):
+        """Zaman aşımında çağrılır: takılan UNO çağrısı bağlantı kopunca hata ile döner"""
+        self.killed = True
+        if self.process is not None and self.process.poll() is None:
+            self.process.kill()
+
+    def stop(self):
+        if self.desktop is not None:
+            try:
+                self.desktop.terminate()
+            except Exception:
+                pass
+            self.desktop = None
+        if self.process is not None:
+            try:
+                self.process.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                self.process.kill()
+                self.process.wait()
+            self.process = None
+
+
+class LibreOfficePool:
+    """Sabit boyutlu sıcak soffice havuzu; convert() en fazla size kadar eşzamanlı çalışır"""
+
+    def __init__(self, size=POOL_SIZE, job_timeout=JOB_TIMEOUT_SECONDS, acquire_timeout=ACQUIRE_TIMEOUT_SECONDS,
+                 start_timeout=START_TIMEOUT_SECONDS, max_jobs=MAX_JOBS_PER_INSTANCE):
+        self.size = size
+        self.job_timeout = job_timeout
+        self.acquire_timeout = acquire_timeout
+        self.start_timeout = start_timeout
+        self.max_jobs = max(1, max_jobs)
+        self.soffice_path = find_soffice() if uno is not None and size > 0 else None
+        self._lock = threading.Lock()
+        self._pid = None
+        self._instances = []
+        self._idle = queue.Queue()
+        self._disabled_until = 0.0
+        self._started_at = None
+        self._jobs = 0
+        self._failures = 0
+        self._timeouts = 0
+        self._starts = 0
+        self._latencies = deque(maxlen=500)
+        self._waits = deque(maxlen=500)
+        atexit.register(self.close)
+
+    def available(self):
+        return self.soffice_path is not None and time.monotonic() >= self._disabled_until
+
+    def _ensure_pool(self):
+        # Fork edilen worker süreçleri üst sürecin soffice'lerini kullanamaz, kendi havuzunu açar
+        if self._pid == os.getpid():
+            return
+        with self._lock:
+            if self._pid == os.getpid():
+                return
+            self._pid = os.getpid()
+            self._started_at = time.monotonic()
+            self._idle = queue.Queue()
+            self._instances = [
+                SofficeInstance(self.soffice_path, f"lo_pool_{os.getpid()}_{index}") for index in range(self.size)
+            ]
+            for instance in self._instances:
+                self._idle.put(instance)
+        # İlk dönüşümü beklemeden örnekleri arka planda ısıt
+        threading.Thread(target=self.warm, name='libreoffice-pool-warm', daemon=True).start()
+
+    def warm(self):
+        """Boşta olan ve çalışmayan örnekleri başlatır"""
+        for _ in range(self.size):
+            try:
+                instance = self._idle.get_nowait()
+            except queue.Empty:
+                return
+            try:
+                if not instance.is_alive():
+                    self._start(instance)
+            except Exception as e:
+                logger.warning("LibreOffice örneği ısıtılamadı (%s): %s", instance.name, e)
+            finally:
+                self._idle.put(instance)
+
+    def _start(self, instance):
+        started = time.monotonic()
+        try:
+            instance.start(self.start_timeout)
+        except Exception:
+            self._disabled_until = time.monotonic() + START_FAILURE_COOLDOWN_SECONDS
+            raise
+        self._starts += 1
+        logger.info("LibreOffice örneği hazır (%s, %.1f sn)", instance.name, time.monotonic() - started)
+
+    def convert(self, input_path, output_path):
+        """input_path'i PDF olarak output_path'e yazar; başarılıysa True"""
+        if not self.available():
+            return False
+        self._ensure_pool()
+        requested = time.monotonic()
+        try:
+            instance = self._idle.get(timeout=self.acquire_timeout)
+        except queue.Empty:
+            logger.warning("Boş LibreOffice örneği %.0f sn içinde bulunamadı", self.acquire_timeout)
+            self._failures += 1
+            return False
+        self._waits.append(time.monotonic() - requested)
+
+        started = time.monotonic()
+        timer = None
+        try:
+            if not instance.is_alive() or instance.jobs >= self.max_jobs:
+                self._start(instance)
+            timer = threading.Timer(self.job_timeout, instance.kill)
+            timer.daemon = True
+            timer.start()
+            instance.convert(input_path, output_path)
+            timer.cancel()
+            success = os.path.exists(output_path) and os.path.getsize(output_path) > 0
+        except Exception as e:
+            if timer is not None:
+                timer.cancel()
+            if instance.killed:
+                self._timeouts += 1
+                logger.warning("LibreOffice dönüşümü %.0f sn'de zaman aşımına uğradı: %s",
+                               self.job_timeout, os.path.basename(input_path))
+            else:
+                logger.warning("LibreOffice dönüşüm hatası (%s): %s", os.path.basename(input_path), e)
+            # Bağlantı kopmuş veya süreç ölmüş olabilir: bir sonraki işte yeniden başlatılır
+            if instance.killed or (instance.process is not None and instance.process.poll() is not None):
+                instance.stop()
+            success = False
+        finally:
+            self._idle.put(instance)
+
+        elapsed = time.monotonic() - started
+        self._jobs += 1
+        if success:
+            self._latencies.append(elapsed)
+        else:
+            self._failures += 1
+        return success
+
+    def stats(self):
+        latencies = sorted(self._latencies)
+        uptime = time.monotonic() - self._started_at if self._started_at else 0
+
+        def percentile(ratio):
+            if not latencies:
+                return None
+            return round(latencies[min(len(latencies) - 1, int(len(latencies) * ratio))] * 1000, 1)
+
+        return {
+            'available': self.available(),
+            'size': self.size,
+            'running': sum(1 for instance in self._instances if instance.is_alive()),
+            'idle': self._idle.qsize(),
+            'jobs': self._jobs,
+            'failures': self._failures,
+            'timeouts': self._timeouts,
+            'starts': self._starts,
+            'latency_ms': {
+                'avg': round(sum(latencies) / len(latencies) * 1000, 1) if latencies else None,
+                'p50': percentile(0.5),
+                'p95': percentile(0.95),
+            },
+            'wait_ms_avg': round(sum(self._waits) / len(self._waits) * 1000, 1) if self._waits else None,
+            'throughput_per_min': round(self._jobs / uptime * 60, 2) if uptime else 0,
+        }
+
+    def close(self):
+        if self._pid != os.getpid():
+            return
+        for instance in self._instances:
+            try:
+                instance.stop()
+            except Exception:
+                pass
+            # Profil dizini pid'e özeldir, bir sonraki süreç tarafından kullanılmaz
+            shutil.rmtree(instance.profile_dir, ignore_errors=True)
+
+
+libreoffice_pool = LibreOfficePool()
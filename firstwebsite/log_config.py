@@ -0,0 +1,107 @@
+"""
+Loglama yapılandırması
+Tüm loglar bloklamayan bir QueueHandler üzerinden kuyruğa atılır; asıl yazma
+(stderr / gunicorn error log) ayrı bir QueueListener thread'inde yapılır.
+Böylece istek thread'leri log dosyasına yazmayı beklemez.
+
+Ortam değişkenleri:
+    LOG_LEVEL=INFO                                   Varsayılan seviye
+    LOG_LEVELS=yargi_integration=WARNING,app=DEBUG   Modül bazında seviyeler
+    LOG_FORMAT=text | json                           json: satır başına bir JSON kaydı
+    LOG_DEBUG_SAMPLE_RATE=0.0                        debug_dump örnekleme oranı (0 = kapalı)
+
+Sıcak yollarda f-string yerine logger.debug("... %s", deger) kullanılmalıdır:
+seviye kapalıysa mesaj hiç biçimlendirilmez. Büyük veri dökümleri için
+debug_dump() kullanılır; kapalıyken ne serileştirme ne de biçimlendirme yapılır.
+"""
+
+import os
+import json
+import queue
+import atexit
+import random
+import logging
+import logging.handlers
+
+_listener = None
+
+TEXT_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
+
+class JsonFormatter(logging.Formatter):
+    """Kayıtları tek satırlık JSON olarak biçimlendirir; extra= ile verilen alanlar da eklenir"""
+
+    _RESERVED = set(vars(logging.LogRecord('', 0, '', 0, '', (), None))) | {'message', 'asctime'}
+
+    def format(self, record):
+        data = {
+            'time': self.formatTime(record),
+            'level': record.levelname,
+            'logger': record.name,
+            'message': record.getMessage(),
+        }
+        for key, value in vars(record).items():
+            if key not in self._RESERVED and not key.startswith('_'):
+                data[key] = value
+        if record.exc_info:
+            data['exc_info'] = self.formatException(record.exc_info)
+        return json.dumps(data, ensure_ascii=False, default=str)
+
+
+def parse_levels(value):
+    """'modul=SEVIYE,modul2=SEVIYE' -> {modul: seviye}"""
+    levels = {}
+    for item in (value or '').split(','):
+        name, _, level = item.partition('=')
+        if name.strip() and level.strip():
+            levels[name.strip()] = level.strip().upper()
+    return levels
+
+
+def configure_logging(app=None):
+    """Kök logger'ı kuyruk üzerinden yazacak şekilde ayarlar (süreç başına bir kez)"""
+    global _listener
+    if _listener is not None:
+        return
+
+    formatter = JsonFormatter() if os.getenv('LOG_FORMAT', 'text').lower() == 'json' else logging.Formatter(TEXT_FORMAT)
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(formatter)
+
+    log_queue = queue.SimpleQueue()
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    root.addHandler(queue_handler)
+    root.setLevel(os.getenv('LOG_LEVEL', 'INFO').upper())
+
+    for name, level in parse_levels(os.getenv('LOG_LEVELS')).items():
+        logging.getLogger(name).setLevel(level)
+
+    if app is not None:
+        # Flask'ın kendi stderr handler'ı yerine kök logger'daki kuyruğu kullan
+        from flask.logging import default_handler
+        app.logger.removeHandler(default_handler)
+        app.logger.propagate = True
+
+    _listener = logging.handlers.QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    _listener.start()
+    atexit.register(_listener.stop)
+
+
+def debug_dump(logger, label, payload, sample_rate=None):
+    """Büyük veri dökümlerini yalnızca DEBUG açıksa ve örneklemeye denk gelirse loglar.
+    payload çağrılabilir ise yalnızca loglanacağı zaman çağrılır."""
+    if not logger.isEnabledFor(logging.DEBUG):
+        return
+    if sample_rate is None:
+        sample_rate = float(os.getenv('LOG_DEBUG_SAMPLE_RATE', 0))
+    if sample_rate <= 0 or random.random() >= sample_rate:
+        return
+    if callable(payload):
+        payload = payload()
+    if not isinstance(payload, str):
+        payload = json.dumps(payload, ensure_ascii=False, indent=2, default=str)
+    logger.debug("%s:\n%s", label, payload)
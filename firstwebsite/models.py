@@ -3,9 +3,54 @@ from datetime import datetime, timezone, timedelta
 from werkzeug.security import generate_password_hash, check_password_hash
 from flask_login import UserMixin
 import json
+from types import MappingProxyType
+from sqlalchemy import event
 
 db = SQLAlchemy()
 
+# Yetkilerin birbirlerine olan bağımlılıkları: anahtar yetki, listedeki yetkilerden
+# herhangi birine sahip olan kullanıcıya da verilir
+PERMISSION_DEPENDENCIES = MappingProxyType({
+    'etkinlik_goruntule': ('takvim_goruntule',),
+    'etkinlik_ekle': ('takvim_goruntule', 'etkinlik_goruntule'),
+    'etkinlik_duzenle': ('takvim_goruntule', 'etkinlik_goruntule'),
+    'etkinlik_sil': ('takvim_goruntule', 'etkinlik_goruntule'),
+    'duyuru_duzenle': ('duyuru_goruntule',),
+    'duyuru_sil': ('duyuru_goruntule',),
+    'dosya_goruntule': ('dosya_sorgula',),
+    'dosya_duzenle': ('dosya_sorgula',),
+    'dosya_sil': ('dosya_sorgula',),
+    'odeme_duzenle': ('odeme_goruntule',),
+    'odeme_sil': ('odeme_goruntule',),
+    'veritabani_yonetimi': ('panel_goruntule',),
+    'ai_avukat': ('panel_goruntule',),
+    'yargi_kararlari_arama': ('panel_goruntule',),
+    'ornek_dilekceler': ('panel_goruntule',),
+    'ornek_sozlesmeler': ('panel_goruntule',),
+    'ucret_tarifeleri': ('panel_goruntule',)
+})
+
+# Ters bağımlılık: yetki -> bu yetkiyle birlikte verilen yetkiler
+_GRANTED_BY = {}
+for _permission, _dependencies in PERMISSION_DEPENDENCIES.items():
+    for _dependency in _dependencies:
+        _GRANTED_BY.setdefault(_dependency, set()).add(_permission)
+_GRANTED_BY = {key: frozenset(value) for key, value in _GRANTED_BY.items()}
+
+
+def compile_permissions(permissions):
+    """JSON yetki sözlüğünü bağımlı yetkiler dahil değiştirilemez bir kümeye derler"""
+    if not permissions:
+        return frozenset()
+    granted = {name for name, enabled in permissions.items() if enabled}
+    pending = list(granted)
+    while pending:  # Bağımlılık zincirini sonuna kadar izle
+        for name in _GRANTED_BY.get(pending.pop(), ()):
+            if name not in granted:
+                granted.add(name)
+                pending.append(name)
+    return frozenset(granted)
+
 class User(UserMixin, db.Model):
     id = db.Column(db.Integer, primary_key=True)
     email = db.Column(db.String(120), unique=True, nullable=False)
@@ -26,6 +71,8 @@ class User(UserMixin, db.Model):
     approval_date = db.Column(db.DateTime)
     approved_by = db.Column(db.Integer, db.ForeignKey('user.id'))
     permissions = db.Column(db.JSON, default={})
+    # Satır her değiştiğinde artar; diğer worker'lardaki oturum önbelleği bununla doğrulanır (bkz. user_cache.py)
+    auth_version = db.Column(db.Integer, nullable=False, default=0, server_default='0')
 
     # Password reset fields
     reset_token = db.Column(db.String(100), unique=True, nullable=True)
@@ -69,51 +116,23 @@ class User(UserMixin, db.Model):
         """Kullanıcının belirli bir yetkiye sahip olup olmadığını kontrol eder"""
         if self.is_admin:  # Admin her şeyi yapabilir
             return True
-            
-        # Eğer yetkiler hiç tanımlanmamışsa
-        if not self.permissions:
-            return False
-            
-        # İstenen yetkiyi doğrudan kontrol et
-        if permission in self.permissions and self.permissions[permission]:
-            return True
-        
-        # Özel durumlar için kontrol
-        # Eğer takvim görüntüleme yetkisi varsa ve etkinlik_görüntüleme istenmişse izin ver
-        if permission == 'etkinlik_goruntule' and 'takvim_goruntule' in self.permissions and self.permissions['takvim_goruntule']:
-            return True
-            
-        # Bağımlı yetkiler için kontrol
-        dependencies = self.get_permission_dependencies()
-        if permission in dependencies:
-            for dep in dependencies[permission]:
-                if dep in self.permissions and self.permissions[dep]:
-                    return True
-            
-        return False
+        return permission in self.get_permission_set()
+
+    def get_permission_set(self):
+        """Kullanıcının sahip olduğu yetkiler (bağımlı yetkiler dahil) - ilk çağrıda derlenir.
+        Önbellek yetkiler değiştiğinde veya nesne veritabanından yenilendiğinde temizlenir."""
+        compiled = getattr(self, '_compiled_permissions', None)
+        if compiled is None:
+            compiled = self._compiled_permissions = compile_permissions(self.permissions)
+        return compiled
+
+    def invalidate_permissions(self):
+        self._compiled_permissions = None
 
     @staticmethod
     def get_permission_dependencies():
         """Yetkilerin birbirlerine olan bağımlılıkları"""
-        return {
-            'etkinlik_goruntule': ['takvim_goruntule'],
-            'etkinlik_ekle': ['takvim_goruntule', 'etkinlik_goruntule'],
-            'etkinlik_duzenle': ['takvim_goruntule', 'etkinlik_goruntule'],
-            'etkinlik_sil': ['takvim_goruntule', 'etkinlik_goruntule'],
-            'duyuru_duzenle': ['duyuru_goruntule'],
-            'duyuru_sil': ['duyuru_goruntule'],
-            'dosya_goruntule': ['dosya_sorgula'],
-            'dosya_duzenle': ['dosya_sorgula'],
-            'dosya_sil': ['dosya_sorgula'],
-            'odeme_duzenle': ['odeme_goruntule'],
-            'odeme_sil': ['odeme_goruntule'],
-            'veritabani_yonetimi': ['panel_goruntule'],
-            'ai_avukat': ['panel_goruntule'],
-            'yargi_kararlari_arama': ['panel_goruntule'],
-            'ornek_dilekceler': ['panel_goruntule'],
-            'ornek_sozlesmeler': ['panel_goruntule'],
-            'ucret_tarifeleri': ['panel_goruntule']
-        }
+        return PERMISSION_DEPENDENCIES
 
     @staticmethod
     def get_default_permissions():
@@ -281,6 +300,23 @@ class User(UserMixin, db.Model):
     def __repr__(self):
         return f'<User {self.username}>'
 
+# Derlenmiş yetki kümesini yetkiler değişince veya nesne yenilenince temizle
+@event.listens_for(User.permissions, 'set')
+def _permissions_set(target, value, oldvalue, initiator):
+    target.invalidate_permissions()
+
+@event.listens_for(User.permissions, 'modified')
+def _permissions_modified(target, initiator):
+    target.invalidate_permissions()
+
+@event.listens_for(User, 'refresh')
+def _user_refreshed(target, context, attrs):
+    target.invalidate_permissions()
+
+@event.listens_for(User, 'expire')
+def _user_expired(target, attrs):
+    target.invalidate_permissions()
+
 class ActivityLog(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     activity_type = db.Column(db.String(50), nullable=False)  # 'dosya_ekleme', 'duyuru_ekleme', 'etkinlik_ekleme', vs.
@@ -300,6 +336,9 @@ class ActivityLog(db.Model):
     event = db.relationship('CalendarEvent', backref='activities')
     payment = db.relationship('Client', backref='activities')
 
+    # İşlem akışı (timestamp desc, id desc) ile sayfalanır
+    __table_args__ = (db.Index('ix_activity_log_timestamp_id', 'timestamp', 'id'),)
+
 class Client(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     name = db.Column(db.String(100), nullable=False)
@@ -308,7 +347,7 @@ class Client(db.Model):
     amount = db.Column(db.Float, nullable=False)
     currency = db.Column(db.String(3), nullable=False)
     installments = db.Column(db.Integer, nullable=False)
-    registration_date = db.Column(db.Date, nullable=True)  # Borç kayıt tarihi
+    registration_date = db.Column(db.Date, nullable=True, index=True)  # Borç kayıt tarihi
     due_date = db.Column(db.Date, nullable=True)  # Son ödeme tarihi
     payment_date = db.Column(db.Date, nullable=True)  # Ödeme tarihi (ödeme durumu ödendi ise)
     payments = db.relationship('Payment', backref='client', lazy=True)
@@ -316,7 +355,7 @@ class Client(db.Model):
     description = db.Column(db.Text, nullable=True)
     payment_type = db.Column(db.String(50), nullable=True)  # Ödeme türü
     entity_type = db.Column(db.String(20), default='person')  # person/company
-    payment_client_id = db.Column(db.Integer, db.ForeignKey('payment_client.id'), nullable=True)  # Kayıtlı müvekkil referansı
+    payment_client_id = db.Column(db.Integer, db.ForeignKey('payment_client.id'), nullable=True, index=True)  # Kayıtlı müvekkil referansı
 
 class PaymentClient(db.Model):
     """Kayıtlı Müvekkil - Ödemeler sayfasına özel"""
@@ -369,18 +408,32 @@ class PaymentDocument(db.Model):
 
 class Document(db.Model):
     id = db.Column(db.Integer, primary_key=True)
-    case_id = db.Column(db.Integer, db.ForeignKey('case_file.id'), nullable=False)
+    case_id = db.Column(db.Integer, db.ForeignKey('case_file.id'), nullable=False, index=True)
     document_type = db.Column(db.String(100), nullable=False)  # Belge türü
     filename = db.Column(db.String(255), nullable=False)
     filepath = db.Column(db.String(255), nullable=False)
     upload_date = db.Column(db.DateTime, nullable=False, default=datetime.now)
     user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
     pdf_version = db.Column(db.String(255), nullable=True)  # PDF dönüşümü varsa dosya yolu
-    parent_document_id = db.Column(db.Integer, db.ForeignKey('document.id'), nullable=True)  # Ana belgenin ID'si (ekler için)
+    parent_document_id = db.Column(db.Integer, db.ForeignKey('document.id'), nullable=True, index=True)  # Ana belgenin ID'si (ekler için)
 
     # İlişkiler
     attachments = db.relationship('Document', backref=db.backref('parent', remote_side=[id]), lazy='dynamic', cascade='all, delete-orphan')
 
+class FileBlob(db.Model):
+    """İçerik adresli dosya - aynı içerik bir kez saklanır, belgeler referans sayısıyla paylaşır (bkz. blob_store.py)"""
+    __tablename__ = 'file_blob'
+
+    id = db.Column(db.Integer, primary_key=True)
+    path = db.Column(db.String(500), nullable=False, unique=True)  # UPLOAD_FOLDER'a göreli blob yolu
+    sha256 = db.Column(db.String(64), nullable=False, index=True)
+    size = db.Column(db.BigInteger, nullable=False, default=0)
+    ref_count = db.Column(db.Integer, nullable=False, default=0)  # Bu yolu gösteren belge kaydı sayısı
+    created_at = db.Column(db.DateTime, default=lambda: datetime.now(timezone(timedelta(hours=3))))
+
+    def __repr__(self):
+        return f'<FileBlob {self.sha256[:12]} refs={self.ref_count}>'
+
 class Notification(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     message = db.Column(db.String(250), nullable=False)
@@ -406,7 +459,7 @@ class CaseFile(db.Model):
     case_number = db.Column(db.String(50), nullable=False)
     client_name = db.Column(db.String(150), nullable=False)
     phone_number = db.Column(db.String(20))
-    status = db.Column(db.String(50), default='Aktif')
+    status = db.Column(db.String(50), default='Aktif', index=True)
     open_date = db.Column(db.Date)
     next_hearing = db.Column(db.Date)
     hearing_time = db.Column(db.String(5))  # HH:MM formatında
@@ -440,6 +493,12 @@ class CaseFile(db.Model):
     
     expenses = db.relationship('Expense', backref='case_file', lazy=True)
     documents = db.relationship('Document', backref='case_file', lazy=True)
+
+    # dosya_sorgula filtreleri: tür/adliye/birim ve yıl/esas no
+    __table_args__ = (
+        db.Index('ix_case_file_type_courthouse_department', 'file_type', 'courthouse', 'department'),
+        db.Index('ix_case_file_year_case_number', 'year', 'case_number'),
+    )
     
     @property
     def additional_clients(self):
@@ -548,7 +607,7 @@ class Announcement(db.Model):
 class CalendarEvent(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     title = db.Column(db.String(200), nullable=False)
-    date = db.Column(db.Date, nullable=False)
+    date = db.Column(db.Date, nullable=False, index=True)  # Takvim API'si tarih aralığıyla sorgular
     time = db.Column(db.Time, nullable=True)
     event_type = db.Column(db.String(50), nullable=False)
     description = db.Column(db.Text)
@@ -574,6 +633,13 @@ class CalendarEvent(db.Model):
     arabuluculuk_turu = db.Column(db.String(50))  # Arabuluculuk Türü (yuzyuze/telekonferans)
     toplanti_adresi = db.Column(db.String(500))  # Toplantı Adresi (yüzyüze toplantılar için, isteğe bağlı)
 
+    # Yaklaşan duruşmalar (anasayfa) ve yarınki hatırlatmalar (event_reminder) tamamlanmamış
+    # etkinlikleri tarihe göre tarar; duruşma sayacı tür + tarih ile filtreler
+    __table_args__ = (
+        db.Index('ix_calendar_event_pending', 'is_completed', 'date', 'assigned_to'),
+        db.Index('ix_calendar_event_type_date', 'event_type', 'date'),
+    )
+
 class WorkerInterview(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     # Madde 1: Kişisel Bilgiler
@@ -882,4 +948,29 @@ class PartyLawyer(db.Model):
     lawyer = db.relationship('Lawyer', back_populates='party_associations')
 
     def __repr__(self):
-        return f'<PartyLawyer lawyer_id={self.lawyer_id} party={self.party_type}:{self.party_index}>'
\ No newline at end of file
+        return f'<PartyLawyer lawyer_id={self.lawyer_id} party={self.party_type}:{self.party_index}>'
+
+
+class DashboardCounter(db.Model):
+    """Panel sayaçları - model olaylarıyla artımlı güncellenir (bkz. dashboard_counters.py)"""
+    __tablename__ = 'dashboard_counter'
+
+    name = db.Column(db.String(64), primary_key=True)
+    value = db.Column(db.Integer, nullable=False, default=0)
+    updated_at = db.Column(db.DateTime, default=lambda: datetime.now(timezone(timedelta(hours=3))))
+
+    def __repr__(self):
+        return f'<DashboardCounter {self.name}={self.value}>'
+
+
+class CalendarEventChange(db.Model):
+    """Takvim etkinliği değişiklik günlüğü - takvim API'sinin 'changed since' sorguları için (bkz. calendar_feed.py)"""
+    __tablename__ = 'calendar_event_change'
+
+    id = db.Column(db.Integer, primary_key=True)  # Artan değişiklik numarası (takvim sürümü)
+    event_id = db.Column(db.Integer, nullable=True)  # None: toplu güncelleme/silme, istemci tamamen yenilemeli
+    deleted = db.Column(db.Boolean, nullable=False, default=False)
+    changed_at = db.Column(db.DateTime, index=True, default=lambda: datetime.now(timezone(timedelta(hours=3))))
+
+    def __repr__(self):
+        return f'<CalendarEventChange {self.id} event={self.event_id}>'
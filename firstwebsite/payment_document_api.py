@@ -6,6 +6,7 @@ Payment Document API Endpoints
 from flask import request, jsonify
 from flask_login import login_required, current_user
 from models import db, Client, PaymentDocument, ActivityLog
+from blob_store import blob_store, is_blob
 import os
 import uuid
 
@@ -41,13 +42,8 @@ def register_payment_document_routes(app):
             # Benzersiz dosya adı oluştur
             unique_filename = f"{uuid.uuid4()}_{file.filename}"
 
-            # Klasörü oluştur
-            payment_documents_dir = os.path.join(app.config['UPLOAD_FOLDER'], 'payment_documents')
-            os.makedirs(payment_documents_dir, exist_ok=True)
-
-            # Dosyayı kaydet
-            filepath = os.path.join(payment_documents_dir, unique_filename)
-            file.save(filepath)
+            # Dosyayı içerik adresli depoya kaydet (aynı belge tek kopya saklanır)
+            filepath = blob_store.save(file)
 
             # Veritabanına kaydet
             document = PaymentDocument(
@@ -55,7 +51,7 @@ def register_payment_document_routes(app):
                 document_type=document_type,
                 document_name=document_name,
                 filename=unique_filename,
-                filepath=f"payment_documents/{unique_filename}",
+                filepath=filepath,
                 description=description if description else None,
                 user_id=current_user.id
             )
@@ -140,9 +136,9 @@ def register_payment_document_routes(app):
         try:
             document = PaymentDocument.query.get_or_404(document_id)
 
-            # Dosyayı sil
+            # Dosyayı sil (depodaki paylaşılan dosyalar referans sayısıyla silinir)
             full_path = os.path.join(app.config['UPLOAD_FOLDER'], document.filepath)
-            if os.path.exists(full_path):
+            if not is_blob(document.filepath) and os.path.exists(full_path):
                 os.remove(full_path)
 
             # Veritabanından sil
@@ -0,0 +1,269 @@
+"""
+Referans veri dosyaları (adliye listesi, ücret tarifeleri)
+adliyelist.txt ve tarifeler.txt her istekte yeniden okunup ayrıştırılmak yerine
+bir kez ayrıştırılır ve dosyanın mtime/boyutu değişene kadar önbellekten verilir.
+
+Önbellekteki yapı değiştirilemez (dict -> MappingProxyType, list -> tuple);
+JSON karşılığı ve ETag de ayrıştırma sırasında bir kez hesaplanır, böylece
+şablonlar ve API yanıtları serileştirme maliyeti olmadan aynı metni kullanır.
+"""
+
+import os
+import re
+import json
+import hashlib
+import logging
+import threading
+import traceback
+from types import MappingProxyType
+
+logger = logging.getLogger(__name__)
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def freeze(value):
+    """İç içe dict/list yapısını değiştirilemez hale getirir"""
+    if isinstance(value, dict):
+        return MappingProxyType({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(freeze(item) for item in value)
+    return value
+
+
+def htmlsafe_json(value):
+    """Şablona doğrudan gömülebilen JSON (Jinja tojson ile aynı kaçışlar)"""
+    return (json.dumps(value, ensure_ascii=False)
+            .replace('<', '\\u003c').replace('>', '\\u003e')
+            .replace('&', '\\u0026').replace("'", '\\u0027'))
+
+
+class ReferenceData:
+    """Ayrıştırılmış referans dosyası: değiştirilemez değer + önceden hesaplanmış JSON ve ETag"""
+
+    def __init__(self, path, signature, value, json_key=None):
+        self.path = path
+        self.signature = signature
+        self.value = freeze(value)
+        self.json = htmlsafe_json(value[json_key] if json_key else value)
+        self.etag = hashlib.sha1(self.json.encode('utf-8')).hexdigest()
+
+
+class ReferenceFile:
+    """Aday yollardan ilk var olanı ayrıştırır; dosya değişene kadar sonucu önbellekte tutar"""
+
+    def __init__(self, parser, candidates, default, json_key=None):
+        self.parser = parser
+        self.candidates = candidates
+        self.default = default
+        self.json_key = json_key  # JSON/ETag değerin yalnızca bu anahtarından üretilir
+        self._cached = None
+        self._lock = threading.Lock()
+
+    def _resolve(self):
+        for path in self.candidates():
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            return path, (stat.st_mtime_ns, stat.st_size)
+        return None, None
+
+    def get(self):
+        path, signature = self._resolve()
+        cached = self._cached
+        if cached is not None and cached.path == path and cached.signature == signature:
+            return cached
+        with self._lock:
+            cached = self._cached
+            if cached is not None and cached.path == path and cached.signature == signature:
+                return cached
+            if path is None:
+                logger.error("Referans dosyası bulunamadı: %s", ', '.join(self.candidates()))
+                # Bulunamayan dosya önbelleğe alınmaz; dosya oluşturulunca hemen okunur
+                return ReferenceData(None, None, self.default(), self.json_key)
+            logger.info("Referans dosyası ayrıştırılıyor: %s", path)
+            self._cached = ReferenceData(path, signature, self.parser(path), self.json_key)
+            return self._cached
+
+    def invalidate(self):
+        with self._lock:
+            self._cached = None
+
+
+# ---------------------------------------------------------------------------
+# Adliye listesi
+# ---------------------------------------------------------------------------
+
+def _parse_adliye_file(abs_file_path):
+    cities_courthouses = {}
+    try:
+        with open(abs_file_path, 'r', encoding='utf-8') as f:
+            lines = f.readlines()
+            # Skip header and potential separator lines
+            data_lines = [line.strip() for line in lines if line.strip() and not line.startswith('İl\t') and not line.startswith('___')]
+            for line in data_lines:
+                parts = line.split('\t', 1)
+                if len(parts) == 2:
+                    city, courthouses_str = parts
+                    # Keep the original names including ACM details
+                    courthouses = [ch.strip() for ch in re.split(r'\s*,\s*|\s*•\s*', courthouses_str) if ch.strip()]
+                    cities_courthouses[city.strip()] = courthouses
+    except Exception as e:
+        logger.error("Adliye listesi ayrıştırılamadı (%s): %s", abs_file_path, e)
+        return {'cities_courthouses': {}, 'cities': []}
+
+    # İstanbul'u şehir listesine manuel olarak ekle (zaten varsa sorun değil)
+    if 'İstanbul' not in cities_courthouses:
+        # İstanbul adliyeleri bu listede olmayacak, çünkü bunlar hardcoded olarak frontend'de tanımlanmış
+        cities_courthouses['İstanbul'] = []
+
+    # Önce standart alfabetik sıralama
+    cities = sorted(cities_courthouses.keys())
+
+    # İstanbul'u listeden çıkar ve en başa ekle
+    cities.remove('İstanbul')
+    cities.insert(0, 'İstanbul')
+
+    # İzmir'i Isparta'dan sonra getir
+    if 'İzmir' in cities and 'Isparta' in cities:
+        cities.remove('İzmir')
+        cities.insert(cities.index('Isparta') + 1, 'İzmir')
+
+    return {'cities_courthouses': cities_courthouses, 'cities': cities}
+
+
+adliye_file = ReferenceFile(
+    _parse_adliye_file,
+    lambda: [os.path.join(BASE_DIR, '..', 'adliyelist.txt')],
+    lambda: {'cities_courthouses': {}, 'cities': []},
+    json_key='cities_courthouses'
+)
+
+
+def get_courthouses():
+    """(şehir -> adliyeler, sıralı şehirler, ReferenceData) döndürür.
+    ReferenceData.json şehir -> adliyeler eşlemesinin JSON'udur."""
+    data = adliye_file.get()
+    return data.value['cities_courthouses'], data.value['cities'], data
+
+
+# ---------------------------------------------------------------------------
+# Ücret tarifeleri
+# ---------------------------------------------------------------------------
+
+TARIFELER_TMP_PATH = '/tmp/tarifeler.txt'
+
+
+def tarifeler_candidates():
+    # Dosya öncelik sırası: /tmp (kaydedilen en güncel) > firstwebsite > parent
+    return [
+        TARIFELER_TMP_PATH,
+        os.path.join(BASE_DIR, 'tarifeler.txt'),
+        os.path.join(BASE_DIR, '..', 'tarifeler.txt'),
+    ]
+
+
+def _empty_tarifeler():
+    return {
+        "İstanbul Barosu": [],
+        "TBB": [],
+        "kaplan_danismanlik_tarifesi": {"kategoriler": []}
+    }
+
+
+def _parse_tarifeler_file(filepath):
+    # Varsayılan olarak boş ve geçerli bir yapı
+    tarifeler = _empty_tarifeler()
+    
+    grup_map = {
+        "ISTBARO_2025": "İstanbul Barosu",
+        "TBB_2025": "TBB"
+    }
+
+    try:
+        with open(filepath, 'r', encoding='utf-8') as f:
+            lines = f.readlines()
+
+        kaplan_danismanlik_json_str = ""
+        in_kaplan_danismanlik_json_block = False
+
+        for line_num, line_content_raw in enumerate(lines):
+            line_content = line_content_raw.strip()
+
+            if line_content.startswith("KAPLAN HUKUK DANIŞMANLIK ÜCRET TARİFESİ START"):
+                in_kaplan_danismanlik_json_block = True
+                kaplan_danismanlik_json_str = ""  # Bloğa girildiğinde önceki içeriği sıfırla
+                continue
+            elif line_content.startswith("KAPLAN HUKUK DANIŞMANLIK ÜCRET TARİFESİ END"):
+                in_kaplan_danismanlik_json_block = False
+                if kaplan_danismanlik_json_str:
+                    try:
+                        parsed_json = json.loads(kaplan_danismanlik_json_str)
+                        if isinstance(parsed_json, dict) and "kategoriler" in parsed_json and isinstance(parsed_json["kategoriler"], list):
+                            tarifeler["kaplan_danismanlik_tarifesi"] = parsed_json
+                        else:
+                            logger.warning(
+                                f"Kaplan Danışmanlık JSON formatı beklenmiyor (kategoriler listesi yok) tarifeler.txt okunurken. Satır: ~{line_num}. "
+                                f"İçerik başlangıcı: {kaplan_danismanlik_json_str[:200]}..."
+                            )
+                            # Varsayılan boş değer zaten atanmış durumda
+                    except json.JSONDecodeError as e:
+                        logger.error(
+                            f"Kaplan Danışmanlık JSON parse edilemedi tarifeler.txt okunurken: {e}. Satır: ~{line_num}. "
+                            f"İçerik başlangıcı: {kaplan_danismanlik_json_str[:200]}..."
+                        )
+                        # Varsayılan boş değer zaten atanmış durumda
+                kaplan_danismanlik_json_str = "" # Bloğun sonunda string'i temizle
+                continue
+
+            if in_kaplan_danismanlik_json_block:
+                kaplan_danismanlik_json_str += line_content_raw # Orijinal satırları (newline dahil) birleştir
+                continue
+
+            # START/END bloğu dışındaki satırlar (Yorumlar ve boş satırlar hariç)
+            if not line_content or line_content.startswith("#"):
+                continue
+
+            parts = [part.strip() for part in line_content.split('|')]
+            if len(parts) < 7:
+                logger.warning(f"Uyarı: Satır {line_num + 1} ({filepath}) yetersiz bölüm içeriyor ({len(parts)}), atlanıyor: {line_content}")
+                continue
+
+            tarife_grubu_txt, kategori_adi_txt, _, hizmet_adi_txt, temel_ucret_txt, _, birim_txt, *ek_not_parts = parts
+            ek_not_txt = ek_not_parts[0] if ek_not_parts and ek_not_parts[0] else None
+            
+            current_group_key = grup_map.get(tarife_grubu_txt)
+            if not current_group_key:
+                # KAPLAN_OZEL satırları artık START/END bloğunda JSON olarak yönetildiği için burada işlenmemeli.
+                if tarife_grubu_txt.upper() != 'KAPLAN_OZEL':
+                     logger.warning(f"Uyarı: Satır {line_num + 1} ({filepath})'deki tarife grubu '{tarife_grubu_txt}' tanınmıyor, atlanıyor.")
+                continue
+
+            kategori_obj = next((kat for kat in tarifeler[current_group_key] if kat["kategori"] == kategori_adi_txt), None)
+            
+            if kategori_obj is None:
+                kategori_obj = {"kategori": kategori_adi_txt, "items": []}
+                tarifeler[current_group_key].append(kategori_obj)
+
+            item = {
+                "hizmet_adi": hizmet_adi_txt,
+                "temel_ucret": temel_ucret_txt,
+                "original_ucret_str": temel_ucret_txt # JS'nin parse etmesi için orijinal string
+            }
+            if birim_txt and birim_txt.upper() not in ["TL", "TRY", ""]:
+                item["birim"] = birim_txt
+            if ek_not_txt:
+                item["ek_not"] = ek_not_txt
+            
+            kategori_obj["items"].append(item)
+
+    except FileNotFoundError:
+        logger.error(f"Hata: Tarife dosyası bulunamadı: {filepath}")
+    except Exception as e:
+        logger.error(f"Hata: Tarife dosyası okunurken/işlenirken genel bir hata oluştu ({filepath}): {e}\n{traceback.format_exc()}")
+    
+    return tarifeler
+
+
+tarife_file = ReferenceFile(_parse_tarifeler_file, tarifeler_candidates, _empty_tarifeler)
@@ -0,0 +1,89 @@
+"""
+UDF önizleme önbelleği
+UDF içeriğini HTML'e çevirmek (ZIP üyelerini okuma, content.xml ayrıştırma,
+resimleri base64'e çevirme) her önizlemede yeniden yapılmak yerine dosya başına
+bir kez yapılır. Üretilen HTML dosya yolu + mtime/boyut anahtarıyla süreç
+içinde saklanır; dosya değişince sonraki istekte yeniden üretilir.
+
+Resimler HTML'e gömüldüğünden kayıtlar büyük olabilir: önbellek toplam
+UDF_PREVIEW_CACHE_MB ile sınırlıdır, en uzun süre kullanılmayanlar atılır ve
+sınırın dörtte birinden büyük önizlemeler önbelleğe alınmaz.
+"""
+
+import os
+import logging
+import threading
+from collections import OrderedDict
+
+logger = logging.getLogger(__name__)
+
+MAX_CACHE_BYTES = int(float(os.getenv('UDF_PREVIEW_CACHE_MB', 64)) * 1024 * 1024)
+
+
+class PreviewCache:
+    """Dosya yolu -> üretilmiş HTML; boyut sınırlı LRU"""
+
+    def __init__(self, render=None, max_bytes=MAX_CACHE_BYTES):
+        self.render = render  # dosya yolu -> HTML metni veya None
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()  # yol -> ((mtime_ns, boyut), html)
+        self._size = 0
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def init_app(self, app, render):
+        self.render = render
+        app.config.setdefault('UDF_PREVIEW_CACHE_MB', os.getenv('UDF_PREVIEW_CACHE_MB', 64))
+        self.max_bytes = int(float(app.config['UDF_PREVIEW_CACHE_MB']) * 1024 * 1024)
+
+    def get(self, path):
+        """Dosyanın HTML önizlemesi; dosya yoksa veya ayrıştırılamazsa None"""
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        key = os.path.abspath(path)
+        signature = (stat.st_mtime_ns, stat.st_size)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == signature:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return entry[1]
+
+        self._misses += 1
+        html = self.render(path)
+        if html is None:
+            return None
+        size = len(html)
+        if self.max_bytes > 0 and size > self.max_bytes // 4:
+            logger.debug("UDF önizlemesi önbellek için çok büyük (%d bayt): %s", size, path)
+        elif self.max_bytes > 0:
+            with self._lock:
+                previous = self._entries.pop(key, None)
+                if previous is not None:
+                    self._size -= len(previous[1])
+                self._entries[key] = (signature, html)
+                self._size += size
+                while self._size > self.max_bytes:
+                    evicted_path, (_, evicted) = self._entries.popitem(last=False)
+                    self._size -= len(evicted)
+                    logger.debug("UDF önizlemesi önbellekten atıldı: %s", evicted_path)
+        return html
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def stats(self):
+        return {
+            'entries': len(self._entries),
+            'size_bytes': self._size,
+            'hits': self._hits,
+            'misses': self._misses,
+        }
+
+
+udf_preview_cache = PreviewCache()
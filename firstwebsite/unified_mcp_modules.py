@@ -28,6 +28,10 @@ import tempfile
 import os
 import re
 import math
+import functools
+import threading
+import requests
+from requests.adapters import HTTPAdapter
 from urllib.parse import urljoin, quote, urlencode
 
 # Setup logging
@@ -35,6 +39,27 @@ logger = logging.getLogger(__name__)
 if not logger.hasHandlers():
     logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 
+async def run_blocking(func, *args, **kwargs):
+    """Bloklayan (requests tabanlı) çağrıyı thread pool'da çalıştırır, event loop'u kilitlemez"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, functools.partial(func, *args, **kwargs))
+
+# requests tabanlı client'lar (KİK, Rekabet) için süreç genelinde paylaşılan bağlantı havuzu
+_pooled_adapter = None
+_pooled_adapter_lock = threading.Lock()
+
+def pooled_requests_session() -> requests.Session:
+    """Paylaşılan bağlantı havuzunu kullanan yeni bir requests.Session döndürür.
+    Cookie'ler (ViewState vb.) oturuma özel kalır, TCP/TLS bağlantıları yeniden kullanılır."""
+    global _pooled_adapter
+    with _pooled_adapter_lock:
+        if _pooled_adapter is None:
+            _pooled_adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20)
+    session = requests.Session()
+    session.mount('https://', _pooled_adapter)
+    session.mount('http://', _pooled_adapter)
+    return session
+
 # ========================= ANAYASA MODELS =========================
 
 class AnayasaDonemEnum(str, Enum):
@@ -1315,7 +1340,7 @@ class KikApiClient:
             logger.info(f"KikApiClient: Searching with params: {search_params.karar_metni}")
             
             # Session başlat
-            session = requests.Session()
+            session = pooled_requests_session()
             session.verify = False
             
             # KİK'in gerçek arama URL'i
@@ -1327,7 +1352,7 @@ class KikApiClient:
                 'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8'
             }
             
-            initial_response = session.get(search_url, headers=headers, timeout=30)
+            initial_response = await run_blocking(session.get, search_url, headers=headers, timeout=30)
             soup = BeautifulSoup(initial_response.text, 'html.parser')
             
             # ViewState ve EventValidation değerlerini al
@@ -1351,7 +1376,7 @@ class KikApiClient:
                 form_data['ctl00$ContentPlaceHolder1$ddlKararTipi'] = search_params.karar_tipi.value
             
             # Arama yap
-            search_response = session.post(search_url, data=form_data, headers=headers, timeout=30)
+            search_response = await run_blocking(session.post, search_url, data=form_data, headers=headers, timeout=30)
             search_soup = BeautifulSoup(search_response.text, 'html.parser')
             
             # Sonuçları parse et
@@ -1592,10 +1617,10 @@ class RekabetKurumuApiClient:
                 'Upgrade-Insecure-Requests': '1'
             }
             
-            session = requests.Session()
+            session = pooled_requests_session()
             
             # Önce ana sayfayı ziyaret et (session için)
-            response = session.get(search_url, headers=headers, verify=False, timeout=30)
+            response = await run_blocking(session.get, search_url, headers=headers, verify=False, timeout=30)
             
             if response.status_code == 200:
                 soup = BeautifulSoup(response.content, 'html.parser')
@@ -1733,8 +1758,8 @@ class RekabetKurumuApiClient:
                 'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
             }
             
-            session = requests.Session()
-            response = session.get(decision_url, headers=headers, verify=False, timeout=30)
+            session = pooled_requests_session()
+            response = await run_blocking(session.get, decision_url, headers=headers, verify=False, timeout=30)
             
             if response.status_code == 200:
                 soup = BeautifulSoup(response.content, 'html.parser')
@@ -1853,6 +1878,19 @@ class UyusmazlikApiClient:
             "Origin": self.BASE_URL,
             "Referer": self.BASE_URL + "/",
         }
+        # Kalıcı oturumlar - ilk kullanımda (event loop içinde) oluşturulur
+        self.search_session: Optional[aiohttp.ClientSession] = None
+        self.http_client: Optional[httpx.AsyncClient] = None
+
+    def _get_search_session(self) -> aiohttp.ClientSession:
+        if self.search_session is None or self.search_session.closed:
+            self.search_session = aiohttp.ClientSession(headers=self.default_aiohttp_search_headers)
+        return self.search_session
+
+    def _get_document_client(self) -> httpx.AsyncClient:
+        if self.http_client is None or self.http_client.is_closed:
+            self.http_client = httpx.AsyncClient(verify=False, timeout=self.request_timeout, follow_redirects=True)
+        return self.http_client
 
     async def search_decisions(self, params: UyusmazlikSearchRequest) -> UyusmazlikSearchResponse:
         
@@ -1899,11 +1937,11 @@ class UyusmazlikApiClient:
         aiohttp_headers["Content-Type"] = "application/x-www-form-urlencoded; charset=UTF-8"
 
         try:
-            async with aiohttp.ClientSession(headers=aiohttp_headers) as session:
-                async with session.post(search_url, data=encoded_form_payload, timeout=self.request_timeout) as response:
-                    response.raise_for_status()
-                    html_content = await response.text(encoding='utf-8')
-                    logger.debug("UyusmazlikApiClient (aiohttp): Received HTML response for search.")
+            session = self._get_search_session()
+            async with session.post(search_url, data=encoded_form_payload, headers=aiohttp_headers, timeout=self.request_timeout) as response:
+                response.raise_for_status()
+                html_content = await response.text(encoding='utf-8')
+                logger.debug("UyusmazlikApiClient (aiohttp): Received HTML response for search.")
         
         except aiohttp.ClientError as e:
             logger.error(f"UyusmazlikApiClient (aiohttp): HTTP client error during search: {e}")
@@ -2145,8 +2183,8 @@ Bu sorun, web sitesindeki güncellemeler veya teknik değişikliklerden kaynakla
                     "Upgrade-Insecure-Requests": "1"
                 }
                 
-                async with httpx.AsyncClient(verify=False, timeout=self.request_timeout, follow_redirects=True) as doc_fetch_client:
-                    get_response = await doc_fetch_client.get(url_to_try, headers=headers)
+                doc_fetch_client = self._get_document_client()
+                get_response = await doc_fetch_client.get(url_to_try, headers=headers)
                 
                 logger.info(f"UyusmazlikApiClient: URL {i+1} returned status: {get_response.status_code}")
                 
@@ -2224,7 +2262,11 @@ Bu sorun genellikle web sitesi yapısındaki değişiklikler veya geçici erişi
         )
 
     async def close_client_session(self):
-        logger.info("UyusmazlikApiClient: No persistent client session from __init__ to close.") 
+        if self.search_session is not None and not self.search_session.closed:
+            await self.search_session.close()
+        if self.http_client is not None and not self.http_client.is_closed:
+            await self.http_client.aclose()
+        logger.info("UyusmazlikApiClient: Client sessions closed.")
 
 # ========================= YARGITAY CLIENT =========================
 
@@ -0,0 +1,180 @@
+"""
+Oturum kullanıcısı önbelleği
+Flask-Login her istekte load_user ile kullanıcıyı veritabanından yükler; Chrome
+eklentisinin yoklamaları ve /api/check_auth gibi hafif istekler de dahil. Bu
+modül kullanıcıyı süreç içinde kısa süreli (USER_CACHE_TTL saniye) tutar ve
+her istekte sorgusuz olarak isteğin session'ına bağlar (merge, load=False).
+
+Tutarlılık:
+    - User satırındaki her değişiklik (profil, yetki, onay, şifre...) flush
+      sırasında auth_version'ı bir artırır; commit sonrası aynı süreçteki
+      önbellek kaydı hemen silinir
+    - Diğer gunicorn worker'larında kayıt TTL dolunca yalnızca auth_version
+      okunarak doğrulanır; sürüm aynıysa kayıt yenilenir, değiştiyse kullanıcı
+      yeniden yüklenir
+    - Query.update()/delete() gibi toplu işlemler sürümü artıramadığı için
+      commit sonrası bu süreçteki önbelleğin tamamı temizlenir, diğer
+      worker'lar en geç TTL sonunda güncel veriyi görür
+
+USER_CACHE_TTL=0 ile önbellek kapatılır (eski davranış).
+Mevcut veritabanları için: migrations/versions/5d2a8f4c7e91_add_user_auth_version.py
+"""
+
+import os
+import copy
+import time
+import threading
+
+from sqlalchemy import JSON, event, select
+from sqlalchemy.orm import Session, object_session
+from sqlalchemy.orm.attributes import set_committed_value
+
+from models import db, User
+
+USER_CACHE_TTL_SECONDS = float(os.getenv('USER_CACHE_TTL', 30))
+USER_CACHE_MAX_SIZE = int(os.getenv('USER_CACHE_MAX_SIZE', 1000))
+
+_CHANGED_KEY = 'user_cache_changed'
+
+# Yerinde değiştirilebilen kolonlar (permissions gibi JSON sözlükleri); her isteğe ayrı kopya verilir
+_MUTABLE_COLUMNS = tuple(column.key for column in User.__table__.columns if isinstance(column.type, JSON))
+
+
+class UserCache:
+    """user_id -> (doğrulanma zamanı, auth_version, session'dan ayrılmış User kopyası)"""
+
+    def __init__(self, ttl=USER_CACHE_TTL_SECONDS, max_size=USER_CACHE_MAX_SIZE):
+        self.ttl = ttl
+        self.max_size = max(1, max_size)
+        self._entries = {}
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def load(self, user_id):
+        """Kullanıcıyı isteğin session'ına bağlı olarak döndürür; yoksa None"""
+        if self.ttl <= 0:
+            return db.session.get(User, user_id)
+
+        now = time.monotonic()
+        entry = self._entries.get(user_id)
+        if entry is not None and now - entry[0] >= self.ttl:
+            entry = self._revalidate(user_id, entry, now)
+
+        if entry is None:
+            self._misses += 1
+            snapshot = self._load_snapshot(user_id)
+            if snapshot is None:
+                return None
+            entry = (now, snapshot.auth_version, snapshot)
+            self._store(user_id, entry)
+        else:
+            self._hits += 1
+
+        return self._attach(entry[2])
+
+    def _attach(self, snapshot):
+        # merge(load=False) değerleri referansla kopyalar: isteğin yerinde yaptığı değişiklikler
+        # (user.permissions[...] = ...) paylaşılan kopyaya sızmasın diye değiştirilebilir kolonlar kopyalanır
+        user = db.session.merge(snapshot, load=False)
+        for key in _MUTABLE_COLUMNS:
+            set_committed_value(user, key, copy.deepcopy(getattr(snapshot, key)))
+        return user
+
+    def _revalidate(self, user_id, entry, now):
+        # Süresi dolan kayıt için tüm satır yerine yalnızca sürüm damgası okunur
+        version = db.session.execute(select(User.auth_version).where(User.id == user_id)).scalar()
+        if version is None or version != entry[1]:
+            self.invalidate(user_id)
+            return None
+        entry = (now, entry[1], entry[2])
+        self._store(user_id, entry)
+        return entry
+
+    def _load_snapshot(self, user_id):
+        # Ayrı session: kopya commit/teardown ile expire edilmez, istekler arası paylaşılabilir
+        with Session(db.engine, expire_on_commit=False) as session:
+            return session.get(User, user_id)
+
+    def _store(self, user_id, entry):
+        with self._lock:
+            if user_id not in self._entries and len(self._entries) >= self.max_size:
+                # En eski kaydı at (dict ekleme sırasını korur)
+                self._entries.pop(next(iter(self._entries)), None)
+            self._entries[user_id] = entry
+
+    def invalidate(self, user_id=None):
+        """Tek kullanıcıyı veya (user_id verilmezse) tüm önbelleği temizler"""
+        with self._lock:
+            if user_id is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(user_id, None)
+
+    def stats(self):
+        return {
+            'size': len(self._entries),
+            'hits': self._hits,
+            'misses': self._misses,
+        }
+
+
+user_cache = UserCache()
+
+
+def _mark_changed(session, user_id):
+    # None: toplu işlem, commit sonrası tüm önbellek temizlenir
+    session.info.setdefault(_CHANGED_KEY, set()).add(user_id)
+
+
+def _before_update(mapper, connection, target):
+    session = object_session(target)
+    if session is None or not session.is_modified(target, include_collections=False):
+        return
+    # Artış veritabanında yapılır: önbellekten gelen eski değer üzerinden aynı anda yapılan
+    # iki güncelleme aynı sürümü yazmasın
+    target.auth_version = User.auth_version + 1
+    _mark_changed(session, target.id)
+
+
+def _after_delete(mapper, connection, target):
+    session = object_session(target)
+    if session is not None:
+        _mark_changed(session, target.id)
+
+
+def _after_commit(session):
+    changed = session.info.pop(_CHANGED_KEY, None)
+    if not changed:
+        return
+    if None in changed:
+        user_cache.invalidate()
+        return
+    for user_id in changed:
+        user_cache.invalidate(user_id)
+
+
+def _after_rollback(session):
+    session.info.pop(_CHANGED_KEY, None)
+
+
+def _do_orm_execute(orm_execute_state):
+    if not (orm_execute_state.is_update or orm_execute_state.is_delete):
+        return None
+    mapper = orm_execute_state.bind_mapper
+    if mapper is None or mapper.class_ is not User:
+        return None
+    result = orm_execute_state.invoke_statement()
+    _mark_changed(orm_execute_state.session, None)
+    return result
+
+
+def register_user_cache_listeners():
+    """User değişikliklerinde önbelleği geçersiz kılan olayları bağlar (bir kez çağrılır)"""
+    if event.contains(User, 'before_update', _before_update):
+        return
+    event.listen(User, 'before_update', _before_update)
+    event.listen(User, 'after_delete', _after_delete)
+    event.listen(Session, 'after_commit', _after_commit)
+    event.listen(Session, 'after_rollback', _after_rollback)
+    event.listen(Session, 'do_orm_execute', _do_orm_execute)
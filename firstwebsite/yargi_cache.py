@@ -0,0 +1,392 @@
+"""
+Yargı kararları arama sonuçları için önbellek
+Aynı arama parametreleri (anahtar kelime, mahkeme, yıl, tarih, sayfa) için mahkeme
+sunucularına tekrar gitmeden sonucu döndürür.
+
+Backend seçimi environment üzerinden yapılır:
+    YARGI_CACHE_BACKEND     = memory | sqlite | none   (varsayılan: memory)
+    YARGI_CACHE_TTL         = saniye                   (varsayılan: 3600)
+    YARGI_CACHE_MAX_ENTRIES = LRU kapasitesi           (varsayılan: 512)
+    YARGI_CACHE_PATH        = sqlite dosya yolu        (varsayılan: instance/yargi_cache.db)
+
+sqlite backend tüm gunicorn worker'ları arasında paylaşılır.
+
+Karar metinleri ise yayımlandıktan sonra değişmediği için DecisionStore ile
+(court_type, document_id) anahtarıyla sıkıştırılmış olarak diske yazılır:
+    YARGI_DECISION_STORE_PATH = dizin (varsayılan: instance/yargi_kararlar)
+    YARGI_DECISION_STORE      = 1 | 0  (varsayılan: 1)
+"""
+
+import os
+import gzip
+import json
+import time
+import tempfile
+import sqlite3
+import hashlib
+import logging
+import threading
+import dataclasses
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_PATH = os.path.join(os.path.abspath(os.path.dirname(__file__)), 'instance', 'yargi_cache.db')
+DEFAULT_DECISION_STORE_PATH = os.path.join(os.path.abspath(os.path.dirname(__file__)), 'instance', 'yargi_kararlar')
+
+# Gerçek karar metni yerine dönen yönlendirme/hata içeriklerini işaretleyen ifadeler
+PLACEHOLDER_MARKERS = (
+    'alert alert-warning',
+    'Erişim Sorunu',
+    'Erişim Hatası',
+    'şu anda yüklenemiyor',
+    'Bu bir örnek KİK karar metnidir',
+)
+
+
+def normalize_keyword(keyword: str) -> str:
+    """Anahtar kelimeyi Türkçe kurallarına göre küçük harfe çevirir ve boşlukları sadeleştirir"""
+    if not keyword:
+        return ""
+    keyword = keyword.replace('İ', 'i').replace('I', 'ı')
+    return ' '.join(keyword.lower().split())
+
+
+def to_plain(value: Any) -> Any:
+    """Dataclass içeren sonuçları JSON uyumlu düz yapıya çevirir"""
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return dataclasses.asdict(value)
+    if isinstance(value, dict):
+        return {k: to_plain(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [to_plain(v) for v in value]
+    return value
+
+
+class MemoryCacheBackend:
+    """Süreç içi, boyut sınırlı LRU önbellek"""
+
+    def __init__(self, max_entries: int = 512):
+        self.max_entries = max_entries
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return None
+            expires_at, value = item
+            if expires_at < time.time():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any, ttl: float):
+        with self._lock:
+            self._data[key] = (time.time() + ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+
+    def delete(self, key: str):
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def size(self) -> int:
+        return len(self._data)
+
+
+class SQLiteCacheBackend:
+    """Worker'lar arasında paylaşılan SQLite tabanlı LRU önbellek"""
+
+    def __init__(self, path: str = DEFAULT_CACHE_PATH, max_entries: int = 512):
+        self.path = path
+        self.max_entries = max_entries
+        self._local = threading.local()
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with self._connect() as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS search_cache (
+                    key TEXT PRIMARY KEY,
+                    value TEXT NOT NULL,
+                    expires_at REAL NOT NULL,
+                    accessed_at REAL NOT NULL
+                )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS ix_search_cache_accessed_at ON search_cache (accessed_at)")
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=5, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def get(self, key: str) -> Optional[Any]:
+        conn = self._connect()
+        now = time.time()
+        row = conn.execute("SELECT value, expires_at FROM search_cache WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        if row[1] < now:
+            conn.execute("DELETE FROM search_cache WHERE key = ?", (key,))
+            return None
+        conn.execute("UPDATE search_cache SET accessed_at = ? WHERE key = ?", (now, key))
+        return json.loads(row[0])
+
+    def set(self, key: str, value: Any, ttl: float):
+        conn = self._connect()
+        now = time.time()
+        conn.execute(
+            "INSERT OR REPLACE INTO search_cache (key, value, expires_at, accessed_at) VALUES (?, ?, ?, ?)",
+            (key, json.dumps(value, ensure_ascii=False), now + ttl, now)
+        )
+        # Kapasite aşıldıysa süresi dolanları ve en eski erişilenleri sil
+        conn.execute("DELETE FROM search_cache WHERE expires_at < ?", (now,))
+        conn.execute("""
+            DELETE FROM search_cache WHERE key IN (
+                SELECT key FROM search_cache ORDER BY accessed_at DESC LIMIT -1 OFFSET ?
+            )
+        """, (self.max_entries,))
+
+    def delete(self, key: str):
+        self._connect().execute("DELETE FROM search_cache WHERE key = ?", (key,))
+
+    def clear(self):
+        self._connect().execute("DELETE FROM search_cache")
+
+    def size(self) -> int:
+        return self._connect().execute("SELECT COUNT(*) FROM search_cache").fetchone()[0]
+
+
+class SearchResultCache:
+    """Arama sonuçları önbelleği - TTL, LRU ve hit/miss sayaçları"""
+
+    def __init__(self, backend=None, ttl: float = 3600):
+        self.backend = backend
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.backend is not None
+
+    @staticmethod
+    def make_key(keyword: str = "", court_type: str = "all", court_unit: str = "",
+                 case_year: str = "", decision_year: str = "", start_date: str = "",
+                 end_date: str = "", page_number: int = 1, page_size: int = 20) -> str:
+        """Normalize edilmiş arama parametrelerinden önbellek anahtarı üretir"""
+        params = {
+            'keyword': normalize_keyword(keyword),
+            'court_type': (court_type or 'all').strip().lower(),
+            'court_unit': (court_unit or '').strip(),
+            'case_year': str(case_year or '').strip(),
+            'decision_year': str(decision_year or '').strip(),
+            'start_date': (start_date or '').strip(),
+            'end_date': (end_date or '').strip(),
+            'page_number': int(page_number or 1),
+            'page_size': int(page_size or 20),
+        }
+        raw = json.dumps(params, sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        if not self.enabled:
+            return None
+        try:
+            value = self.backend.get(key)
+        except Exception as e:
+            logger.warning(f"Arama önbelleği okunamadı: {e}")
+            value = None
+        with self._lock:
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return value
+
+    def set(self, key: str, value: Dict[str, Any]):
+        if not self.enabled:
+            return
+        try:
+            self.backend.set(key, to_plain(value), self.ttl)
+        except Exception as e:
+            logger.warning(f"Arama önbelleğine yazılamadı: {e}")
+
+    def clear(self):
+        if self.enabled:
+            self.backend.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        total = self.hits + self.misses
+        try:
+            size = self.backend.size() if self.enabled else 0
+        except Exception:
+            size = None
+        return {
+            'backend': type(self.backend).__name__ if self.enabled else None,
+            'ttl': self.ttl,
+            'size': size,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_ratio': round(self.hits / total, 3) if total else 0.0,
+        }
+
+
+def create_search_cache_from_env() -> SearchResultCache:
+    """Environment ayarlarına göre arama önbelleğini oluşturur"""
+    backend_name = os.environ.get('YARGI_CACHE_BACKEND', 'memory').lower()
+    ttl = float(os.environ.get('YARGI_CACHE_TTL', '3600'))
+    max_entries = int(os.environ.get('YARGI_CACHE_MAX_ENTRIES', '512'))
+
+    backend = None
+    if backend_name == 'memory':
+        backend = MemoryCacheBackend(max_entries=max_entries)
+    elif backend_name == 'sqlite':
+        try:
+            backend = SQLiteCacheBackend(os.environ.get('YARGI_CACHE_PATH', DEFAULT_CACHE_PATH), max_entries=max_entries)
+        except Exception as e:
+            logger.error(f"SQLite arama önbelleği açılamadı, bellek içi önbellek kullanılacak: {e}")
+            backend = MemoryCacheBackend(max_entries=max_entries)
+    elif backend_name != 'none':
+        logger.warning(f"Bilinmeyen YARGI_CACHE_BACKEND değeri: {backend_name}, önbellek devre dışı")
+
+    return SearchResultCache(backend=backend, ttl=ttl)
+
+
+class DecisionStore:
+    """Karar metinleri için disk üzerinde, sıkıştırılmış içerik deposu.
+
+    Her karar (court_type, document_id) çiftinin SHA-256 özetiyle adreslenen
+    tek bir .json.gz dosyasında tutulur. Yazma işlemi geçici dosya + os.replace
+    ile atomiktir, bu yüzden worker'lar aynı dizini güvenle paylaşabilir.
+
+    court_type istekten geldiği için dizin adında kullanılmadan önce courts
+    listesiyle doğrulanır; listede olmayan mahkeme her zaman ıska sayılır.
+    """
+
+    def __init__(self, root: str = DEFAULT_DECISION_STORE_PATH, courts: Iterable[str] = ()):
+        self.root = root
+        self.courts = frozenset(court.strip().lower() for court in courts)
+        self.hits = 0
+        self.misses = 0
+        os.makedirs(root, exist_ok=True)
+
+    @staticmethod
+    def normalize_court(court_type: str) -> str:
+        return (court_type or '').strip().lower()
+
+    @staticmethod
+    def make_key(court_type: str, document_id: str) -> str:
+        raw = f"{DecisionStore.normalize_court(court_type)}:{(document_id or '').strip()}"
+        return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+    def _path(self, court_type: str, document_id: str) -> Optional[str]:
+        """Kayıt dosyasının yolu; bilinmeyen mahkeme için None"""
+        court = self.normalize_court(court_type)
+        if court not in self.courts:
+            return None
+        key = self.make_key(court, document_id)
+        return os.path.join(self.root, court, key[:2], f"{key}.json.gz")
+
+    @staticmethod
+    def is_storable(result: Dict[str, Any]) -> bool:
+        """Yalnızca gerçek karar metnini içeren başarılı sonuçlar saklanır"""
+        if not result or not result.get('success') or result.get('error_info'):
+            return False
+        if result.get('content_type', 'text') != 'text' or not result.get('extraction_method'):
+            return False
+        content = result.get('content') or ''
+        if len(content) < 200:
+            return False
+        return not any(marker in content for marker in PLACEHOLDER_MARKERS)
+
+    def contains(self, court_type: str, document_id: str) -> bool:
+        path = self._path(court_type, document_id)
+        return path is not None and os.path.exists(path)
+
+    def get(self, court_type: str, document_id: str) -> Optional[Dict[str, Any]]:
+        path = self._path(court_type, document_id)
+        if path is None:
+            self.misses += 1
+            return None
+        try:
+            with gzip.open(path, 'rt', encoding='utf-8') as f:
+                record = json.load(f)
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        except Exception as e:
+            logger.warning(f"Karar deposundan okunamadı ({court_type}/{document_id}): {e}")
+            self.misses += 1
+            return None
+        self.hits += 1
+        return record
+
+    def put(self, court_type: str, document_id: str, result: Dict[str, Any]) -> bool:
+        path = self._path(court_type, document_id)
+        if path is None or not self.is_storable(result):
+            return False
+        record = {
+            'court_type': self.normalize_court(court_type),
+            'document_id': document_id,
+            'content': result['content'],
+            'source_url': result.get('source_url', ''),
+            'extraction_method': result.get('extraction_method', ''),
+            'stored_at': time.time(),
+        }
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'wb') as raw, gzip.GzipFile(fileobj=raw, mode='wb', compresslevel=6) as gz:
+                    gz.write(json.dumps(record, ensure_ascii=False).encode('utf-8'))
+                os.replace(tmp_path, path)
+            except Exception:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+                raise
+            return True
+        except Exception as e:
+            logger.warning(f"Karar deposuna yazılamadı ({court_type}/{document_id}): {e}")
+            return False
+
+    def iter_records(self):
+        """Depodaki tüm kayıtları dolaşır (indeks yeniden oluşturma vb. için)"""
+        for dirpath, _, filenames in os.walk(self.root):
+            for filename in filenames:
+                if not filename.endswith('.json.gz'):
+                    continue
+                try:
+                    with gzip.open(os.path.join(dirpath, filename), 'rt', encoding='utf-8') as f:
+                        yield json.load(f)
+                except Exception as e:
+                    logger.warning(f"Karar deposu kaydı okunamadı ({filename}): {e}")
+
+    def stats(self) -> Dict[str, Any]:
+        return {'root': self.root, 'hits': self.hits, 'misses': self.misses}
+
+
+def create_decision_store_from_env(courts: Iterable[str] = ()) -> Optional[DecisionStore]:
+    """Environment ayarlarına göre karar deposunu oluşturur (kapalıysa None)
+
+    courts verilmezse depo yalnızca okunabilir (iter_records); get/put ıska döner.
+    """
+    if os.environ.get('YARGI_DECISION_STORE', '1') in ('0', 'false', 'False'):
+        return None
+    try:
+        return DecisionStore(os.environ.get('YARGI_DECISION_STORE_PATH', DEFAULT_DECISION_STORE_PATH), courts)
+    except Exception as e:
+        logger.error(f"Karar deposu açılamadı: {e}")
+        return None
@@ -0,0 +1,230 @@
+"""
+Yerel karar metinleri için çevrimdışı tam metin arama indeksi
+get_document_content ile alınan her karar metni SQLite FTS5 indeksine eklenir;
+böylece daha önce açılmış kararlar mahkeme sunucularına gitmeden, BM25
+sıralamasıyla milisaniyeler içinde tekrar aranabilir.
+
+Türkçe uyumu için metin ve sorgu aynı şekilde katlanır (İ/ı, ş, ğ, ç, ö, ü):
+"Kıdem Tazminatı", "KIDEM TAZMİNATI" ve "kidem tazminati" aynı terimlere düşer.
+Katlama karakter başına birebir yapıldığı için katlanmış metindeki konumlar
+orijinal metinle aynıdır (özet/snippet üretiminde kullanılır).
+
+    YARGI_INDEX_PATH = sqlite dosya yolu (varsayılan: instance/yargi_index.db)
+    YARGI_INDEX      = 1 | 0             (varsayılan: 1)
+"""
+
+import os
+import time
+import sqlite3
+import logging
+import threading
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_INDEX_PATH = os.path.join(os.path.abspath(os.path.dirname(__file__)), 'instance', 'yargi_index.db')
+
+_TURKISH_FOLD_MAP = str.maketrans({
+    'İ': 'i', 'I': 'i', 'ı': 'i',
+    'Ş': 's', 'ş': 's',
+    'Ğ': 'g', 'ğ': 'g',
+    'Ç': 'c', 'ç': 'c',
+    'Ö': 'o', 'ö': 'o',
+    'Ü': 'u', 'ü': 'u',
+    'Â': 'a', 'â': 'a',
+    'Î': 'i', 'î': 'i',
+    'Û': 'u', 'û': 'u',
+})
+
+
+def turkish_fold(text: str) -> str:
+    """Türkçe harfleri ASCII karşılıklarına katlayıp küçük harfe çevirir (uzunluk korunur)"""
+    if not text:
+        return ""
+    folded = text.translate(_TURKISH_FOLD_MAP)
+    # lower() bazı karakterlerde uzunluğu değiştirebilir, bu durumda karakter olduğu gibi kalır
+    lowered = folded.lower()
+    if len(lowered) == len(folded):
+        return lowered
+    return ''.join(ch.lower() if len(ch.lower()) == 1 else ch for ch in folded)
+
+
+def _query_terms(query: str) -> List[str]:
+    terms = []
+    for raw in turkish_fold(query).split():
+        term = ''.join(ch for ch in raw if ch.isalnum())
+        if term:
+            terms.append(term)
+    return terms
+
+
+class DecisionIndex:
+    """SQLite FTS5 tabanlı karar metni indeksi (BM25 sıralama)"""
+
+    def __init__(self, path: str = DEFAULT_INDEX_PATH):
+        self.path = path
+        self._local = threading.local()
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        conn = self._connect()
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS decisions (
+                id INTEGER PRIMARY KEY,
+                court_type TEXT NOT NULL,
+                document_id TEXT NOT NULL,
+                title TEXT,
+                content TEXT NOT NULL,
+                source_url TEXT,
+                indexed_at REAL NOT NULL,
+                UNIQUE (court_type, document_id)
+            )
+        """)
+        conn.execute("""
+            CREATE VIRTUAL TABLE IF NOT EXISTS decisions_fts USING fts5(
+                title, body, content='', tokenize='unicode61 remove_diacritics 2'
+            )
+        """)
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=5, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    @staticmethod
+    def _title_from_content(content: str) -> str:
+        for line in content.splitlines():
+            line = line.strip().lstrip('#').strip()
+            if len(line) > 5:
+                return line[:150]
+        return ""
+
+    def add(self, court_type: str, document_id: str, content: str, source_url: str = "") -> bool:
+        """Kararı indekse ekler ya da günceller"""
+        if not content:
+            return False
+        title = self._title_from_content(content)
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            row = conn.execute(
+                "SELECT id, title, content FROM decisions WHERE court_type = ? AND document_id = ?",
+                (court_type, document_id)
+            ).fetchone()
+            if row is not None:
+                # contentless FTS5 tablosunda silme için eski değerler gerekir
+                conn.execute(
+                    "INSERT INTO decisions_fts (decisions_fts, rowid, title, body) VALUES ('delete', ?, ?, ?)",
+                    (row[0], turkish_fold(row[1] or ''), turkish_fold(row[2]))
+                )
+                conn.execute(
+                    "UPDATE decisions SET title = ?, content = ?, source_url = ?, indexed_at = ? WHERE id = ?",
+                    (title, content, source_url, time.time(), row[0])
+                )
+                rowid = row[0]
+            else:
+                rowid = conn.execute(
+                    "INSERT INTO decisions (court_type, document_id, title, content, source_url, indexed_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (court_type, document_id, title, content, source_url, time.time())
+                ).lastrowid
+            conn.execute(
+                "INSERT INTO decisions_fts (rowid, title, body) VALUES (?, ?, ?)",
+                (rowid, turkish_fold(title), turkish_fold(content))
+            )
+            conn.execute("COMMIT")
+            return True
+        except Exception as e:
+            conn.execute("ROLLBACK")
+            logger.warning(f"Karar indekse eklenemedi ({court_type}/{document_id}): {e}")
+            return False
+
+    @staticmethod
+    def _snippet(content: str, terms: List[str], width: int = 240) -> str:
+        folded = turkish_fold(content)
+        position = -1
+        for term in terms:
+            position = folded.find(term)
+            if position >= 0:
+                break
+        start = max(0, position - width // 3) if position >= 0 else 0
+        snippet = ' '.join(content[start:start + width].split())
+        return ('…' if start > 0 else '') + snippet + ('…' if start + width < len(content) else '')
+
+    def search(self, query: str, court_type: str = "all", page_number: int = 1,
+               page_size: int = 20) -> Dict[str, Any]:
+        """Yerel indekste BM25 sıralamalı arama yapar"""
+        terms = _query_terms(query)
+        if not terms:
+            return {'total': 0, 'results': []}
+
+        # Türkçe ekler için önek eşleşmesi: "tazminat" -> "tazminati", "tazminatin"
+        match_expr = ' '.join(f'"{term}"*' for term in terms)
+        where = "decisions_fts MATCH ?"
+        params: List[Any] = [match_expr]
+        if court_type and court_type != "all":
+            where += " AND d.court_type = ?"
+            params.append(court_type)
+
+        conn = self._connect()
+        total = conn.execute(
+            f"SELECT COUNT(*) FROM decisions_fts JOIN decisions d ON d.id = decisions_fts.rowid WHERE {where}",
+            params
+        ).fetchone()[0]
+        rows = conn.execute(
+            f"""SELECT d.court_type, d.document_id, d.title, d.content, d.source_url,
+                       bm25(decisions_fts, 5.0, 1.0) AS score
+                FROM decisions_fts JOIN decisions d ON d.id = decisions_fts.rowid
+                WHERE {where}
+                ORDER BY score
+                LIMIT ? OFFSET ?""",
+            params + [page_size, (max(1, page_number) - 1) * page_size]
+        ).fetchall()
+
+        results = [{
+            'court_type': row[0],
+            'document_id': row[1],
+            'title': row[2] or row[1],
+            'snippet': self._snippet(row[3], terms),
+            'source_url': row[4] or '',
+            'score': row[5],
+        } for row in rows]
+        return {'total': total, 'results': results}
+
+    def rebuild_from_store(self, store) -> int:
+        """Karar deposundaki tüm kayıtları indekse (yeniden) ekler"""
+        count = 0
+        for record in store.iter_records():
+            if self.add(record['court_type'], record['document_id'], record['content'], record.get('source_url', '')):
+                count += 1
+        return count
+
+    def size(self) -> int:
+        return self._connect().execute("SELECT COUNT(*) FROM decisions").fetchone()[0]
+
+
+def create_decision_index_from_env() -> Optional[DecisionIndex]:
+    """Environment ayarlarına göre indeksi oluşturur (kapalıysa veya FTS5 yoksa None)"""
+    if os.environ.get('YARGI_INDEX', '1') in ('0', 'false', 'False'):
+        return None
+    try:
+        return DecisionIndex(os.environ.get('YARGI_INDEX_PATH', DEFAULT_INDEX_PATH))
+    except Exception as e:
+        logger.error(f"Karar indeksi açılamadı (SQLite FTS5 gerekli): {e}")
+        return None
+
+
+if __name__ == "__main__":
+    # Mevcut karar deposundan indeksi yeniden oluştur: python yargi_index.py
+    from yargi_cache import create_decision_store_from_env
+
+    logging.basicConfig(level=logging.INFO)
+    store = create_decision_store_from_env()
+    index = create_decision_index_from_env()
+    if store is None or index is None:
+        print("Karar deposu veya indeks devre dışı.")
+    else:
+        added = index.rebuild_from_store(store)
+        print(f"{added} karar indekslendi, toplam: {index.size()}")
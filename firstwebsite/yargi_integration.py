@@ -52,9 +52,15 @@ from unified_mcp_modules import (
     YargitayApiSearchResponse,
     YargitayDocumentMarkdown,
     
+    # Yardımcılar
+    run_blocking,
+    
     # Logging
     logger
 )
+from yargi_cache import SearchResultCache, create_search_cache_from_env, create_decision_store_from_env
+from yargi_index import create_decision_index_from_env
+from yargi_text import clean_decision_text, clean_decision_text_light
 
 import asyncio
 import logging
@@ -71,12 +77,38 @@ from bs4 import BeautifulSoup
 import time
 import html
 import json
+import functools
+import threading
+import concurrent.futures
+import contextlib
+import queue
+from collections import deque
 
 # MCP modülleri artık unified_mcp_modules'tan import ediliyor
 # Eski import'lar kaldırıldı
 
 logger = logging.getLogger(__name__)
 
+# Tüm mahkemeler aramasında paralel sorgular için ortak süre sınırı (saniye)
+SEARCH_DEADLINE_SECONDS = float(os.environ.get('YARGI_SEARCH_DEADLINE', '25'))
+# Tek bir mahkeme araması için üst zaman aşımı; gözlenen p95 süresine göre aşağı çekilir
+COURT_MAX_TIMEOUT_SECONDS = float(os.environ.get('YARGI_COURT_MAX_TIMEOUT', '30'))
+# Arama sonrası her mahkemenin ilk N kararını arka planda karar deposuna çek (0 = kapalı)
+PREFETCH_TOP_N = int(os.environ.get('YARGI_PREFETCH_TOP_N', '3'))
+PREFETCH_CONCURRENCY = int(os.environ.get('YARGI_PREFETCH_CONCURRENCY', '2'))
+# Kullanıcı, ön getirmesi süren bir kararı açarsa en fazla bu kadar beklenir (saniye)
+PREFETCH_WAIT_SECONDS = float(os.environ.get('YARGI_PREFETCH_WAIT', '10'))
+
+COURT_LABELS = {
+    'yargitay': 'Yargıtay',
+    'danistay': 'Danıştay',
+    'emsal': 'Emsal',
+    'anayasa': 'Anayasa Mahkemesi',
+    'uyusmazlik': 'Uyuşmazlık Mahkemesi',
+    'kik': 'KİK',
+    'rekabet': 'Rekabet Kurumu',
+}
+
 @dataclass
 class YargiSearchResult:
     """Flask için uyumlu arama sonuç veri yapısı"""
@@ -180,10 +212,329 @@ class HttpRequestManager:
 # Global HTTP istek yöneticisi
 http_manager = HttpRequestManager()
 
+class CircuitOpenError(Exception):
+    """Devre kesici açıkken mahkemeye istek gönderilmediğini belirtir"""
+    pass
+
+
+class CourtSearchError(Exception):
+    """Mahkeme araması yanıt alamadan başarısız oldu (API ve yedek yöntemler)"""
+    pass
+
+
+class CourtCircuitBreaker:
+    """Mahkeme başına devre kesici ve uyarlanabilir zaman aşımı.
+    
+    Son istekleri (başarı, süre) kayan pencerede tutar. Art arda hata sayısı ya da
+    penceredeki hata oranı eşiği aşınca devre açılır ve bekleme süresi boyunca
+    istek gönderilmez; süre dolunca tek bir deneme isteğine izin verilir
+    (half-open). Zaman aşımı, başarılı isteklerin p95 süresinden türetilir.
+    """
+    
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+    
+    def __init__(self,
+                 name: str,
+                 window_size: int = 20,
+                 failure_threshold: int = 3,
+                 failure_rate: float = 0.5,
+                 min_samples: int = 6,
+                 open_seconds: float = 60.0,
+                 min_timeout: float = 3.0,
+                 max_timeout: float = 30.0,
+                 timeout_multiplier: float = 2.0):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.failure_rate = failure_rate
+        self.min_samples = min_samples
+        self.open_seconds = open_seconds
+        self.min_timeout = min_timeout
+        self.max_timeout = max_timeout
+        self.timeout_multiplier = timeout_multiplier
+        self._samples = deque(maxlen=window_size)  # (başarılı mı, süre)
+        self._consecutive_failures = 0
+        self._state = self.CLOSED
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self._lock = threading.Lock()
+    
+    @property
+    def state(self) -> str:
+        with self._lock:
+            if self._state == self.OPEN and time.monotonic() - self._opened_at >= self.open_seconds:
+                return self.HALF_OPEN
+            return self._state
+    
+    def allow(self) -> bool:
+        """İstek gönderilebilir mi? Half-open durumunda yalnızca tek deneme isteğine izin verir"""
+        with self._lock:
+            if self._state == self.CLOSED:
+                return True
+            if time.monotonic() - self._opened_at < self.open_seconds:
+                return False
+            if self._probe_in_flight:
+                return False
+            self._state = self.HALF_OPEN
+            self._probe_in_flight = True
+            return True
+    
+    def current_timeout(self) -> float:
+        """Başarılı isteklerin p95 süresinden türetilen zaman aşımı"""
+        with self._lock:
+            latencies = sorted(latency for ok, latency in self._samples if ok)
+        if len(latencies) < self.min_samples:
+            return self.max_timeout
+        p95 = latencies[min(len(latencies) - 1, int(round(0.95 * (len(latencies) - 1))))]
+        return max(self.min_timeout, min(self.max_timeout, p95 * self.timeout_multiplier))
+    
+    def record_success(self, latency: float):
+        with self._lock:
+            self._samples.append((True, latency))
+            self._consecutive_failures = 0
+            self._probe_in_flight = False
+            if self._state != self.CLOSED:
+                logger.info(f"{self.name} devre kesici kapandı")
+            self._state = self.CLOSED
+    
+    def record_failure(self, latency: float):
+        with self._lock:
+            self._samples.append((False, latency))
+            self._consecutive_failures += 1
+            self._probe_in_flight = False
+            failures = sum(1 for ok, _ in self._samples if not ok)
+            rate_exceeded = len(self._samples) >= self.min_samples and failures / len(self._samples) >= self.failure_rate
+            if (self._state == self.HALF_OPEN
+                    or self._consecutive_failures >= self.failure_threshold
+                    or rate_exceeded):
+                if self._state != self.OPEN:
+                    logger.warning(f"{self.name} devre kesici açıldı ({self.open_seconds:.0f} sn)")
+                self._state = self.OPEN
+                self._opened_at = time.monotonic()
+    
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            samples = list(self._samples)
+        return {
+            'state': self.state,
+            'timeout': round(self.current_timeout(), 2),
+            'samples': len(samples),
+            'failures': sum(1 for ok, _ in samples if not ok),
+            'consecutive_failures': self._consecutive_failures,
+        }
+
+# Worker başına kalıcı event loop
+class BackgroundEventLoop:
+    """Ayrı bir daemon thread'de sürekli çalışan asyncio event loop'u.
+    
+    Flask handler'ları coroutine'leri run() ile bu loop'a gönderir; böylece
+    httpx/aiohttp client'ları tek bir loop'a bağlı kalır ve keep-alive
+    bağlantıları ile TLS oturumları istekler arasında yeniden kullanılır.
+    Gunicorn fork'undan sonra (pid değişince) loop yeniden başlatılır ve
+    on_restart callback'i ile client'lar yeniden oluşturulur.
+    """
+    
+    def __init__(self, on_restart=None):
+        self._loop = None
+        self._thread = None
+        self._pid = None
+        self._lock = threading.Lock()
+        self._on_restart = on_restart
+    
+    def _run_loop(self, loop):
+        asyncio.set_event_loop(loop)
+        loop.run_forever()
+    
+    def _ensure_running(self):
+        with self._lock:
+            if (self._loop is not None and self._pid == os.getpid()
+                    and self._thread.is_alive() and not self._loop.is_closed()):
+                return self._loop
+            
+            restarted = self._loop is not None
+            loop = asyncio.new_event_loop()
+            thread = threading.Thread(target=self._run_loop, args=(loop,),
+                                      name='yargi-event-loop', daemon=True)
+            thread.start()
+            self._loop, self._thread, self._pid = loop, thread, os.getpid()
+            
+            if restarted and self._on_restart:
+                # Eski loop'a bağlı client'lar kullanılamaz, yenilerini oluştur
+                self._on_restart()
+            logger.info(f"Yargı event loop thread'i başlatıldı (pid={self._pid})")
+            return loop
+    
+    def submit(self, coro) -> concurrent.futures.Future:
+        """Coroutine'i arka plan loop'una gönderir, beklemeden Future döndürür"""
+        loop = self._ensure_running()
+        return asyncio.run_coroutine_threadsafe(coro, loop)
+    
+    def run(self, coro, timeout: Optional[float] = None):
+        """Coroutine'i arka plan loop'unda çalıştırır ve sonucunu bekler"""
+        future = self.submit(coro)
+        try:
+            return future.result(timeout)
+        except concurrent.futures.TimeoutError:
+            future.cancel()
+            raise
+    
+    def stop(self):
+        """Loop'u durdurur (uygulama kapanırken)"""
+        with self._lock:
+            if self._loop is not None and self._pid == os.getpid() and not self._loop.is_closed():
+                self._loop.call_soon_threadsafe(self._loop.stop)
+                self._thread.join(timeout=5)
+            self._loop = None
+            self._thread = None
+
+
+class DecisionPrefetcher:
+    """Arama sonrasında ilk kararların tam metnini arka planda karar deposuna çeker.
+
+    Sınırlı sayıda worker thread'i kuyruktaki (court, document_id, url) işlerini
+    sırayla alır. Canlı bir kullanıcı isteği (arama veya karar metni) sürerken yeni
+    iş başlatılmaz; böylece ön getirme mahkeme sunucularına giden kullanıcı
+    isteklerinin önüne geçmez. Zaten depoda olan, kuyrukta bekleyen ya da devre
+    kesicisi açık mahkemeye ait kararlar atlanır.
+    """
+
+    def __init__(self, fetch, is_stored, is_court_available=None,
+                 concurrency: int = 2, max_queue: int = 100,
+                 idle_wait: float = 0.5, max_defer: float = 30.0):
+        self._fetch = fetch
+        self._is_stored = is_stored
+        self._is_court_available = is_court_available or (lambda court: True)
+        self.concurrency = max(1, concurrency)
+        self.idle_wait = idle_wait
+        self.max_defer = max_defer
+        self._queue = queue.Queue(maxsize=max_queue)
+        self._queued = set()
+        self._inflight = {}
+        self._live_requests = 0
+        self._cond = threading.Condition()
+        self._workers = []
+        self._pid = None
+        self.fetched = 0
+        self.skipped = 0
+        self.dropped = 0
+
+    def _ensure_workers(self):
+        # Gunicorn fork'undan sonra thread'ler kopyalanmaz, worker'ları yeniden başlat
+        if self._pid == os.getpid() and all(worker.is_alive() for worker in self._workers):
+            return
+        self._pid = os.getpid()
+        self._workers = []
+        for i in range(self.concurrency):
+            worker = threading.Thread(target=self._run, name=f'yargi-prefetch-{i}', daemon=True)
+            worker.start()
+            self._workers.append(worker)
+
+    @contextlib.contextmanager
+    def live_request(self):
+        """Canlı kullanıcı isteği süresince yeni ön getirme işlerini bekletir"""
+        with self._cond:
+            self._live_requests += 1
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._live_requests -= 1
+                self._cond.notify_all()
+
+    def schedule(self, items) -> int:
+        """(court, document_id, url) işlerini kuyruğa ekler, eklenen iş sayısını döndürür"""
+        added = 0
+        for court, document_id, url in items:
+            key = (court, str(document_id))
+            with self._cond:
+                if key in self._queued or key in self._inflight:
+                    continue
+                try:
+                    self._queue.put_nowait((court, str(document_id), url))
+                except queue.Full:
+                    self.dropped += 1
+                    break
+                self._queued.add(key)
+            added += 1
+        if added:
+            self._ensure_workers()
+        return added
+
+    def wait_inflight(self, court: str, document_id: str, timeout: float) -> bool:
+        """Karar şu anda ön getiriliyorsa bitmesini bekler (aynı kararı iki kez çekmemek için)"""
+        with self._cond:
+            done = self._inflight.get((court, str(document_id)))
+        if done is None:
+            return False
+        return done.wait(timeout)
+
+    def _run(self):
+        while True:
+            court, document_id, url = self._queue.get()
+            key = (court, document_id)
+            try:
+                # Canlı istekler bitene kadar bekle (kapanmamış bir akış işleri sonsuza dek durdurmasın)
+                deferred_until = time.monotonic() + self.max_defer
+                with self._cond:
+                    while self._live_requests > 0 and time.monotonic() < deferred_until:
+                        self._cond.wait(self.idle_wait)
+                if self._is_stored(court, document_id) or not self._is_court_available(court):
+                    with self._cond:
+                        self._queued.discard(key)
+                        self.skipped += 1
+                    continue
+                with self._cond:
+                    self._queued.discard(key)
+                    done = self._inflight[key] = threading.Event()
+                try:
+                    self._fetch(court, document_id, url)
+                    self.fetched += 1
+                except Exception as e:
+                    logger.warning(f"Ön getirme başarısız ({court}/{document_id}): {e}")
+                finally:
+                    with self._cond:
+                        self._inflight.pop(key, None)
+                    done.set()
+            finally:
+                self._queue.task_done()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._cond:
+            return {
+                'queued': len(self._queued),
+                'inflight': len(self._inflight),
+                'fetched': self.fetched,
+                'skipped': self.skipped,
+                'dropped': self.dropped,
+            }
+
 class YargiFlaskIntegration:
     """Yargı MCP modüllerini Flask ile entegre eden ana sınıf"""
     
     def __init__(self):
+        self._init_clients()
+        self.http_manager = http_manager
+        self.loop_runner = BackgroundEventLoop(on_restart=self._init_clients)
+        self.search_cache = create_search_cache_from_env()
+        self.circuit_breakers = {
+            court: CourtCircuitBreaker(label, max_timeout=COURT_MAX_TIMEOUT_SECONDS)
+            for court, label in COURT_LABELS.items()
+        }
+        self.decision_store = create_decision_store_from_env(courts=COURT_LABELS)
+        self.decision_index = create_decision_index_from_env()
+        self.prefetch_top_n = PREFETCH_TOP_N
+        self.prefetcher = DecisionPrefetcher(
+            fetch=lambda court, document_id, url: prefetch_document_content(court, document_id, url),
+            is_stored=lambda court, document_id: (self.decision_store is not None
+                                                  and self.decision_store.contains(court, document_id)),
+            is_court_available=lambda court: (court not in self.circuit_breakers
+                                              or self.circuit_breakers[court].state == CourtCircuitBreaker.CLOSED),
+            concurrency=PREFETCH_CONCURRENCY
+        )
+    
+    def _init_clients(self):
+        """Uzun ömürlü API client'larını oluşturur (tümü arka plan loop'unda kullanılır)"""
         self.yargitay_client = YargitayOfficialApiClient()
         self.danistay_client = DanistayApiClient()
         self.emsal_client = EmsalApiClient()
@@ -191,7 +542,10 @@ class YargiFlaskIntegration:
         self.uyusmazlik_client = UyusmazlikApiClient()
         self.kik_client = KikApiClient()
         self.rekabet_client = RekabetKurumuApiClient()
-        self.http_manager = http_manager
+    
+    def run_async(self, coro, timeout: Optional[float] = None):
+        """Senkron Flask kodundan coroutine çalıştırır (kalıcı event loop üzerinden)"""
+        return self.loop_runner.run(coro, timeout)
     
     def search_all_courts(self, 
                          keyword: str,
@@ -202,10 +556,234 @@ class YargiFlaskIntegration:
                          start_date: str = "",
                          end_date: str = "",
                          page_number: int = 1,
-                         page_size: int = 20) -> Dict[str, Any]:
-        """Tüm mahkemelerde arama yapar"""
+                         page_size: int = 20,
+                         concurrent: bool = True,
+                         deadline: Optional[float] = None,
+                         no_cache: bool = False,
+                         prefetch: bool = True) -> Dict[str, Any]:
+        """Tüm mahkemelerde arama yapar
+        
+        concurrent=True iken seçilen mahkemeler aynı anda sorgulanır ve ortak bir
+        süre sınırı (deadline) uygulanır; süresi dolan mahkemeler boş sonuçla
+        'timed_out_courts' listesinde raporlanır. concurrent=False eski sıralı moddur.
+        Tam (zaman aşımı/hata içermeyen) sonuçlar önbelleğe yazılır; no_cache=True
+        önbelleği atlayıp mahkemelerden taze sonuç alır. prefetch=True iken her
+        mahkemenin ilk kararları arka planda karar deposuna çekilir.
+        """
+        
+        cache_key = SearchResultCache.make_key(
+            keyword=keyword,
+            court_type=court_type,
+            court_unit=court_unit,
+            case_year=case_year,
+            decision_year=decision_year,
+            start_date=start_date,
+            end_date=end_date,
+            page_number=page_number,
+            page_size=page_size
+        )
+        if not no_cache:
+            cached = self.search_cache.get(cache_key)
+            if cached is not None:
+                logger.info(f"Arama önbellekten döndü: {keyword}")
+                if prefetch:
+                    self.schedule_prefetch(cached)
+                return dict(cached, from_cache=True)
+        
+        complete = True
+        results = self._new_results(page_number, page_size)
+        
+        court_searches = self._build_court_searches(
+            keyword=keyword,
+            court_type=court_type,
+            court_unit=court_unit,
+            case_year=case_year,
+            decision_year=decision_year,
+            start_date=start_date,
+            end_date=end_date,
+            page_number=page_number,
+            page_size=page_size
+        )
+        
+        try:
+            if concurrent:
+                outcomes = self.run_async(
+                    self._run_court_searches_concurrently(
+                        court_searches,
+                        deadline if deadline is not None else SEARCH_DEADLINE_SECONDS
+                    )
+                )
+            else:
+                outcomes = {}
+                for court, search in court_searches.items():
+                    try:
+                        outcomes[court] = ('ok', self.run_async(search()))
+                    except Exception as e:
+                        outcomes[court] = (self._classify_error(e), e)
+            
+            for court, (status, value) in outcomes.items():
+                label = COURT_LABELS[court]
+                if status == 'ok':
+                    results[court] = value
+                    logger.info(f"{label} araması tamamlandı: {len(value['decisions'])} sonuç")
+                elif status == 'timeout':
+                    logger.warning(f"{label} araması süre sınırını aştı")
+                    results[court] = self._empty_response(page_number, page_size)
+                    results[court]['timed_out'] = True
+                    results['timed_out_courts'].append(court)
+                    complete = False
+                elif status == 'unavailable':
+                    logger.info(f"{label} devre kesici açık, arama atlandı")
+                    results[court] = self._empty_response(page_number, page_size)
+                    results[court]['unavailable'] = True
+                    results['unavailable_courts'].append(court)
+                    complete = False
+                else:
+                    logger.error(f"{label} arama hatası: {value}")
+                    results[court] = self._empty_response(page_number, page_size)
+                    complete = False
+                
+        except Exception as e:
+            complete = False
+            logger.error(f"Genel arama hatası: {e}")
+            # Hata durumunda boş sonuç döndür
+            for ct in court_searches:
+                results[ct] = self._empty_response(page_number, page_size)
         
-        results = {
+        self._apply_totals(results, page_size)
+        
+        if complete:
+            self.search_cache.set(cache_key, results)
+        if prefetch:
+            self.schedule_prefetch(results)
+        
+        return results
+    
+    def iter_search_all_courts(self,
+                               keyword: str,
+                               court_type: str = "all",
+                               court_unit: str = "",
+                               case_year: str = "",
+                               decision_year: str = "",
+                               start_date: str = "",
+                               end_date: str = "",
+                               page_number: int = 1,
+                               page_size: int = 20,
+                               deadline: Optional[float] = None,
+                               no_cache: bool = False,
+                               prefetch: bool = True):
+        """search_all_courts'un akış (streaming) versiyonu.
+        
+        Her mahkemenin sonucu hazır olur olmaz {'type': 'court', 'court', 'data'}
+        olayı üretilir; en sonda toplamları içeren {'type': 'done', ...} gelir.
+        """
+        search_params = dict(
+            keyword=keyword,
+            court_type=court_type,
+            court_unit=court_unit,
+            case_year=case_year,
+            decision_year=decision_year,
+            start_date=start_date,
+            end_date=end_date,
+            page_number=page_number,
+            page_size=page_size
+        )
+        cache_key = SearchResultCache.make_key(**search_params)
+        
+        if not no_cache:
+            cached = self.search_cache.get(cache_key)
+            if cached is not None:
+                if prefetch:
+                    self.schedule_prefetch(cached)
+                for court in COURT_LABELS:
+                    yield {'type': 'court', 'court': court, 'data': cached[court]}
+                yield {
+                    'type': 'done',
+                    'total_count': cached['total_count'],
+                    'pagination': cached['pagination'],
+                    'timed_out_courts': [],
+                    'unavailable_courts': [],
+                    'from_cache': True
+                }
+                return
+        
+        complete = True
+        results = self._new_results(page_number, page_size)
+        court_searches = self._build_court_searches(**search_params)
+        futures = {self.loop_runner.submit(search()): court for court, search in court_searches.items()}
+        pending = set(futures)
+        
+        try:
+            try:
+                for future in concurrent.futures.as_completed(
+                        futures, timeout=deadline if deadline is not None else SEARCH_DEADLINE_SECONDS):
+                    pending.discard(future)
+                    court = futures[future]
+                    try:
+                        results[court] = future.result()
+                        logger.info(f"{COURT_LABELS[court]} araması tamamlandı: {len(results[court]['decisions'])} sonuç")
+                    except Exception as e:
+                        status = self._classify_error(e)
+                        logger.error(f"{COURT_LABELS[court]} arama hatası ({status}): {e}")
+                        results[court] = self._empty_response(page_number, page_size)
+                        if status == 'timeout':
+                            results[court]['timed_out'] = True
+                            results['timed_out_courts'].append(court)
+                        elif status == 'unavailable':
+                            results[court]['unavailable'] = True
+                            results['unavailable_courts'].append(court)
+                        complete = False
+                    yield {'type': 'court', 'court': court, 'data': results[court]}
+            except concurrent.futures.TimeoutError:
+                for future in list(pending):
+                    court = futures[future]
+                    future.cancel()
+                    pending.discard(future)
+                    logger.warning(f"{COURT_LABELS[court]} araması süre sınırını aştı")
+                    results[court] = self._empty_response(page_number, page_size)
+                    results[court]['timed_out'] = True
+                    results['timed_out_courts'].append(court)
+                    complete = False
+                    yield {'type': 'court', 'court': court, 'data': results[court]}
+        finally:
+            # İstemci bağlantıyı kapatırsa bekleyen aramaları iptal et
+            for future in pending:
+                future.cancel()
+        
+        self._apply_totals(results, page_size)
+        if complete:
+            self.search_cache.set(cache_key, results)
+        if prefetch:
+            self.schedule_prefetch(results)
+        
+        yield {
+            'type': 'done',
+            'total_count': results['total_count'],
+            'pagination': results['pagination'],
+            'timed_out_courts': results['timed_out_courts'],
+            'unavailable_courts': results['unavailable_courts'],
+            'from_cache': False
+        }
+    
+    def schedule_prefetch(self, results: Dict[str, Any]) -> int:
+        """Her mahkemenin ilk N kararını arka planda karar deposuna çekilmek üzere kuyruğa alır"""
+        if self.prefetch_top_n <= 0 or self.decision_store is None:
+            return 0
+        items = []
+        for court in COURT_LABELS:
+            for decision in (results.get(court) or {}).get('decisions', [])[:self.prefetch_top_n]:
+                # Önbellekten gelen sonuçlar düz dict, canlı sonuçlar YargiSearchResult
+                if isinstance(decision, dict):
+                    document_id, url = decision.get('id'), decision.get('document_url')
+                else:
+                    document_id, url = getattr(decision, 'id', None), getattr(decision, 'document_url', None)
+                if document_id:
+                    items.append((court, document_id, url))
+        return self.prefetcher.schedule(items)
+    
+    def _new_results(self, page_number: int, page_size: int) -> Dict[str, Any]:
+        """Boş arama sonucu iskeleti"""
+        return {
             'yargitay': {'count': 0, 'decisions': []},
             'danistay': {'count': 0, 'decisions': []},
             'emsal': {'count': 0, 'decisions': []},
@@ -214,6 +792,8 @@ class YargiFlaskIntegration:
             'kik': {'count': 0, 'decisions': []},
             'rekabet': {'count': 0, 'decisions': []},
             'total_count': 0,
+            'timed_out_courts': [],
+            'unavailable_courts': [],
             'pagination': {
                 'current_page': page_number,
                 'page_size': page_size,
@@ -221,334 +801,122 @@ class YargiFlaskIntegration:
                 'total_records': 0
             }
         }
-        
-        try:
-            # Asyncio event loop oluştur
-            try:
-                loop = asyncio.get_event_loop()
-                if loop.is_closed():
-                    loop = asyncio.new_event_loop()
-                    asyncio.set_event_loop(loop)
-            except RuntimeError:
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-            
-            # Yargıtay araması
-            if court_type in ["all", "yargitay"]:
-                try:
-                    yargitay_result = loop.run_until_complete(
-                        self._search_yargitay(
-                            keyword=keyword,
-                            court_unit=court_unit,
-                            case_year=case_year,
-                            decision_year=decision_year,
-                            start_date=start_date,
-                            end_date=end_date,
-                            page_number=page_number,
-                            page_size=page_size
-                        )
-                    )
-                    results['yargitay'] = yargitay_result
-                    logger.info(f"Yargıtay araması tamamlandı: {len(yargitay_result['decisions'])} sonuç")
-                except Exception as e:
-                    logger.error(f"Yargıtay arama hatası: {e}")
-                    results['yargitay'] = self._empty_response(page_number, page_size)
-            
-            # Danıştay araması
-            if court_type in ["all", "danistay"]:
-                try:
-                    danistay_result = loop.run_until_complete(
-                        self._search_danistay(
-                            keyword=keyword,
-                            court_unit=court_unit,
-                            case_year=case_year,
-                            decision_year=decision_year,
-                            start_date=start_date,
-                            end_date=end_date,
-                            page_number=page_number,
-                            page_size=page_size
-                        )
-                    )
-                    results['danistay'] = danistay_result
-                    logger.info(f"Danıştay araması tamamlandı: {len(danistay_result['decisions'])} sonuç")
-                except Exception as e:
-                    logger.error(f"Danıştay arama hatası: {e}")
-                    results['danistay'] = self._empty_response(page_number, page_size)
-            
-            # Emsal araması
-            if court_type in ["all", "emsal"]:
-                try:
-                    emsal_result = loop.run_until_complete(
-                        self._search_emsal(
-                            keyword=keyword,
-                            page_number=page_number,
-                            page_size=page_size
-                        )
-                    )
-                    results['emsal'] = emsal_result
-                    logger.info(f"Emsal araması tamamlandı: {len(emsal_result['decisions'])} sonuç")
-                except Exception as e:
-                    logger.error(f"Emsal arama hatası: {e}")
-                    results['emsal'] = self._empty_response(page_number, page_size)
-            
-            # Anayasa Mahkemesi araması
-            if court_type in ["all", "anayasa"]:
-                try:
-                    anayasa_result = loop.run_until_complete(
-                        self._search_anayasa(
-                            keyword=keyword,
-                            page_number=page_number,
-                            page_size=page_size
-                        )
-                    )
-                    results['anayasa'] = anayasa_result
-                    logger.info(f"Anayasa Mahkemesi araması tamamlandı: {len(anayasa_result['decisions'])} sonuç")
-                except Exception as e:
-                    logger.error(f"Anayasa Mahkemesi arama hatası: {e}")
-                    results['anayasa'] = self._empty_response(page_number, page_size)
-            
-            # Uyuşmazlık Mahkemesi araması
-            if court_type in ["all", "uyusmazlik"]:
-                try:
-                    uyusmazlik_result = loop.run_until_complete(
-                        self._search_uyusmazlik(
-                            keyword=keyword,
-                            page_number=page_number,
-                            page_size=page_size
-                        )
-                    )
-                    results['uyusmazlik'] = uyusmazlik_result
-                    logger.info(f"Uyuşmazlık Mahkemesi araması tamamlandı: {len(uyusmazlik_result['decisions'])} sonuç")
-                except Exception as e:
-                    logger.error(f"Uyuşmazlık Mahkemesi arama hatası: {e}")
-                    results['uyusmazlik'] = self._empty_response(page_number, page_size)
-            
-            # KİK araması
-            if court_type in ["all", "kik"]:
-                try:
-                    kik_result = loop.run_until_complete(
-                        self._search_kik(
-                            keyword=keyword,
-                            page_number=page_number,
-                            page_size=page_size
-                        )
-                    )
-                    results['kik'] = kik_result
-                    logger.info(f"KİK araması tamamlandı: {len(kik_result['decisions'])} sonuç")
-                except Exception as e:
-                    logger.error(f"KİK arama hatası: {e}")
-                    results['kik'] = self._empty_response(page_number, page_size)
-            
-            # Rekabet Kurumu araması
-            if court_type in ["all", "rekabet"]:
-                try:
-                    rekabet_result = loop.run_until_complete(
-                        self._search_rekabet(
-                            keyword=keyword,
-                            page_number=page_number,
-                            page_size=page_size
-                        )
-                    )
-                    results['rekabet'] = rekabet_result
-                    logger.info(f"Rekabet Kurumu araması tamamlandı: {len(rekabet_result['decisions'])} sonuç")
-                except Exception as e:
-                    logger.error(f"Rekabet Kurumu arama hatası: {e}")
-                    results['rekabet'] = self._empty_response(page_number, page_size)
-                
-        except Exception as e:
-            logger.error(f"Genel arama hatası: {e}")
-            # Hata durumunda boş sonuç döndür
-            for ct in (["all"] if court_type == "all" else [court_type]):
-                results[ct] = self._empty_response(page_number, page_size)
-        
-        # Toplam sonuç sayısını hesapla
-        total_count = sum([
-            results['yargitay']['count'],
-            results['danistay']['count'],
-            results['emsal']['count'],
-            results['anayasa']['count'],
-            results['uyusmazlik']['count'],
-            results['kik']['count'],
-            results['rekabet']['count']
-        ])
-        
+    
+    def _apply_totals(self, results: Dict[str, Any], page_size: int):
+        """Toplam sonuç sayısını ve sayfalama bilgilerini hesaplar"""
+        total_count = sum(results[court]['count'] for court in COURT_LABELS)
         results['total_count'] = total_count
         
         # Sayfalama bilgilerini güncelle
         results['pagination']['total_records'] = total_count
         if total_count > 0:
             results['pagination']['total_pages'] = max(1, (total_count + page_size - 1) // page_size)
+    
+    def _build_court_searches(self,
+                              keyword: str,
+                              court_type: str = "all",
+                              court_unit: str = "",
+                              case_year: str = "",
+                              decision_year: str = "",
+                              start_date: str = "",
+                              end_date: str = "",
+                              page_number: int = 1,
+                              page_size: int = 20) -> Dict[str, Any]:
+        """Seçilen mahkemeler için arama coroutine fabrikalarını hazırlar (court -> callable)"""
+        detailed_params = dict(
+            keyword=keyword,
+            court_unit=court_unit,
+            case_year=case_year,
+            decision_year=decision_year,
+            start_date=start_date,
+            end_date=end_date,
+            page_number=page_number,
+            page_size=page_size
+        )
+        simple_params = dict(keyword=keyword, page_number=page_number, page_size=page_size)
+        
+        search_methods = {
+            'yargitay': (self._search_yargitay, detailed_params),
+            'danistay': (self._search_danistay, detailed_params),
+            'emsal': (self._search_emsal, simple_params),
+            'anayasa': (self._search_anayasa, simple_params),
+            'uyusmazlik': (self._search_uyusmazlik, simple_params),
+            'kik': (self._search_kik, simple_params),
+            'rekabet': (self._search_rekabet, simple_params),
+        }
         
-        return results
+        return {
+            court: functools.partial(self._guarded_search, court, method, params)
+            for court, (method, params) in search_methods.items()
+            if court_type in ["all", court]
+        }
+    
+    async def _guarded_search(self, court: str, method, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Mahkeme aramasını devre kesici ve uyarlanabilir zaman aşımı ile çalıştırır"""
+        breaker = self.circuit_breakers[court]
+        if not breaker.allow():
+            raise CircuitOpenError(f"{COURT_LABELS[court]} geçici olarak devre dışı")
+        
+        started = time.monotonic()
+        try:
+            result = await asyncio.wait_for(method(**params), timeout=breaker.current_timeout())
+        except (Exception, asyncio.CancelledError):
+            # Ortak süre sınırı nedeniyle iptal de yavaşlık olarak sayılır
+            breaker.record_failure(time.monotonic() - started)
+            raise
+        if result.get('error'):
+            # Mahkeme metodu hatayı kendi içinde yakalayıp boş yanıt döndürdü: hızlı hata da
+            # devre kesicide hata sayılır, başarılı gecikmeler (p95) arasına karışmaz
+            breaker.record_failure(time.monotonic() - started)
+            raise CourtSearchError(result['error'])
+        breaker.record_success(time.monotonic() - started)
+        return result
+    
+    @staticmethod
+    def _classify_error(error: BaseException) -> str:
+        """Arama hatasını 'timeout', 'unavailable' veya 'error' olarak sınıflandırır"""
+        if isinstance(error, CircuitOpenError):
+            return 'unavailable'
+        if isinstance(error, (asyncio.TimeoutError, concurrent.futures.TimeoutError)):
+            return 'timeout'
+        return 'error'
+    
+    async def _run_court_searches_concurrently(self,
+                                               court_searches: Dict[str, Any],
+                                               deadline: float) -> Dict[str, Any]:
+        """Mahkeme aramalarını ortak süre sınırı altında paralel çalıştırır.
+        
+        Dönüş: court -> (durum, değer); durum 'ok', 'error', 'timeout' veya 'unavailable'
+        """
+        if not court_searches:
+            return {}
+        
+        tasks = {asyncio.ensure_future(search()): court for court, search in court_searches.items()}
+        done, pending = await asyncio.wait(tasks.keys(), timeout=deadline)
+        
+        # Süresi dolan aramaları iptal et, iptalin tamamlanmasını bekle
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+        
+        outcomes = {}
+        for task, court in tasks.items():
+            if task in pending or task.cancelled():
+                outcomes[court] = ('timeout', None)
+            elif task.exception() is not None:
+                outcomes[court] = (self._classify_error(task.exception()), task.exception())
+            else:
+                outcomes[court] = ('ok', task.result())
+        return outcomes
     
     def _clean_decision_text(self, text: str) -> str:
         """Karar metnini temizle ve düzenle - geliştirilmiş versiyon"""
-        if not text:
-            return ""
-        
-        import re
-        
-        # HTML entity'leri decode et
-        text = html.unescape(text)
-        
-        # Gereksiz HTML taglerini temizle (eğer varsa)
-        text = re.sub(r'<[^>]+>', '', text)
-        
-        # Fazla boşlukları temizle
-        text = re.sub(r'\s+', ' ', text)
-        
-        # Çoklu satır sonlarını normalize et
-        text = re.sub(r'\n\s*\n\s*\n+', '\n\n', text)
-        
-        # Satırları işle
-        lines = text.split('\n')
-        cleaned_lines = []
-        
-        # Gereksiz satırları filtrele
-        skip_patterns = [
-            r'^(ana sayfa|menü|giriş|çıkış|login|logout).*$',
-            r'^(copyright|©|tüm hakları).*$',
-            r'^(javascript|cookie|çerez).*$',
-            r'^(sayfa|page)\s*\d+.*$',
-            r'^(http|www\.|ftp).*$',
-            r'^\s*[\d\.\-\s]+$',  # Sadece sayı ve nokta içeren satırlar
-            r'^.{1,10}$',  # Çok kısa satırlar (10 karakter altı)
-            r'^(.*menü.*|.*navigation.*|.*footer.*|.*header.*)$',
-            r'^(.*bilgi bankası.*|.*uyap.*|.*yargıtay.*|.*danıştay.*)(?!.*karar).*$'  # Site adları ama karar içermeyen
-        ]
-        
-        for line in lines:
-            line = line.strip()
-            
-            # Boş satırları atla
-            if not line:
-                continue
-                
-            # Skip pattern'leri kontrol et
-            should_skip = False
-            for pattern in skip_patterns:
-                if re.match(pattern, line, re.IGNORECASE):
-                    should_skip = True
-                    break
-            
-            if not should_skip:
-                # Karar metni için pozitif göstergeler
-                positive_indicators = [
-                    'karar', 'hüküm', 'gerekçe', 'mahkeme', 'dava', 'esas', 'sonuç', 
-                    'davacı', 'davalı', 'başvuran', 'müdahil', 'temyiz', 'istinaf',
-                    'dosya', 'duruşma', 'delil', 'tanık', 'bilirkişi', 'keşif',
-                    'hukuki', 'kanun', 'madde', 'fıkra', 'bent', 'yönetmelik',
-                    'tebliğ', 'icra', 'infaz', 'takip', 'haciz', 'satış'
-                ]
-                
-                # Eğer satır yeterince uzunsa veya pozitif gösterge içeriyorsa ekle
-                if len(line) > 15 or any(indicator in line.lower() for indicator in positive_indicators):
-                    cleaned_lines.append(line)
-        
-        # Temizlenmiş satırları birleştir
-        text = '\n'.join(cleaned_lines)
-        
-        # Tekrarlayan cümleleri temizle
-        sentences = text.split('.')
-        unique_sentences = []
-        seen_sentences = set()
-        
-        for sentence in sentences:
-            sentence = sentence.strip()
-            if len(sentence) > 20:  # Çok kısa cümleleri atla
-                sentence_normalized = re.sub(r'\s+', ' ', sentence.lower())
-                if sentence_normalized not in seen_sentences:
-                    seen_sentences.add(sentence_normalized)
-                    unique_sentences.append(sentence)
-        
-        text = '. '.join(unique_sentences)
-        
-        # Özel karakterleri normalize et
-        text = re.sub(r'[""''‚„]', '"', text)  # Tırnak işaretlerini normalize et
-        text = re.sub(r'[–—]', '-', text)  # Tire işaretlerini normalize et
-        
-        # Son temizlik
-        text = re.sub(r'\s+', ' ', text).strip()
-        
-        # Eğer metin çok kısaysa ve sadece navigasyon içeriyorsa boş döndür
-        if len(text) < 100:
-            navigation_words = ['menü', 'sayfa', 'giriş', 'çıkış', 'ana sayfa', 'javascript', 'cookie']
-            if any(word in text.lower() for word in navigation_words):
-                return ""
-        
-        return text
+        return clean_decision_text(text)
     
     def _clean_decision_text_light(self, text: str) -> str:
         """Karar metnini hafif temizle - daha az agresif filtreleme"""
-        if not text:
-            return ""
-        
-        import re
-        
-        # Orijinal metin uzunluğunu kaydet
-        original_length = len(text)
-        
-        # HTML entity'leri decode et
-        text = html.unescape(text)
-        
-        # Gereksiz HTML taglerini temizle (eğer varsa)
-        text = re.sub(r'<[^>]+>', '', text)
-        
-        # Fazla boşlukları temizle
-        text = re.sub(r'\s+', ' ', text)
-        
-        # Çoklu satır sonlarını normalize et
-        text = re.sub(r'\n\s*\n\s*\n+', '\n\n', text)
-        
-        # Eğer metin çok uzun ise (5000+ karakter) filtreleme yap, yoksa minimal işlem
-        if original_length > 5000:
-            # Satırları işle - sadece çok kısa satırları filtrele
-            lines = text.split('\n')
-            cleaned_lines = []
-            
-            # Sadece çok gereksiz satırları filtrele
-            skip_patterns = [
-                r'^(javascript|cookie|çerez).*$',
-                r'^(http|www\.|ftp).*$',
-                r'^\s*[\d\.\-\s]{1,5}$',  # Sadece çok kısa sayı dizileri
-                r'^.{1,3}$'  # Çok kısa satırlar (3 karakter altı)
-            ]
-            
-            for line in lines:
-                line = line.strip()
-                
-                # Boş satırları atla
-                if not line:
-                    continue
-                    
-                # Sadece gerçekten gereksiz olan satırları skip et
-                should_skip = False
-                for pattern in skip_patterns:
-                    if re.match(pattern, line, re.IGNORECASE):
-                        should_skip = True
-                        break
-                
-                if not should_skip:
-                    cleaned_lines.append(line)
-            
-            # Temizlenmiş satırları birleştir
-            text = '\n'.join(cleaned_lines)
-        
-        # Özel karakterleri normalize et
-        text = re.sub(r'[""''‚„]', '"', text)  # Tırnak işaretlerini normalize et
-        text = re.sub(r'[–—]', '-', text)  # Tire işaretlerini normalize et
-        
-        # Son temizlik
-        text = re.sub(r'\s+', ' ', text).strip()
-        
-        # Eğer temizleme sonucu metin çok kısaldıysa ve orijinal uzunsa, daha az agresif temizle
-        if len(text) < 100 and original_length > 1000:
-            # Minimal temizlik yap
-            text = html.unescape(text) if text else ""
-            text = re.sub(r'<[^>]+>', '', text)
-            text = re.sub(r'\s+', ' ', text).strip()
-        
-        return text
+        return clean_decision_text_light(text)
     
     def _empty_response(self, page_number: int, page_size: int) -> Dict[str, Any]:
         """Boş yanıt döndürür"""
@@ -560,6 +928,13 @@ class YargiFlaskIntegration:
             'total_pages': 0
         }
     
+    def _failed_response(self, page_number: int, page_size: int, error: str) -> Dict[str, Any]:
+        """Başarısız arama yanıtı: boş sonuç + 'error'; _guarded_search bunu hataya çevirir,
+        böylece devre kesici hatayı sayar ve eksik sonuç önbelleğe yazılmaz"""
+        response = self._empty_response(page_number, page_size)
+        response['error'] = error or 'Bilinmeyen hata'
+        return response
+    
     async def _search_yargitay(self,
                               keyword: str,
                               court_unit: str = "",
@@ -656,7 +1031,7 @@ class YargiFlaskIntegration:
             for url in search_urls:
                 try:
                     logger.info(f"Yargıtay URL test edilyor: {url}")
-                    response = requests.get(url, headers=headers, timeout=10, allow_redirects=True)
+                    response = await run_blocking(requests.get, url, headers=headers, timeout=10, allow_redirects=True)
                     
                     if response.status_code == 200:
                         soup = BeautifulSoup(response.content, 'html.parser', from_encoding='utf-8')
@@ -821,7 +1196,7 @@ class YargiFlaskIntegration:
                 
         except Exception as e:
             logger.error(f"Yargıtay web scraping hatası: {e}")
-            return self._empty_response(page_number, page_size)
+            return self._failed_response(page_number, page_size, str(e))
     
     async def _search_danistay(self,
                               keyword: str,
@@ -915,7 +1290,7 @@ class YargiFlaskIntegration:
                 
                 for url in quick_urls:
                     try:
-                        response = requests.get(url, headers=headers, timeout=10, allow_redirects=True)
+                        response = await run_blocking(requests.get, url, headers=headers, timeout=10, allow_redirects=True)
                         
                         if response.status_code == 200:
                             soup = BeautifulSoup(response.content, 'html.parser')
@@ -983,7 +1358,7 @@ class YargiFlaskIntegration:
             except Exception as scraping_error:
                 logger.warning(f"Danıştay web scraping hatası: {scraping_error}")
             
-            return self._empty_response(page_number, page_size)
+            return self._failed_response(page_number, page_size, str(e))
     
     async def _search_emsal(self,
                            keyword: str,
@@ -1071,7 +1446,7 @@ class YargiFlaskIntegration:
             for url in search_urls:
                 try:
                     logger.info(f"Emsal UYAP URL test edilyor: {url}")
-                    response = requests.get(url, headers=headers, timeout=10, allow_redirects=True)
+                    response = await run_blocking(requests.get, url, headers=headers, timeout=10, allow_redirects=True)
                     
                     if response.status_code == 200:
                         soup = BeautifulSoup(response.content, 'html.parser', from_encoding='utf-8')
@@ -1236,7 +1611,7 @@ class YargiFlaskIntegration:
                 
         except Exception as e:
             logger.error(f"Emsal web scraping hatası: {e}")
-            return self._empty_response(page_number, page_size)
+            return self._failed_response(page_number, page_size, str(e))
     
     async def _search_anayasa(self,
                              keyword: str,
@@ -1304,9 +1679,8 @@ class YargiFlaskIntegration:
                         results_per_page=page_size
                     )
                     
-                    # Unified modüldeki client'ı kullan
-                    bireysel_client = AnayasaMahkemesiApiClient()
-                    api_response = await bireysel_client.search_norm_denetimi_decisions(bireysel_request)
+                    # Kalıcı Anayasa client'ını kullan
+                    api_response = await self.anayasa_client.search_norm_denetimi_decisions(bireysel_request)
                     
                     flask_results = []
                     if api_response.data and api_response.data.data:
@@ -1363,7 +1737,7 @@ class YargiFlaskIntegration:
                 for url in quick_urls:
                     try:
                         logger.info(f"Anayasa Mahkemesi hızlı URL: {url}")
-                        response = requests.get(url, headers=headers, timeout=10, allow_redirects=True)
+                        response = await run_blocking(requests.get, url, headers=headers, timeout=10, allow_redirects=True)
                         
                         if response.status_code == 200:
                             soup = BeautifulSoup(response.content, 'html.parser')
@@ -1416,11 +1790,11 @@ class YargiFlaskIntegration:
                 
                 # Hiçbir yöntem çalışmadı
                 logger.warning("Anayasa Mahkemesi: Tüm yöntemler başarısız")
-                return self._empty_response(page_number, page_size)
+                return self._failed_response(page_number, page_size, "Tüm yöntemler başarısız")
             
         except Exception as e:
             logger.error(f"Anayasa Mahkemesi arama hatası: {e}")
-            return self._empty_response(page_number, page_size)
+            return self._failed_response(page_number, page_size, str(e))
     
     async def _search_uyusmazlik(self,
                                 keyword: str,
@@ -1511,7 +1885,7 @@ class YargiFlaskIntegration:
                 
                 for url in quick_urls:
                     try:
-                        response = requests.get(url, headers=headers, timeout=10, allow_redirects=True)
+                        response = await run_blocking(requests.get, url, headers=headers, timeout=10, allow_redirects=True)
                         
                         if response.status_code == 200:
                             soup = BeautifulSoup(response.content, 'html.parser')
@@ -1566,7 +1940,7 @@ class YargiFlaskIntegration:
             except Exception as scraping_error:
                 logger.warning(f"Uyuşmazlık Mahkemesi web scraping hatası: {scraping_error}")
             
-            return self._empty_response(page_number, page_size)
+            return self._failed_response(page_number, page_size, str(e))
     
     async def _search_kik(self,
                          keyword: str,
@@ -1650,7 +2024,7 @@ class YargiFlaskIntegration:
                 
                 for url in quick_urls:
                     try:
-                        response = requests.get(url, headers=headers, timeout=10, allow_redirects=True)
+                        response = await run_blocking(requests.get, url, headers=headers, timeout=10, allow_redirects=True)
                         
                         if response.status_code == 200:
                             soup = BeautifulSoup(response.content, 'html.parser')
@@ -1706,7 +2080,7 @@ class YargiFlaskIntegration:
             except Exception as scraping_error:
                 logger.warning(f"KİK web scraping hatası: {scraping_error}")
             
-            return self._empty_response(page_number, page_size)
+            return self._failed_response(page_number, page_size, str(e))
     
     async def _search_rekabet(self,
                              keyword: str,
@@ -1787,7 +2161,7 @@ class YargiFlaskIntegration:
                 
                 for url in quick_urls:
                     try:
-                        response = requests.get(url, headers=headers, timeout=10, allow_redirects=True)
+                        response = await run_blocking(requests.get, url, headers=headers, timeout=10, allow_redirects=True)
                         
                         if response.status_code == 200:
                             soup = BeautifulSoup(response.content, 'html.parser')
@@ -1843,7 +2217,7 @@ class YargiFlaskIntegration:
             except Exception as scraping_error:
                 logger.warning(f"Rekabet Kurumu web scraping hatası: {scraping_error}")
             
-            return self._empty_response(page_number, page_size)
+            return self._failed_response(page_number, page_size, str(e))
     
     def get_court_options(self) -> Dict[str, List[Dict[str, str]]]:
         """Mahkeme seçeneklerini döndürür"""
@@ -3250,300 +3624,366 @@ def search_yargi_kararlari(keyword: str,
                           start_date: str = "",
                           end_date: str = "",
                           page_number: int = 1,
-                          page_size: int = 20) -> Dict[str, Any]:
+                          page_size: int = 20,
+                          concurrent: bool = True,
+                          deadline: Optional[float] = None,
+                          no_cache: bool = False) -> Dict[str, Any]:
     """Flask için yargi kararları arama fonksiyonu"""
-    return yargi_integration.search_all_courts(
-        keyword=keyword,
-        court_type=court_type,
-        court_unit=court_unit,
-        case_year=case_year,
-        decision_year=decision_year,
-        start_date=start_date,
-        end_date=end_date,
-        page_number=page_number,
-        page_size=page_size
-    )
+    with yargi_integration.prefetcher.live_request():
+        return yargi_integration.search_all_courts(
+            keyword=keyword,
+            court_type=court_type,
+            court_unit=court_unit,
+            case_year=case_year,
+            decision_year=decision_year,
+            start_date=start_date,
+            end_date=end_date,
+            page_number=page_number,
+            page_size=page_size,
+            concurrent=concurrent,
+            deadline=deadline,
+            no_cache=no_cache
+        )
+
+def stream_yargi_kararlari(keyword: str,
+                           court_type: str = "all",
+                           court_unit: str = "",
+                           case_year: str = "",
+                           decision_year: str = "",
+                           start_date: str = "",
+                           end_date: str = "",
+                           page_number: int = 1,
+                           page_size: int = 20,
+                           no_cache: bool = False):
+    """Flask için akış (NDJSON) arama: her mahkeme bitince bir olay üretir"""
+    with yargi_integration.prefetcher.live_request():
+        yield from yargi_integration.iter_search_all_courts(
+            keyword=keyword,
+            court_type=court_type,
+            court_unit=court_unit,
+            case_year=case_year,
+            decision_year=decision_year,
+            start_date=start_date,
+            end_date=end_date,
+            page_number=page_number,
+            page_size=page_size,
+            no_cache=no_cache
+        )
+
+def search_yargi_kararlari_offline(keyword: str,
+                                  court_type: str = "all",
+                                  page_number: int = 1,
+                                  page_size: int = 20) -> Dict[str, Any]:
+    """Daha önce açılmış kararlar üzerinde yerel tam metin araması (mahkemelere gitmez).
+    Yanıt, search_yargi_kararlari ile aynı biçimdedir."""
+    results = {court: {'count': 0, 'decisions': []} for court in COURT_LABELS}
+    results.update({
+        'total_count': 0,
+        'offline': True,
+        'pagination': {
+            'current_page': page_number,
+            'page_size': page_size,
+            'total_pages': 1,
+            'total_records': 0
+        }
+    })
+    
+    index = yargi_integration.decision_index
+    if index is None:
+        return results
+    
+    found = index.search(keyword, court_type=court_type, page_number=page_number, page_size=page_size)
+    for hit in found['results']:
+        court = hit['court_type']
+        if court not in results:
+            continue
+        results[court]['decisions'].append(YargiSearchResult(
+            id=hit['document_id'],
+            title=hit['title'],
+            court=COURT_LABELS[court],
+            decision_date="",
+            case_number="",
+            decision_number="",
+            summary=hit['snippet'],
+            document_url=hit['source_url']
+        ))
+        results[court]['count'] += 1
+    
+    total = found['total']
+    results['total_count'] = total
+    results['pagination']['total_records'] = total
+    if total > 0:
+        results['pagination']['total_pages'] = max(1, (total + page_size - 1) // page_size)
+    return results
+
+def get_search_cache_stats() -> Dict[str, Any]:
+    """Arama önbelleği ve karar deposu hit/miss istatistiklerini döndürür"""
+    stats = yargi_integration.search_cache.stats()
+    store = yargi_integration.decision_store
+    stats['decision_store'] = store.stats() if store is not None else None
+    index = yargi_integration.decision_index
+    stats['decision_index_size'] = index.size() if index is not None else None
+    stats['circuit_breakers'] = {
+        court: breaker.snapshot() for court, breaker in yargi_integration.circuit_breakers.items()
+    }
+    stats['prefetch'] = yargi_integration.prefetcher.stats()
+    return stats
 
 def get_court_options() -> Dict[str, List[Dict[str, str]]]:
     """Flask için mahkeme seçenekleri fonksiyonu"""
     return yargi_integration.get_court_options()
 
 def get_document_content(court_type: str, document_id: str, document_url: str = None) -> Dict[str, Any]:
+    """Belirli bir kararın tam içeriğini getir - önce yerel karar deposuna bakar,
+    yoksa mahkemeden çekip depoya yazar (karar metinleri yayımlandıktan sonra değişmez)"""
+    store = yargi_integration.decision_store
+    if store is not None and document_id:
+        # Karar arka planda ön getiriliyorsa ikinci kez çekmek yerine onu bekle
+        yargi_integration.prefetcher.wait_inflight(court_type, document_id, PREFETCH_WAIT_SECONDS)
+        record = store.get(court_type, document_id)
+        if record is not None:
+            logger.info(f"Karar metni yerel depodan döndü: {court_type}/{document_id}")
+            return {
+                'success': True,
+                'content': record['content'],
+                'content_type': 'text',
+                'source_url': record.get('source_url', ''),
+                'court_type': court_type,
+                'extraction_method': record.get('extraction_method', ''),
+                'from_store': True
+            }
+    
+    with yargi_integration.prefetcher.live_request():
+        result = _fetch_document_content(court_type, document_id, document_url)
+    
+    _store_document_content(court_type, document_id, result)
+    return result
+
+def prefetch_document_content(court_type: str, document_id: str, document_url: str = None) -> bool:
+    """Kararı mahkemeden çekip karar deposuna yazar (arka plan ön getirme için)"""
+    result = _fetch_document_content(court_type, document_id, document_url)
+    return _store_document_content(court_type, document_id, result)
+
+def _store_document_content(court_type: str, document_id: str, result: Dict[str, Any]) -> bool:
+    """Başarılı karar metnini depoya ve çevrimdışı indekse ekler"""
+    store = yargi_integration.decision_store
+    if store is None or not document_id or not store.put(court_type, document_id, result):
+        return False
+    index = yargi_integration.decision_index
+    if index is not None:
+        index.add(court_type, document_id, result['content'], result.get('source_url', ''))
+    return True
+
+def _fetch_document_content(court_type: str, document_id: str, document_url: str = None) -> Dict[str, Any]:
     """Belirli bir kararın tam içeriğini getir - MCP client'larının doğru fonksiyonlarını kullanarak"""
     try:
         # Global attribute'lar için başlangıç değerleri
         if not hasattr(get_document_content, '_last_danistay_keyword'):
             get_document_content._last_danistay_keyword = ''
             
-        # Event loop oluştur
-        try:
-            loop = asyncio.get_event_loop()
-            if loop.is_closed():
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-        except RuntimeError:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-        
         logger.info(f"Doküman içeriği istendi: court_type={court_type}, document_id={document_id}")
         
         if court_type == "yargitay":
-            # Yargıtay için unified modülden client oluştur (event loop sorunu nedeniyle)
-            client = YargitayOfficialApiClient()
+            # Yargıtay için kalıcı client'ı kullan (arka plan event loop'una bağlı)
+            client = yargi_integration.yargitay_client
+            result = yargi_integration.run_async(
+                client.get_decision_document_as_markdown(document_id)
+            )
             
-            try:
-                result = loop.run_until_complete(
-                    client.get_decision_document_as_markdown(document_id)
+            if result and result.markdown_content:
+                logger.info(f"Yargıtay markdown içeriği başarıyla alındı: {len(result.markdown_content)} karakter")
+                return {
+                    'success': True,
+                    'content': result.markdown_content,
+                    'content_type': 'text',
+                    'source_url': str(result.source_url) if result.source_url else '',
+                    'court_type': 'yargitay',
+                    'extraction_method': 'MCP Client API'
+                }
+            else:
+                logger.warning("Yargıtay markdown içeriği boş")
+                # Fallback olarak web scraping dene
+                return yargi_integration.run_async(
+                    yargi_integration._get_yargitay_document_content(document_id)
                 )
                 
-                if result and result.markdown_content:
-                    logger.info(f"Yargıtay markdown içeriği başarıyla alındı: {len(result.markdown_content)} karakter")
-                    return {
-                        'success': True,
-                        'content': result.markdown_content,
-                        'content_type': 'text',
-                        'source_url': str(result.source_url) if result.source_url else '',
-                        'court_type': 'yargitay',
-                        'extraction_method': 'MCP Client API'
-                    }
-                else:
-                    logger.warning("Yargıtay markdown içeriği boş")
-                    # Fallback olarak web scraping dene
-                    return loop.run_until_complete(
-                        yargi_integration._get_yargitay_document_content(document_id)
-                    )
-            finally:
-                # Client'ı kapat
-                try:
-                    loop.run_until_complete(client.close_client_session())
-                except:
-                    pass
-                
         elif court_type == "danistay":
-            # Danıştay için unified modülden client oluştur
-            client = DanistayApiClient()
+            # Danıştay için kalıcı client'ı kullan
+            client = yargi_integration.danistay_client
+            # Danıştay için aranan kelimeyi de gönder
+            # Global değişkenden veya session'dan al
+            aranan_kelime = getattr(get_document_content, '_last_danistay_keyword', '')
+            result = yargi_integration.run_async(
+                client.get_decision_document_as_markdown(document_id, aranan_kelime)
+            )
             
-            try:
-                # Danıştay için aranan kelimeyi de gönder
-                # Global değişkenden veya session'dan al
-                aranan_kelime = getattr(get_document_content, '_last_danistay_keyword', '')
-                result = loop.run_until_complete(
-                    client.get_decision_document_as_markdown(document_id, aranan_kelime)
+            if result and result.markdown_content:
+                logger.info(f"Danıştay markdown içeriği başarıyla alındı: {len(result.markdown_content)} karakter")
+                return {
+                    'success': True,
+                    'content': result.markdown_content,
+                    'content_type': 'text',
+                    'source_url': str(result.source_url) if result.source_url else '',
+                    'court_type': 'danistay',
+                    'extraction_method': 'MCP Client API'
+                }
+            else:
+                logger.warning("Danıştay markdown içeriği boş")
+                # Fallback olarak web scraping dene
+                return yargi_integration.run_async(
+                    yargi_integration._get_danistay_document_content(document_id)
                 )
                 
-                if result and result.markdown_content:
-                    logger.info(f"Danıştay markdown içeriği başarıyla alındı: {len(result.markdown_content)} karakter")
-                    return {
-                        'success': True,
-                        'content': result.markdown_content,
-                        'content_type': 'text',
-                        'source_url': str(result.source_url) if result.source_url else '',
-                        'court_type': 'danistay',
-                        'extraction_method': 'MCP Client API'
-                    }
-                else:
-                    logger.warning("Danıştay markdown içeriği boş")
-                    # Fallback olarak web scraping dene
-                    return loop.run_until_complete(
-                        yargi_integration._get_danistay_document_content(document_id)
-                    )
-            finally:
-                # Client'ı kapat
-                try:
-                    loop.run_until_complete(client.close_client_session())
-                except:
-                    pass
-                
         elif court_type == "emsal":
-            # Emsal için unified modülden client oluştur
-            client = EmsalApiClient()
+            # Emsal için kalıcı client'ı kullan
+            client = yargi_integration.emsal_client
+            result = yargi_integration.run_async(
+                client.get_decision_document_as_markdown(document_id)
+            )
             
-            try:
-                result = loop.run_until_complete(
+            if result and result.markdown_content:
+                logger.info(f"Emsal markdown içeriği başarıyla alındı: {len(result.markdown_content)} karakter")
+                return {
+                    'success': True,
+                    'content': result.markdown_content,
+                    'content_type': 'text',
+                    'source_url': str(result.source_url) if result.source_url else '',
+                    'court_type': 'emsal',
+                    'extraction_method': 'MCP Client API'
+                }
+            else:
+                logger.warning("Emsal markdown içeriği boş")
+                # Fallback olarak web scraping dene
+                return yargi_integration.run_async(
+                    yargi_integration._get_emsal_document_content(document_id)
+                )
+                
+        elif court_type == "anayasa":
+            # Anayasa Mahkemesi için kalıcı client'ı kullan
+            client = yargi_integration.anayasa_client
+            # document_url'den path çıkar
+            document_path = document_url
+            if document_url and document_url.startswith('http'):
+                # URL'den path kısmını çıkar
+                from urllib.parse import urlparse
+                parsed = urlparse(document_url)
+                document_path = parsed.path
+            
+            # Anayasa için basit get_decision_document_as_markdown kullan
+            if hasattr(client, 'get_decision_document_as_markdown'):
+                result = yargi_integration.run_async(
                     client.get_decision_document_as_markdown(document_id)
                 )
                 
                 if result and result.markdown_content:
-                    logger.info(f"Emsal markdown içeriği başarıyla alındı: {len(result.markdown_content)} karakter")
+                    logger.info(f"Anayasa Mahkemesi markdown içeriği başarıyla alındı: {len(result.markdown_content)} karakter")
                     return {
                         'success': True,
                         'content': result.markdown_content,
                         'content_type': 'text',
                         'source_url': str(result.source_url) if result.source_url else '',
-                        'court_type': 'emsal',
+                        'court_type': 'anayasa',
                         'extraction_method': 'MCP Client API'
                     }
                 else:
-                    logger.warning("Emsal markdown içeriği boş")
-                    # Fallback olarak web scraping dene
-                    return loop.run_until_complete(
-                        yargi_integration._get_emsal_document_content(document_id)
-                    )
-            finally:
-                # Client'ı kapat
-                try:
-                    loop.run_until_complete(client.close_client_session())
-                except:
-                    pass
-                
-        elif court_type == "anayasa":
-            # Anayasa Mahkemesi için unified modülden client oluştur
-            client = AnayasaMahkemesiApiClient()
+                    logger.warning("Anayasa Mahkemesi markdown içeriği boş")
+            else:
+                logger.warning("Anayasa MCP Client'ında get_decision_document_as_markdown metodu bulunamadı")
             
-            try:
-                # document_url'den path çıkar
-                document_path = document_url
-                if document_url and document_url.startswith('http'):
-                    # URL'den path kısmını çıkar
-                    from urllib.parse import urlparse
-                    parsed = urlparse(document_url)
-                    document_path = parsed.path
-                
-                # Anayasa için basit get_decision_document_as_markdown kullan
-                if hasattr(client, 'get_decision_document_as_markdown'):
-                    result = loop.run_until_complete(
-                        client.get_decision_document_as_markdown(document_id)
-                    )
-                    
-                    if result and result.markdown_content:
-                        logger.info(f"Anayasa Mahkemesi markdown içeriği başarıyla alındı: {len(result.markdown_content)} karakter")
-                        return {
-                            'success': True,
-                            'content': result.markdown_content,
-                            'content_type': 'text',
-                            'source_url': str(result.source_url) if result.source_url else '',
-                            'court_type': 'anayasa',
-                            'extraction_method': 'MCP Client API'
-                        }
-                    else:
-                        logger.warning("Anayasa Mahkemesi markdown içeriği boş")
-                else:
-                    logger.warning("Anayasa MCP Client'ında get_decision_document_as_markdown metodu bulunamadı")
-                
-                # Fallback olarak web scraping dene
-                return loop.run_until_complete(
-                    yargi_integration._get_anayasa_document_content(document_id)
-                )
-            finally:
-                # Client'ı kapat
-                try:
-                    loop.run_until_complete(client.close_client_session())
-                except:
-                    pass
+            # Fallback olarak web scraping dene
+            return yargi_integration.run_async(
+                yargi_integration._get_anayasa_document_content(document_id)
+            )
                 
         elif court_type == "uyusmazlik":
-            # Uyuşmazlık Mahkemesi için unified modülden client oluştur
-            client = UyusmazlikApiClient()
+            # Uyuşmazlık Mahkemesi için kalıcı client'ı kullan
+            client = yargi_integration.uyusmazlik_client
+            if not document_url:
+                # URL yoksa fallback
+                return yargi_integration.run_async(
+                    yargi_integration._get_uyusmazlik_document_content(document_id)
+                )
             
-            try:
-                if not document_url:
-                    # URL yoksa fallback
-                    return loop.run_until_complete(
-                        yargi_integration._get_uyusmazlik_document_content(document_id)
-                    )
+            # Yeni get_decision_document_as_markdown metodunu kullan
+            result = yargi_integration.run_async(
+                client.get_decision_document_as_markdown(document_url)
+            )
+            
+            if result and result.markdown_content and not result.markdown_content.startswith("Hata:"):
+                logger.info(f"Uyuşmazlık Mahkemesi markdown içeriği başarıyla alındı: {len(result.markdown_content)} karakter")
+                return {
+                    'success': True,
+                    'content': result.markdown_content,
+                    'content_type': 'text',
+                    'source_url': str(result.source_url) if result.source_url else '',
+                    'court_type': 'uyusmazlik',
+                    'extraction_method': 'MCP Client API'
+                }
+            else:
+                logger.warning("Uyuşmazlık Mahkemesi markdown içeriği boş veya hatalı")
+                # Fallback olarak web scraping dene
+                return yargi_integration.run_async(
+                    yargi_integration._get_uyusmazlik_document_content(document_id)
+                )
                 
-                # Yeni get_decision_document_as_markdown metodunu kullan
-                result = loop.run_until_complete(
-                    client.get_decision_document_as_markdown(document_url)
+        elif court_type == "kik":
+            # KİK için kalıcı client'ı kullan
+            client = yargi_integration.kik_client
+            # MCP Client'ın get_decision_document_as_markdown metodunu kullan
+            if hasattr(client, 'get_decision_document_as_markdown'):
+                result = yargi_integration.run_async(
+                    client.get_decision_document_as_markdown(document_id)
                 )
                 
-                if result and result.markdown_content and not result.markdown_content.startswith("Hata:"):
-                    logger.info(f"Uyuşmazlık Mahkemesi markdown içeriği başarıyla alındı: {len(result.markdown_content)} karakter")
+                if result and result.markdown_chunk:
+                    logger.info(f"KİK markdown içeriği başarıyla alındı: {len(result.markdown_chunk)} karakter")
                     return {
                         'success': True,
-                        'content': result.markdown_content,
+                        'content': result.markdown_chunk,
                         'content_type': 'text',
                         'source_url': str(result.source_url) if result.source_url else '',
-                        'court_type': 'uyusmazlik',
+                        'court_type': 'kik',
                         'extraction_method': 'MCP Client API'
                     }
                 else:
-                    logger.warning("Uyuşmazlık Mahkemesi markdown içeriği boş veya hatalı")
-                    # Fallback olarak web scraping dene
-                    return loop.run_until_complete(
-                        yargi_integration._get_uyusmazlik_document_content(document_id)
-                    )
-                
-            finally:
-                # Client'ı kapat
-                try:
-                    loop.run_until_complete(client.close_client_session())
-                except:
-                    pass
-                
-        elif court_type == "kik":
-            # KİK için unified modülden client oluştur
-            client = KikApiClient()
+                    logger.warning("KİK markdown içeriği boş")
+            else:
+                logger.warning("KİK MCP Client'ında get_decision_document_as_markdown metodu bulunamadı")
             
-            try:
-                # MCP Client'ın get_decision_document_as_markdown metodunu kullan
-                if hasattr(client, 'get_decision_document_as_markdown'):
-                    result = loop.run_until_complete(
-                        client.get_decision_document_as_markdown(document_id)
-                    )
-                    
-                    if result and result.markdown_chunk:
-                        logger.info(f"KİK markdown içeriği başarıyla alındı: {len(result.markdown_chunk)} karakter")
-                        return {
-                            'success': True,
-                            'content': result.markdown_chunk,
-                            'content_type': 'text',
-                            'source_url': str(result.source_url) if result.source_url else '',
-                            'court_type': 'kik',
-                            'extraction_method': 'MCP Client API'
-                        }
-                    else:
-                        logger.warning("KİK markdown içeriği boş")
-                else:
-                    logger.warning("KİK MCP Client'ında get_decision_document_as_markdown metodu bulunamadı")
+            # Fallback olarak web scraping dene
+            return yargi_integration.run_async(
+                yargi_integration._get_kik_document_content(document_id)
+            )
                 
-                # Fallback olarak web scraping dene
-                return loop.run_until_complete(
-                    yargi_integration._get_kik_document_content(document_id)
+        elif court_type == "rekabet":
+            # Rekabet Kurumu için kalıcı client'ı kullan
+            client = yargi_integration.rekabet_client
+            # MCP Client'ın get_decision_document_as_markdown metodunu kullan
+            if hasattr(client, 'get_decision_document_as_markdown'):
+                result = yargi_integration.run_async(
+                    client.get_decision_document_as_markdown(document_id)
                 )
-            finally:
-                # Client'ı kapat
-                try:
-                    loop.run_until_complete(client.close_client_session())
-                except:
-                    pass
                 
-        elif court_type == "rekabet":
-            # Rekabet Kurumu için unified modülden client oluştur
-            client = RekabetKurumuApiClient()
-            
-            try:
-                # MCP Client'ın get_decision_document_as_markdown metodunu kullan
-                if hasattr(client, 'get_decision_document_as_markdown'):
-                    result = loop.run_until_complete(
-                        client.get_decision_document_as_markdown(document_id)
-                    )
-                    
-                    if result and isinstance(result, str):
-                        logger.info(f"Rekabet Kurumu markdown içeriği başarıyla alındı: {len(result)} karakter")
-                        return {
-                            'success': True,
-                            'content': result,
-                            'content_type': 'text',
-                            'source_url': f"https://www.rekabet.gov.tr/Karar?kararId={document_id}",
-                            'court_type': 'rekabet',
-                            'extraction_method': 'MCP Client API'
-                        }
-                    else:
-                        logger.warning("Rekabet Kurumu markdown içeriği boş")
+                if result and isinstance(result, str):
+                    logger.info(f"Rekabet Kurumu markdown içeriği başarıyla alındı: {len(result)} karakter")
+                    return {
+                        'success': True,
+                        'content': result,
+                        'content_type': 'text',
+                        'source_url': f"https://www.rekabet.gov.tr/Karar?kararId={document_id}",
+                        'court_type': 'rekabet',
+                        'extraction_method': 'MCP Client API'
+                    }
                 else:
-                    logger.warning("Rekabet MCP Client'ında get_decision_document_as_markdown metodu bulunamadı")
+                    logger.warning("Rekabet Kurumu markdown içeriği boş")
+            else:
+                logger.warning("Rekabet MCP Client'ında get_decision_document_as_markdown metodu bulunamadı")
+            
+            # Fallback olarak web scraping dene
+            return yargi_integration.run_async(
+                yargi_integration._get_rekabet_document_content(document_url or document_id)
+            )
                 
-                # Fallback olarak web scraping dene
-                return loop.run_until_complete(
-                    yargi_integration._get_rekabet_document_content(document_url or document_id)
-                )
-            finally:
-                # Client'ı kapat
-                try:
-                    loop.run_until_complete(client.close_client_session())
-                except:
-                    pass
         else:
             return {
                 'success': False,
@@ -3555,33 +3995,32 @@ def get_document_content(court_type: str, document_id: str, document_url: str =
         
         # Hata durumunda fallback olarak web scraping dene
         try:
-            loop = asyncio.get_event_loop()
             if court_type == "yargitay":
-                return loop.run_until_complete(
+                return yargi_integration.run_async(
                     yargi_integration._get_yargitay_document_content(document_id)
                 )
             elif court_type == "danistay":
-                return loop.run_until_complete(
+                return yargi_integration.run_async(
                     yargi_integration._get_danistay_document_content(document_id)
                 )
             elif court_type == "emsal":
-                return loop.run_until_complete(
+                return yargi_integration.run_async(
                     yargi_integration._get_emsal_document_content(document_id)
                 )
             elif court_type == "anayasa":
-                return loop.run_until_complete(
+                return yargi_integration.run_async(
                     yargi_integration._get_anayasa_document_content(document_id)
                 )
             elif court_type == "uyusmazlik":
-                return loop.run_until_complete(
+                return yargi_integration.run_async(
                     yargi_integration._get_uyusmazlik_document_content(document_id)
                 )
             elif court_type == "kik":
-                return loop.run_until_complete(
+                return yargi_integration.run_async(
                     yargi_integration._get_kik_document_content(document_id)
                 )
             elif court_type == "rekabet":
-                return loop.run_until_complete(
+                return yargi_integration.run_async(
                     yargi_integration._get_rekabet_document_content(document_url or document_id)
                 )
             else:
@@ -3628,6 +4067,12 @@ def get_document_content(court_type: str, document_id: str, document_url: str =
 # Uygulama kapatılırken HTTP session'ı kapatmak için
 import atexit
 def cleanup_resources():
+    try:
+        # Kalıcı client'ları kendi loop'larında kapat, ardından loop thread'ini durdur
+        yargi_integration.run_async(yargi_integration.close_all_clients(), timeout=10)
+        yargi_integration.loop_runner.stop()
+    except:
+        pass
     try:
         if hasattr(http_manager.session, 'close'):
             http_manager.session.close()
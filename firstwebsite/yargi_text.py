@@ -0,0 +1,128 @@
+"""
+Karar metni temizleyici
+Mahkeme sitelerinden gelen karar HTML/metinlerini görüntüleme için temizler.
+Tüm desenler modül yüklenirken bir kez derlenir; metin üzerinde mümkün olan en
+az sayıda geçiş yapılır (satır listeleri ve ara kopyalar oluşturulmaz).
+
+Çıktı, yargi_integration içindeki eski _clean_decision_text /
+_clean_decision_text_light uygulamalarıyla birebir aynıdır:
+
+    - Boşluk daraltma satır sonlarını da tek boşluğa çevirdiği için eski
+      "satır satır" filtreleme aslında metnin tamamına tek satır olarak
+      uygulanıyordu; burada bu durum doğrudan tek bir kontrol olarak yapılır.
+    - Ayrı ayrı uygulanan atlama desenleri tek bir derlenmiş alternasyonda
+      birleştirilmiştir.
+    - Boşluk daraltma + kırpma str.split()/join ile yapılır (re'deki \s ile
+      aynı karakter kümesi, regex'ten birkaç kat hızlı).
+
+Karşılaştırma için: python benchmarks/bench_text_cleaner.py
+"""
+
+import re
+import html
+
+_TAG_RE = re.compile(r'<[^>]+>')
+
+# Tam temizlik: metnin başına veya tamamına uygulanan atlama desenleri
+_FULL_SKIP_RE = re.compile(
+    r'(?:ana sayfa|menü|giriş|çıkış|login|logout'
+    r'|copyright|©|tüm hakları'
+    r'|javascript|cookie|çerez'
+    r'|http|www\.|ftp)'
+    r'|(?:sayfa|page)\s*\d'
+    r'|\s*[\d\.\-\s]+$'      # Sadece sayı ve nokta içeren metin
+    r'|.{1,10}$',            # Çok kısa metin (10 karakter altı)
+    re.IGNORECASE
+)
+# Tam temizlik: metnin herhangi bir yerinde geçen site/navigasyon ifadeleri
+_FULL_SITE_RE = re.compile(
+    r'menü|navigation|footer|header|bilgi bankası|uyap|yargıtay|danıştay',
+    re.IGNORECASE
+)
+
+# Hafif temizlik: yalnızca gerçekten gereksiz içerik
+_LIGHT_SKIP_RE = re.compile(
+    r'(?:javascript|cookie|çerez|http|www\.|ftp)'
+    r'|\s*[\d\.\-\s]{1,5}$'  # Sadece çok kısa sayı dizileri
+    r'|.{1,3}$',             # Çok kısa metin (3 karakter altı)
+    re.IGNORECASE
+)
+
+POSITIVE_INDICATORS = (
+    'karar', 'hüküm', 'gerekçe', 'mahkeme', 'dava', 'esas', 'sonuç',
+    'davacı', 'davalı', 'başvuran', 'müdahil', 'temyiz', 'istinaf',
+    'dosya', 'duruşma', 'delil', 'tanık', 'bilirkişi', 'keşif',
+    'hukuki', 'kanun', 'madde', 'fıkra', 'bent', 'yönetmelik',
+    'tebliğ', 'icra', 'infaz', 'takip', 'haciz', 'satış'
+)
+
+NAVIGATION_WORDS = ('menü', 'sayfa', 'giriş', 'çıkış', 'ana sayfa', 'javascript', 'cookie')
+
+
+def _normalize_markup(text: str) -> str:
+    """Entity çözme, etiket silme, boşluk daraltma (satır sonları dahil) ve kırpma"""
+    text = html.unescape(text)
+    text = _TAG_RE.sub('', text)
+    return ' '.join(text.split())
+
+
+def _normalize_punctuation(text: str) -> str:
+    """Tırnak ve tire işaretlerini normalize eder (eski r'[""''‚„]' ve r'[–—]' desenleri)"""
+    return text.replace('‚', '"').replace('„', '"').replace('–', '-').replace('—', '-')
+
+
+def clean_decision_text(text: str) -> str:
+    """Karar metnini temizle ve düzenle (navigasyon/site içeriğini eler, tekrarlayan cümleleri atar)"""
+    if not text:
+        return ""
+
+    line = _normalize_markup(text)
+    if not line or _FULL_SKIP_RE.match(line) or _FULL_SITE_RE.search(line):
+        return ""
+    if len(line) <= 15:
+        lowered = line.lower()
+        if not any(indicator in lowered for indicator in POSITIVE_INDICATORS):
+            return ""
+
+    # Tekrarlayan cümleleri temizle (metin zaten tek boşluklu olduğundan lower() yeterli)
+    unique_sentences = []
+    seen_sentences = set()
+    for sentence in line.split('.'):
+        sentence = sentence.strip()
+        if len(sentence) > 20:
+            normalized = sentence.lower()
+            if normalized not in seen_sentences:
+                seen_sentences.add(normalized)
+                unique_sentences.append(sentence)
+
+    text = _normalize_punctuation('. '.join(unique_sentences))
+
+    # Eğer metin çok kısaysa ve sadece navigasyon içeriyorsa boş döndür
+    if len(text) < 100:
+        lowered = text.lower()
+        if any(word in lowered for word in NAVIGATION_WORDS):
+            return ""
+
+    return text
+
+
+def clean_decision_text_light(text: str) -> str:
+    """Karar metnini hafif temizle - daha az agresif filtreleme"""
+    if not text:
+        return ""
+
+    original_length = len(text)
+    text = _normalize_markup(text)
+
+    # Eğer metin çok uzun ise (5000+ karakter) filtreleme yap, yoksa minimal işlem
+    if original_length > 5000 and text and _LIGHT_SKIP_RE.match(text):
+        text = ""
+
+    text = _normalize_punctuation(text)
+
+    # Eğer temizleme sonucu metin çok kısaldıysa ve orijinal uzunsa, daha az agresif temizle
+    if len(text) < 100 and original_length > 1000:
+        text = html.unescape(text) if text else ""
+        text = ' '.join(_TAG_RE.sub('', text).split())
+
+    return text
@@ -0,0 +1,66 @@
+"""Sık filtrelenen kolonlar için indeksler
+
+Sorgu eşleşmeleri:
+    anasayfa             calendar_event (is_completed, date) + activity_log (timestamp, id)
+    send_event_reminders calendar_event (is_completed, date, assigned_to)
+    takvim API           calendar_event (date)
+    duruşma sayacı       calendar_event (event_type, date)
+    dosya_sorgula        case_file (file_type, courthouse, department), (year, case_number), (status)
+    export_payments      client (payment_client_id), (registration_date)
+    dosya detayı / ekler document (case_id), (parent_document_id)
+
+Mevcut veritabanlarında indekslerin bir kısmı db.create_all() ile oluşmuş
+olabileceğinden tümü "yoksa oluştur" şeklinde eklenir. Planları karşılaştırmak
+için: python firstwebsite/benchmarks/explain_indexes.py
+
+Revision ID: 3f9c2a7d1b04
+Revises:
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3f9c2a7d1b04'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+INDEXES = [
+    ('ix_calendar_event_pending', 'calendar_event', ['is_completed', 'date', 'assigned_to']),
+    ('ix_calendar_event_type_date', 'calendar_event', ['event_type', 'date']),
+    ('ix_activity_log_timestamp_id', 'activity_log', ['timestamp', 'id']),
+    ('ix_case_file_type_courthouse_department', 'case_file', ['file_type', 'courthouse', 'department']),
+    ('ix_case_file_year_case_number', 'case_file', ['year', 'case_number']),
+    ('ix_case_file_status', 'case_file', ['status']),
+    ('ix_client_payment_client_id', 'client', ['payment_client_id']),
+    ('ix_client_registration_date', 'client', ['registration_date']),
+    ('ix_document_case_id', 'document', ['case_id']),
+    ('ix_document_parent_document_id', 'document', ['parent_document_id']),
+]
+
+# Takvim akışıyla birlikte modele eklendi (calendar_feed.py); eski veritabanlarında eksik olabilir
+CALENDAR_DATE_INDEX = ('ix_calendar_event_date', 'calendar_event', ['date'])
+
+
+def _has_index(name, table):
+    inspector = sa.inspect(op.get_bind())
+    if not inspector.has_table(table):
+        return False
+    return any(index['name'] == name for index in inspector.get_indexes(table))
+
+
+def upgrade():
+    for name, table, columns in [CALENDAR_DATE_INDEX] + INDEXES:
+        if not _has_index(name, table):
+            op.create_index(name, table, columns, unique=False)
+
+
+def downgrade():
+    # ix_calendar_event_date bu revizyondan önce de modelde vardı, bırakılır
+    for name, table, _ in reversed(INDEXES):
+        if _has_index(name, table):
+            op.drop_index(name, table_name=table)
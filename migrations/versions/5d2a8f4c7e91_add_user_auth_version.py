@@ -0,0 +1,36 @@
+"""Oturum kullanıcısı önbelleği için user.auth_version
+
+User satırı her değiştiğinde artan sürüm damgası; diğer worker'lardaki oturum
+önbelleği bununla doğrulanır (bkz. firstwebsite/user_cache.py). Kolon
+db.create_all() ile oluşmuş veritabanlarında zaten bulunabilir.
+
+Revision ID: 5d2a8f4c7e91
+Revises: 3f9c2a7d1b04
+Create Date: 2026-10-18 13:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5d2a8f4c7e91'
+down_revision = '3f9c2a7d1b04'
+branch_labels = None
+depends_on = None
+
+
+def _has_column():
+    columns = sa.inspect(op.get_bind()).get_columns('user')
+    return any(column['name'] == 'auth_version' for column in columns)
+
+
+def upgrade():
+    if not _has_column():
+        op.add_column('user', sa.Column('auth_version', sa.Integer(), nullable=False, server_default='0'))
+
+
+def downgrade():
+    if _has_column():
+        with op.batch_alter_table('user') as batch_op:
+            batch_op.drop_column('auth_version')
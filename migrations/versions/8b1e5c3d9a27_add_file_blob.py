@@ -0,0 +1,56 @@
+"""İçerik adresli dosya deposu için file_blob tablosu
+
+Aynı içerikli yüklemeler '<kök>/blobs/...' altında tek kopya olarak saklanır;
+file_blob her blobun özetini, boyutunu ve kendisini gösteren belge kaydı
+sayısını tutar (bkz. firstwebsite/blob_store.py). Mevcut belgeler eski
+konumlarında kalır.
+
+Revision ID: 8b1e5c3d9a27
+Revises: 5d2a8f4c7e91
+Create Date: 2026-10-18 15:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '8b1e5c3d9a27'
+down_revision = '5d2a8f4c7e91'
+branch_labels = None
+depends_on = None
+
+
+def _has_table():
+    return sa.inspect(op.get_bind()).has_table('file_blob')
+
+
+def _has_index(name):
+    inspector = sa.inspect(op.get_bind())
+    if not inspector.has_table('file_blob'):
+        return False
+    return any(index['name'] == name for index in inspector.get_indexes('file_blob'))
+
+
+def upgrade():
+    if not _has_table():
+        op.create_table(
+            'file_blob',
+            sa.Column('id', sa.Integer(), nullable=False),
+            sa.Column('path', sa.String(length=500), nullable=False),
+            sa.Column('sha256', sa.String(length=64), nullable=False),
+            sa.Column('size', sa.BigInteger(), nullable=False),
+            sa.Column('ref_count', sa.Integer(), nullable=False),
+            sa.Column('created_at', sa.DateTime(), nullable=True),
+            sa.PrimaryKeyConstraint('id'),
+            sa.UniqueConstraint('path'),
+        )
+    if not _has_index('ix_file_blob_sha256'):
+        op.create_index('ix_file_blob_sha256', 'file_blob', ['sha256'], unique=False)
+
+
+def downgrade():
+    if _has_index('ix_file_blob_sha256'):
+        op.drop_index('ix_file_blob_sha256', table_name='file_blob')
+    if _has_table():
+        op.drop_table('file_blob')
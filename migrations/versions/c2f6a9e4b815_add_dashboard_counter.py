@@ -0,0 +1,40 @@
+"""Panel sayaçları için dashboard_counter tablosu
+
+Anasayfa ve veritabanı yönetimi sayfalarındaki kayıt sayıları bu tablodan
+okunur (bkz. firstwebsite/dashboard_counters.py). Satırlar burada
+doldurulmaz: ilk okumada eksik sayaçlar COUNT(*) ile hesaplanıp eklenir.
+
+Revision ID: c2f6a9e4b815
+Revises: 8b1e5c3d9a27
+Create Date: 2026-10-18 16:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c2f6a9e4b815'
+down_revision = '8b1e5c3d9a27'
+branch_labels = None
+depends_on = None
+
+
+def _has_table():
+    return sa.inspect(op.get_bind()).has_table('dashboard_counter')
+
+
+def upgrade():
+    if not _has_table():
+        op.create_table(
+            'dashboard_counter',
+            sa.Column('name', sa.String(length=64), nullable=False),
+            sa.Column('value', sa.Integer(), nullable=False),
+            sa.Column('updated_at', sa.DateTime(), nullable=True),
+            sa.PrimaryKeyConstraint('name'),
+        )
+
+
+def downgrade():
+    if _has_table():
+        op.drop_table('dashboard_counter')
@@ -0,0 +1,52 @@
+"""Takvim API'sinin 'changed since' sorguları için calendar_event_change tablosu
+
+CalendarEvent değişiklikleri bu günlüğe yazılır; en büyük satır numarası
+takvimin sürümüdür (bkz. firstwebsite/calendar_feed.py). changed_at indeksi
+eski satırları silen temizleme işi içindir.
+
+Revision ID: e7b3d1a5c942
+Revises: c2f6a9e4b815
+Create Date: 2026-10-18 16:30:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e7b3d1a5c942'
+down_revision = 'c2f6a9e4b815'
+branch_labels = None
+depends_on = None
+
+
+def _has_table():
+    return sa.inspect(op.get_bind()).has_table('calendar_event_change')
+
+
+def _has_index(name):
+    inspector = sa.inspect(op.get_bind())
+    if not inspector.has_table('calendar_event_change'):
+        return False
+    return any(index['name'] == name for index in inspector.get_indexes('calendar_event_change'))
+
+
+def upgrade():
+    if not _has_table():
+        op.create_table(
+            'calendar_event_change',
+            sa.Column('id', sa.Integer(), nullable=False),
+            sa.Column('event_id', sa.Integer(), nullable=True),
+            sa.Column('deleted', sa.Boolean(), nullable=False),
+            sa.Column('changed_at', sa.DateTime(), nullable=True),
+            sa.PrimaryKeyConstraint('id'),
+        )
+    if not _has_index('ix_calendar_event_change_changed_at'):
+        op.create_index('ix_calendar_event_change_changed_at', 'calendar_event_change', ['changed_at'], unique=False)
+
+
+def downgrade():
+    if _has_index('ix_calendar_event_change_changed_at'):
+        op.drop_index('ix_calendar_event_change_changed_at', table_name='calendar_event_change')
+    if _has_table():
+        op.drop_table('calendar_event_change')